@@ -0,0 +1,78 @@
+"""Times ISO-8601 datetime parsing and formatting of the serializer against the isodate path it replaced.
+
+Run from the repository root::
+
+    poetry run python benchmarks/datetime_parsing.py
+"""
+import argparse
+import datetime
+import timeit
+
+import isodate  # type: ignore
+
+from getcontext.generated._serialization import (
+    Deserializer,
+    _format_iso_datetime,
+    _parse_iso_datetime,
+    _parse_iso_datetime_cached,
+)
+
+
+def isodate_parse(attr):
+    """Deserializer.deserialize_iso() before it used fromisoformat()."""
+    attr = attr.upper()
+    if not Deserializer.valid_date.match(attr):
+        raise ValueError("Invalid datetime string: " + attr)
+    check_decimal = attr.split(".")
+    if len(check_decimal) > 1:
+        decimal_str = ""
+        for digit in check_decimal[1]:
+            if not digit.isdigit():
+                break
+            decimal_str += digit
+        if len(decimal_str) > 6:
+            attr = attr.replace(decimal_str, decimal_str[0:6])
+    return isodate.parse_datetime(attr)
+
+
+def timestamps(count, distinct):
+    """Event timestamps as a page of conversations has them: a few distinct values, each repeated."""
+    start = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    values = [start + datetime.timedelta(seconds=i, milliseconds=i * 7) for i in range(distinct)]
+    return [values[i % distinct] for i in range(count)]
+
+
+def run(label, fn, values, repeat, before=None):
+    def batch():
+        if before is not None:
+            before()
+        for value in values:
+            fn(value)
+
+    best = min(timeit.repeat(batch, number=1, repeat=repeat))
+    print("{:<28} {:8.3f} ms".format(label, best * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=600, help="Timestamps per batch.")
+    parser.add_argument("--distinct", type=int, default=100, help="Distinct timestamps per batch.")
+    parser.add_argument("--repeat", type=int, default=50, help="Batches timed; the fastest is reported.")
+    args = parser.parse_args()
+
+    values = timestamps(args.count, args.distinct)
+    strings = [_format_iso_datetime.__wrapped__(value) for value in values]
+    for string in strings:
+        if isodate_parse(string) != _parse_iso_datetime(string):
+            raise AssertionError("Parsers disagree on " + string)
+
+    print("{} timestamps, {} distinct".format(args.count, args.distinct))
+    run("parse, isodate", isodate_parse, strings, args.repeat)
+    run("parse, fromisoformat", _parse_iso_datetime, strings, args.repeat)
+    run("parse, memoized", _parse_iso_datetime_cached, strings, args.repeat, _parse_iso_datetime_cached.cache_clear)
+    run("format, uncached", _format_iso_datetime.__wrapped__, values, args.repeat)
+    run("format, memoized", _format_iso_datetime, values, args.repeat, _format_iso_datetime.cache_clear)
+
+
+if __name__ == "__main__":
+    main()
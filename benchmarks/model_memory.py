@@ -0,0 +1,94 @@
+"""Measures the memory held by deserialized conversation pages with and without compact models.
+
+Run from the repository root::
+
+    poetry run python benchmarks/model_memory.py
+"""
+import argparse
+import gc
+import tracemalloc
+
+from getcontext.generated import models
+from getcontext.generated._serialization import Deserializer
+from getcontext.generated.models import COMPACT_MODELS
+
+CLIENT_MODELS = {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+
+
+def message(index):
+    return {
+        "type": "message",
+        "event_timestamp": "2024-01-02T03:04:{:02}.000Z".format(index % 60),
+        "role": "user" if index % 2 else "assistant",
+        "message": "Message number {}".format(index),
+        "rating": 0,
+        "language": "en",
+        "translation": "",
+        "sentiment": 0.5,
+        "topics": [{"id": "topic-1", "name": "greeting"}],
+        "suggested_topics": [],
+        "metadata": {},
+    }
+
+
+def page(conversations, messages):
+    return {
+        "conversations": [
+            {
+                "id": "conversation-{}".format(i),
+                "metadata": {},
+                "sentiment_trend": "neutral",
+                "topics": [{"id": "topic-1", "name": "greeting"}],
+                "suggested_topics": [],
+                "messages": [message(j) for j in range(messages)],
+            }
+            for i in range(conversations)
+        ],
+        "pagination": {
+            "total_records": conversations,
+            "per_page": conversations,
+            "current_page": 1,
+            "previous_page": 1,
+            "next_page": 1,
+            "page_count": 1,
+        },
+    }
+
+
+def measure(data, compact):
+    """Bytes still allocated after deserializing data, and the number of message models."""
+    deserializer = Deserializer(CLIENT_MODELS)
+    if compact:
+        deserializer.dependencies.update(COMPACT_MODELS)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = deserializer("PathsY5Azv9ApiV1ConversationsGetResponses200ContentApplicationJsonSchema", data)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held, sum(len(conversation.messages) for conversation in result.conversations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversations", type=int, default=100, help="Conversations per page.")
+    parser.add_argument("--messages", type=int, default=50, help="Messages per conversation.")
+    args = parser.parse_args()
+
+    data = page(args.conversations, args.messages)
+    # Warm up the compiled decoders and datetime memo, so they are not counted.
+    measure(data, compact=False)
+    measure(data, compact=True)
+
+    results = {}
+    for compact in (False, True):
+        held, count = measure(data, compact)
+        results[compact] = held
+        label = "compact models" if compact else "generated models"
+        print("{:<18} {:10.1f} KiB {:8.0f} bytes per message".format(label, held / 1024, held / count))
+    print("saved              {:9.1f} %".format(100 * (1 - results[True] / results[False])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+import asyncio
+import collections
+import logging
+import threading
+import time
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from .generated.models import Conversation
+    from .generated.operations import LogOperations
+    from .generated.aio.operations import LogOperations as AsyncLogOperations
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Entry(NamedTuple):
+    operation: str
+    body: Any
+    kwargs: Dict[str, Any]
+    enqueued_at: float
+
+
+class BackgroundLogger:
+    """Sends log calls from a worker thread so callers never wait on the network.
+
+    Calls are held in a bounded in-memory queue and sent through the client's
+    ``log`` operations. The queue is flushed once it holds ``batch_size`` entries,
+    once the oldest entry is ``flush_interval`` seconds old, or when :meth:`flush`
+    is called. :meth:`close` drains the queue and stops the worker.
+
+    :param log_operations: The operations group used to send, usually ``client.log``.
+    :type log_operations: ~getcontext.generated.operations.LogOperations
+    :keyword int max_queue_size: Entries held before new ones are dropped. Default value is 1000.
+    :keyword int batch_size: Queue length that triggers a flush. Default value is 50.
+    :keyword float flush_interval: Age in seconds of the oldest entry that triggers a flush.
+     Default value is 5.0.
+    """
+
+    def __init__(
+        self,
+        log_operations: "LogOperations",
+        *,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("Parameter 'max_queue_size' must be at least 1.")
+        if batch_size < 1:
+            raise ValueError("Parameter 'batch_size' must be at least 1.")
+        self._log = log_operations
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: Deque[_Entry] = collections.deque()
+        self._cond = threading.Condition()
+        self._flush_requested = False
+        self._closed = False
+        self._enqueued = 0
+        self._completed = 0
+
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+        self._worker = threading.Thread(target=self._run, name="getcontext-background-logger", daemon=True)
+        self._worker.start()
+
+    def conversation(self, conversation: "Conversation", *, tenant_id: Optional[str] = None) -> bool:
+        """Queues a conversation for ``log.conversation``.
+
+        :param conversation: The conversation to log.
+        :type conversation: ~getcontext.generated.models.Conversation
+        :keyword tenant_id: Default value is None.
+        :paramtype tenant_id: str
+        :return: False if the queue was full and the conversation was dropped.
+        :rtype: bool
+        """
+        return self.submit("conversation", {"conversation": conversation}, tenant_id=tenant_id)
+
+    def submit(self, operation: str, body: Any, **kwargs: Any) -> bool:
+        """Queues a call to one of the ``log`` operations.
+
+        :param str operation: Name of the ``LogOperations`` method, e.g. ``"conversation_upsert"``.
+        :param body: The request body, as accepted by that method.
+        :return: False if the queue was full and the call was dropped.
+        :rtype: bool
+        """
+        if not hasattr(self._log, operation):
+            raise ValueError("Unknown log operation '{}'.".format(operation))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed BackgroundLogger.")
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped += 1
+                _LOGGER.warning("Background log queue is full, dropping %s call.", operation)
+                return False
+            self._queue.append(_Entry(operation, body, kwargs, time.monotonic()))
+            self._enqueued += 1
+            if len(self._queue) >= self.batch_size or len(self._queue) == 1:
+                self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Sends everything queued so far and waits for it to complete.
+
+        :param float timeout: Seconds to wait. Waits indefinitely by default.
+        :return: False if the timeout expired first.
+        :rtype: bool
+        """
+        with self._cond:
+            target = self._enqueued
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._completed >= target, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Drains the queue and stops the worker thread.
+
+        :param float timeout: Seconds to wait for the drain. Waits indefinitely by default.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            _LOGGER.warning("Background logger did not drain within %s seconds.", timeout)
+
+    def __enter__(self) -> "BackgroundLogger":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+    def _should_flush(self) -> bool:
+        if self._closed or self._flush_requested or len(self._queue) >= self.batch_size:
+            return True
+        return bool(self._queue) and time.monotonic() - self._queue[0].enqueued_at >= self.flush_interval
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._should_flush():
+                    timeout = None
+                    if self._queue:
+                        timeout = self._queue[0].enqueued_at + self.flush_interval - time.monotonic()
+                    self._cond.wait(timeout)
+                if not self._queue:
+                    self._flush_requested = False
+                    if self._closed:
+                        return
+                    continue
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+
+            for entry in batch:
+                self._send(entry)
+
+            with self._cond:
+                self._completed += len(batch)
+                if not self._queue:
+                    self._flush_requested = False
+                self._cond.notify_all()
+
+    def _send(self, entry: _Entry) -> None:
+        try:
+            getattr(self._log, entry.operation)(entry.body, **entry.kwargs)
+        except Exception:  # pylint: disable=broad-except
+            self.failed += 1
+            _LOGGER.warning("Background %s call failed.", entry.operation, exc_info=True)
+        else:
+            self.sent += 1
+
+
+class AsyncBackgroundLogger:
+    """Sends log calls from a pool of sender coroutines on the client's event loop.
+
+    Calls are held in a bounded :class:`asyncio.Queue` and sent concurrently by
+    ``concurrency`` sender tasks sharing the client's pipeline. When the queue is
+    full, :meth:`submit` waits for room instead of growing memory. :meth:`aclose`
+    drains the queue, giving up after an optional deadline.
+
+    :param log_operations: The operations group used to send, usually ``client.log``.
+    :type log_operations: ~getcontext.generated.aio.operations.LogOperations
+    :keyword int max_queue_size: Entries held before :meth:`submit` waits. Default value is 1000.
+    :keyword int concurrency: Number of sender tasks. Default value is 8.
+    """
+
+    def __init__(
+        self, log_operations: "AsyncLogOperations", *, max_queue_size: int = 1000, concurrency: int = 8
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("Parameter 'max_queue_size' must be at least 1.")
+        if concurrency < 1:
+            raise ValueError("Parameter 'concurrency' must be at least 1.")
+        self._log = log_operations
+        self.max_queue_size = max_queue_size
+        self.concurrency = concurrency
+
+        self._queue: "asyncio.Queue[_Entry]" = asyncio.Queue(max_queue_size)
+        self._senders: List["asyncio.Task[None]"] = []
+        self._closed = False
+
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+    async def conversation(self, conversation: "Conversation", *, tenant_id: Optional[str] = None) -> None:
+        """Queues a conversation for ``log.conversation``, waiting while the queue is full.
+
+        :param conversation: The conversation to log.
+        :type conversation: ~getcontext.generated.models.Conversation
+        :keyword tenant_id: Default value is None.
+        :paramtype tenant_id: str
+        """
+        await self.submit("conversation", {"conversation": conversation}, tenant_id=tenant_id)
+
+    async def submit(self, operation: str, body: Any, **kwargs: Any) -> None:
+        """Queues a call to one of the ``log`` operations, waiting while the queue is full.
+
+        :param str operation: Name of the ``LogOperations`` method, e.g. ``"conversation_upsert"``.
+        :param body: The request body, as accepted by that method.
+        """
+        if not hasattr(self._log, operation):
+            raise ValueError("Unknown log operation '{}'.".format(operation))
+        if self._closed:
+            raise RuntimeError("Cannot submit to a closed AsyncBackgroundLogger.")
+        self._start()
+        await self._queue.put(_Entry(operation, body, kwargs, time.monotonic()))
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until everything queued so far has been sent.
+
+        :param float timeout: Seconds to wait. Waits indefinitely by default.
+        :return: False if the timeout expired first.
+        :rtype: bool
+        """
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        """Drains the queue and stops the sender tasks.
+
+        :param float timeout: Seconds to wait for the drain. Entries still queued when it
+         expires are dropped. Waits indefinitely by default.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not await self.flush(timeout):
+            self.dropped += self._queue.qsize()
+            _LOGGER.warning(
+                "Dropping %s queued log calls that were not sent within %s seconds.", self._queue.qsize(), timeout
+            )
+        for sender in self._senders:
+            sender.cancel()
+        await asyncio.gather(*self._senders, return_exceptions=True)
+        self._senders = []
+
+    async def __aenter__(self) -> "AsyncBackgroundLogger":
+        return self
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self.aclose()
+
+    def _start(self) -> None:
+        if self._senders:
+            return
+        self._senders = [asyncio.ensure_future(self._run()) for _ in range(self.concurrency)]
+
+    async def _run(self) -> None:
+        while True:
+            entry = await self._queue.get()
+            try:
+                await getattr(self._log, entry.operation)(entry.body, **entry.kwargs)
+            except Exception:  # pylint: disable=broad-except
+                self.failed += 1
+                _LOGGER.warning("Background %s call failed.", entry.operation, exc_info=True)
+            else:
+                self.sent += 1
+            finally:
+                self._queue.task_done()
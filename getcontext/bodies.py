@@ -0,0 +1,157 @@
+import copy
+import io
+import mmap
+import os
+import re
+from typing import Any, Iterator, Optional, TYPE_CHECKING, Union
+
+from azure.core.utils import case_insensitive_dict
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from azure.core.rest import HttpRequest
+
+_LINE_END = re.compile(rb"\n")
+_BLANK = re.compile(rb"[ \t\r]*\Z")
+
+
+class RawBody(io.IOBase):
+    """A pre-encoded JSON request body for the ``log`` operations, sent without being copied.
+
+    Wraps any object supporting the buffer protocol, such as ``bytes``, ``bytearray``,
+    ``memoryview`` or ``mmap``, and hands slices of it to the transport. The content must
+    be the complete JSON body of the operation, e.g. ``{"conversation": {...}}`` for
+    ``log.conversation``. It is neither validated nor sampled, and the buffer must not be
+    modified until the call returns.
+
+    :param content: The encoded body.
+    :type content: bytes or bytearray or memoryview or mmap.mmap
+    """
+
+    def __init__(self, content: Any) -> None:
+        super().__init__()
+        view = memoryview(content)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        self._view = view
+        self._position = 0
+        self._owner: Optional[Any] = None
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, "os.PathLike[str]"], offset: int = 0, length: Optional[int] = None
+    ) -> "RawBody":
+        """Maps a region of a file, so that it is sent without being read into memory first.
+
+        :param str path: The file.
+        :param int offset: Start of the body in the file. Default value is 0.
+        :param int length: Size of the body. Default value is None, the rest of the file.
+        :rtype: ~getcontext.bodies.RawBody
+        """
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        end = len(mapped) if length is None else offset + length
+        if offset < 0 or end > len(mapped) or end < offset:
+            mapped.close()
+            raise ValueError("The region {}:{} is outside of '{}'.".format(offset, end, path))
+        body = cls(memoryview(mapped)[offset:end])
+        body._owner = mapped  # pylint: disable=protected-access
+        return body
+
+    def __len__(self) -> int:
+        return self._view.nbytes
+
+    def getbuffer(self) -> memoryview:
+        """The whole body, as a read-only view of the wrapped buffer.
+
+        :rtype: memoryview
+        """
+        return self._view.toreadonly()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> memoryview:  # type: ignore[override]
+        """Returns the next ``size`` bytes as a view of the wrapped buffer, without copying them.
+
+        :param int size: Bytes to return. Default value is -1, for the rest of the body.
+        :rtype: memoryview
+        """
+        start = self._position
+        end = self._view.nbytes if size is None or size < 0 else min(start + size, self._view.nbytes)
+        self._position = max(start, end)
+        return self._view[start:end].toreadonly()
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self.read(memoryview(buffer).nbytes)
+        memoryview(buffer).cast("B")[: chunk.nbytes] = chunk
+        return chunk.nbytes
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._view.nbytes
+        if offset < 0:
+            raise ValueError("Negative seek position {}".format(offset))
+        self._position = offset
+        return offset
+
+    def __iter__(self) -> Iterator[memoryview]:  # type: ignore[override]
+        chunk = self.read()
+        if chunk.nbytes:
+            yield chunk
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+            if self._owner is not None:
+                self._owner.close()
+        super().close()
+
+    def __repr__(self) -> str:
+        return "<RawBody {} bytes>".format(self._view.nbytes)
+
+
+def iter_ndjson(content: Any) -> Iterator[RawBody]:
+    """Splits newline-delimited JSON into one body per line, without copying any line.
+
+    Each line must be the complete JSON body of one call. Blank lines are skipped.
+
+    :param content: The NDJSON, e.g. a ``bytes`` object or an ``mmap`` of a file.
+    :type content: bytes or bytearray or memoryview or mmap.mmap
+    :return: A body for each line, viewing the same buffer.
+    :rtype: iterator[~getcontext.bodies.RawBody]
+    """
+    view = memoryview(content)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    start = 0
+    for match in _LINE_END.finditer(view):  # type: ignore[arg-type]
+        end = match.start()
+        if not _BLANK.match(view, start, end):  # type: ignore[call-overload]
+            yield RawBody(view[start : end - 1 if view[end - 1] == 13 else end])  # without a "\r"
+        start = match.end()
+    if not _BLANK.match(view, start):  # type: ignore[call-overload]
+        yield RawBody(view[start:])
+
+
+def copy_request(request: "HttpRequest") -> "HttpRequest":
+    """Copies a request for sending, sharing its body instead of deep-copying it.
+
+    Policies change the headers and URL of the request they send, so those are copied.
+    The body is replaced rather than modified by policies, so it is shared.
+
+    :param request: The request.
+    :type request: ~azure.core.rest.HttpRequest
+    :rtype: ~azure.core.rest.HttpRequest
+    """
+    request_copy = copy.copy(request)
+    request_copy.headers = case_insensitive_dict(request.headers)
+    return request_copy
@@ -0,0 +1,206 @@
+import collections
+import threading
+import time
+from typing import Any, Callable, Hashable, MutableMapping, Optional, Tuple
+
+from azure.core.utils import case_insensitive_dict
+
+
+class CacheEntry:
+    """A cached response and the validators to revalidate it with.
+
+    :ivar value: The deserialized response.
+    :ivar str etag: The response's ``ETag``, or None.
+    :ivar str last_modified: The response's ``Last-Modified``, or None.
+    :ivar float expires: Clock time after which the entry is stale.
+    :ivar int size: Size of the response body in bytes, counted against ``max_bytes``.
+    """
+
+    __slots__ = ("value", "etag", "last_modified", "expires", "size")
+
+    def __init__(
+        self, value: Any, *, etag: Optional[str], last_modified: Optional[str], expires: float, size: int
+    ) -> None:
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+        self.size = size
+
+    @property
+    def revalidatable(self) -> bool:
+        """Whether the server sent a validator, so a stale entry can be revalidated."""
+        return self.etag is not None or self.last_modified is not None
+
+
+class ConversationCache:
+    """TTL and LRU cache of deserialized ``conversation(id)`` responses.
+
+    Pass an instance to the client as ``conversation_cache``. Entries are keyed by endpoint,
+    ``authorization`` and conversation id, and are fresh for ``ttl`` seconds. A stale entry
+    whose response had an ``ETag`` or ``Last-Modified`` header is revalidated with a
+    conditional request, and kept if the server answers ``304 Not Modified``; other stale
+    entries are fetched again. The least recently used entries are evicted beyond
+    ``max_entries`` entries or ``max_bytes`` bytes of response bodies. Responses with
+    ``Cache-Control: no-store`` are not cached.
+
+    Cached responses are returned as the same object on every hit, so don't modify them in place.
+
+    :keyword float ttl: Seconds an entry is fresh for. Default value is 60.0.
+    :keyword int max_entries: Maximum number of entries. Default value is 1024.
+    :keyword int max_bytes: Maximum total size of the cached response bodies. Default value is
+     64 MiB.
+    :keyword clock: Returns the current time in seconds. Default value is ``time.monotonic``.
+    :paramtype clock: callable
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60.0,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("Parameter 'max_entries' must be at least 1.")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "collections.OrderedDict[Hashable, CacheEntry]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[CacheEntry], bool]:
+        """Returns the entry for ``key`` and whether it is fresh, counting a hit or a miss.
+
+        Stale entries that cannot be revalidated are dropped.
+
+        :param key: The entry's key.
+        :return: The entry, or None if there is none, and whether it can be returned without
+         contacting the server.
+        :rtype: tuple[~getcontext.caching.CacheEntry or None, bool]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if self._clock() < entry.expires:
+                    self.hits += 1
+                    return entry, True
+                if not entry.revalidatable:
+                    self._remove(key)
+                    entry = None
+            self.misses += 1
+            return entry, False
+
+    def store(self, key: Hashable, value: Any, headers: MutableMapping[str, str], size: int) -> None:
+        """Caches a response, unless its headers forbid it or it is larger than ``max_bytes``.
+
+        :param key: The entry's key.
+        :param value: The deserialized response.
+        :param headers: The response headers.
+        :param int size: Size of the response body in bytes.
+        """
+        headers = case_insensitive_dict(headers)
+        if "no-store" in headers.get("Cache-Control", "").lower() or size > self.max_bytes:
+            self.invalidate(key)
+            return
+        entry = CacheEntry(
+            value,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            expires=self._clock() + self.ttl,
+            size=size,
+        )
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self.size += size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def revalidated(self, key: Hashable, entry: CacheEntry) -> Any:
+        """Marks an entry as fresh again after the server answered ``304 Not Modified``.
+
+        :param key: The entry's key.
+        :param entry: The entry that was revalidated.
+        :type entry: ~getcontext.caching.CacheEntry
+        :return: The cached response.
+        """
+        with self._lock:
+            entry.expires = self._clock() + self.ttl
+            self.revalidations += 1
+            if self._entries.get(key) is entry:
+                self._entries.move_to_end(key)
+        return entry.value
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry], headers: Optional[MutableMapping[str, str]]) -> Any:
+        """Request headers that revalidate a stale entry, added to ``headers``.
+
+        :param entry: The stale entry, or None.
+        :type entry: ~getcontext.caching.CacheEntry
+        :param headers: Headers of the request. Default value is None.
+        :rtype: dict
+        """
+        headers = case_insensitive_dict(headers or {})
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drops the entry for ``key``, if there is one.
+
+        :param key: The entry's key.
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def __repr__(self) -> str:
+        return "<ConversationCache entries={} bytes={} hits={} misses={} revalidations={} evictions={}>".format(
+            len(self._entries), self.size, self.hits, self.misses, self.revalidations, self.evictions
+        )
+
+
+def _response_and_value(pipeline_response: Any, deserialized: Any, _: Any) -> Tuple[Any, Any]:
+    """``cls`` callback for operations, returning the HTTP response along with the deserialized value."""
+    return pipeline_response.http_response, deserialized
+
+
+def get_conversation_cache(conversation_cache: Optional[Any]) -> Optional[ConversationCache]:
+    """Resolves a client's ``conversation_cache`` keyword.
+
+    :param conversation_cache: A ConversationCache, True for a new one with the default
+     settings, or None or False.
+    :rtype: ~getcontext.caching.ConversationCache or None
+    """
+    if conversation_cache is True:
+        return ConversationCache()
+    if conversation_cache is None or conversation_cache is False:
+        return None
+    return conversation_cache
@@ -0,0 +1,270 @@
+import asyncio
+import collections
+import logging
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from .generated.models import Conversation
+    from .generated.operations import LogOperations
+    from .generated.aio.operations import LogOperations as AsyncLogOperations
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Pending:
+    __slots__ = ("body", "kwargs", "first_at", "last_at")
+
+    def __init__(self, body: Any, kwargs: Dict[str, Any], now: float) -> None:
+        self.body = body
+        self.kwargs = kwargs
+        self.first_at = now
+        self.last_at = now
+
+
+class _CoalescerBase:
+    def __init__(self, log_operations: Any, *, window: float, max_delay: float) -> None:
+        if window < 0:
+            raise ValueError("Parameter 'window' must not be negative.")
+        if max_delay < window:
+            raise ValueError("Parameter 'max_delay' must not be less than 'window'.")
+        self._log = log_operations
+        self.window = window
+        self.max_delay = max_delay
+        self._pending: "collections.OrderedDict[Tuple[Optional[str], Hashable], _Pending]" = collections.OrderedDict()
+        self._closed = False
+
+        self.submitted = 0
+        self.collapsed = 0
+        self.sent = 0
+        self.failed = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _put(
+        self, key: Hashable, conversation: "Conversation", tenant_id: Optional[str], kwargs: Dict[str, Any]
+    ) -> bool:
+        """Stores the latest version for a key. Returns True if it is the first pending version."""
+        if self._closed:
+            raise RuntimeError("Cannot upsert through a closed {}.".format(type(self).__name__))
+        now = time.monotonic()
+        body = {"conversation": conversation}
+        kwargs["tenant_id"] = tenant_id
+        self.submitted += 1
+        pending = self._pending.get((tenant_id, key))
+        if pending is None:
+            self._pending[(tenant_id, key)] = _Pending(body, kwargs, now)
+            return True
+        self.collapsed += 1
+        pending.body, pending.kwargs, pending.last_at = body, kwargs, now
+        return False
+
+    def _deadline(self, pending: _Pending) -> float:
+        return min(pending.last_at + self.window, pending.first_at + self.max_delay)
+
+    def _take_due(self, flush_all: bool) -> Tuple[List[_Pending], Optional[float]]:
+        """Removes the versions that are due. Returns them and the next deadline, if any."""
+        now = time.monotonic()
+        due: List[_Pending] = []
+        next_deadline: Optional[float] = None
+        for key in list(self._pending):
+            pending = self._pending[key]
+            deadline = self._deadline(pending)
+            if flush_all or deadline <= now:
+                due.append(self._pending.pop(key))
+            elif next_deadline is None or deadline < next_deadline:
+                next_deadline = deadline
+        return due, next_deadline
+
+
+class UpsertCoalescer(_CoalescerBase):
+    """Collapses bursts of ``log.conversation_upsert`` calls for the same conversation.
+
+    Conversations carry no id, so callers name each one with a ``key``. The latest version
+    per key (and tenant) is held until no newer version arrives for ``window`` seconds, or
+    at most ``max_delay`` seconds after the first held version, then sent from a worker
+    thread. Earlier versions are never sent; ``collapsed`` counts them.
+
+    :param log_operations: The operations group used to send, usually ``client.log``.
+    :type log_operations: ~getcontext.generated.operations.LogOperations
+    :keyword float window: Quiet period in seconds before the latest version is sent.
+     Default value is 0.5.
+    :keyword float max_delay: Longest time in seconds a version is held. Default value is 5.0.
+    """
+
+    def __init__(self, log_operations: "LogOperations", *, window: float = 0.5, max_delay: float = 5.0) -> None:
+        super().__init__(log_operations, window=window, max_delay=max_delay)
+        self._cond = threading.Condition()
+        self._flush_requested = False
+        self._sending = 0
+        self._worker = threading.Thread(target=self._run, name="getcontext-upsert-coalescer", daemon=True)
+        self._worker.start()
+
+    def upsert(
+        self, key: Hashable, conversation: "Conversation", *, tenant_id: Optional[str] = None, **kwargs: Any
+    ) -> None:
+        """Holds a conversation version for ``log.conversation_upsert``, replacing any pending one.
+
+        :param key: Identifies the conversation, e.g. your own conversation id.
+        :type key: ~typing.Hashable
+        :param conversation: The latest state of the conversation.
+        :type conversation: ~getcontext.generated.models.Conversation
+        :keyword tenant_id: Default value is None.
+        :paramtype tenant_id: str
+        """
+        with self._cond:
+            if self._put(key, conversation, tenant_id, kwargs):
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Sends every pending version now and waits for the sends to complete.
+
+        :param float timeout: Seconds to wait. Waits indefinitely by default.
+        :return: False if the timeout expired first.
+        :rtype: bool
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending and not self._sending, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Sends every pending version and stops the worker thread.
+
+        :param float timeout: Seconds to wait for the sends. Waits indefinitely by default.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            _LOGGER.warning("Upsert coalescer did not drain within %s seconds.", timeout)
+
+    def __enter__(self) -> "UpsertCoalescer":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    flush_all = self._closed or self._flush_requested
+                    due, next_deadline = self._take_due(flush_all)
+                    if due:
+                        break
+                    self._flush_requested = False
+                    self._cond.notify_all()
+                    if self._closed:
+                        return
+                    self._cond.wait(None if next_deadline is None else next_deadline - time.monotonic())
+                self._sending = len(due)
+
+            for pending in due:
+                self._send(pending)
+
+            with self._cond:
+                self._sending = 0
+                self._cond.notify_all()
+
+    def _send(self, pending: _Pending) -> None:
+        try:
+            self._log.conversation_upsert(pending.body, **pending.kwargs)
+        except Exception:  # pylint: disable=broad-except
+            self.failed += 1
+            _LOGGER.warning("Coalesced conversation_upsert call failed.", exc_info=True)
+        else:
+            self.sent += 1
+
+
+class AsyncUpsertCoalescer(_CoalescerBase):
+    """Async counterpart of :class:`UpsertCoalescer`, sending from a task on the client's event loop.
+
+    :param log_operations: The operations group used to send, usually ``client.log``.
+    :type log_operations: ~getcontext.generated.aio.operations.LogOperations
+    :keyword float window: Quiet period in seconds before the latest version is sent.
+     Default value is 0.5.
+    :keyword float max_delay: Longest time in seconds a version is held. Default value is 5.0.
+    """
+
+    def __init__(self, log_operations: "AsyncLogOperations", *, window: float = 0.5, max_delay: float = 5.0) -> None:
+        super().__init__(log_operations, window=window, max_delay=max_delay)
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._flush_requested = False
+        self._sender: Optional["asyncio.Task[None]"] = None
+
+    async def upsert(
+        self, key: Hashable, conversation: "Conversation", *, tenant_id: Optional[str] = None, **kwargs: Any
+    ) -> None:
+        """Holds a conversation version for ``log.conversation_upsert``, replacing any pending one.
+
+        :param key: Identifies the conversation, e.g. your own conversation id.
+        :type key: ~typing.Hashable
+        :param conversation: The latest state of the conversation.
+        :type conversation: ~getcontext.generated.models.Conversation
+        :keyword tenant_id: Default value is None.
+        :paramtype tenant_id: str
+        """
+        if self._put(key, conversation, tenant_id, kwargs):
+            if self._sender is None:
+                self._sender = asyncio.ensure_future(self._run())
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Sends every pending version now and waits for the sends to complete."""
+        if self._sender is None or self._sender.done():
+            return
+        self._drained.clear()
+        self._flush_requested = True
+        self._wakeup.set()
+        await self._drained.wait()
+
+    async def aclose(self) -> None:
+        """Sends every pending version and stops the sender task."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._sender is not None:
+            self._wakeup.set()
+            await self._sender
+            self._sender = None
+
+    async def __aenter__(self) -> "AsyncUpsertCoalescer":
+        return self
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self.aclose()
+
+    async def _run(self) -> None:
+        while True:
+            due, next_deadline = self._take_due(self._closed or self._flush_requested)
+            for pending in due:
+                await self._send(pending)
+            if due:
+                continue
+            self._flush_requested = False
+            self._drained.set()
+            if self._closed:
+                return
+            self._wakeup.clear()
+            timeout = None if next_deadline is None else max(next_deadline - time.monotonic(), 0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _send(self, pending: _Pending) -> None:
+        try:
+            await self._log.conversation_upsert(pending.body, **pending.kwargs)
+        except Exception:  # pylint: disable=broad-except
+            self.failed += 1
+            _LOGGER.warning("Coalesced conversation_upsert call failed.", exc_info=True)
+        else:
+            self.sent += 1
@@ -0,0 +1,225 @@
+import array
+import datetime
+import math
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+
+from azure.core.exceptions import DeserializationError
+
+from .generated._serialization import _parse_iso_datetime_cached
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
+_NAN = math.nan
+
+
+class DictionaryColumn(NamedTuple):
+    """A dictionary-encoded string column.
+
+    :ivar codes: Index of each row's value in ``categories``, or -1 where the value is missing.
+    :ivar categories: The distinct values, in order of first appearance.
+    """
+
+    codes: Any
+    categories: List[str]
+
+    def decode(self, row: int) -> Optional[str]:
+        """The value of one row.
+
+        :param int row: The row index.
+        :rtype: str or None
+        """
+        code = self.codes[row]
+        return None if code < 0 else self.categories[code]
+
+
+class MessageTable:
+    """Messages of a set of conversations, stored column by column.
+
+    Numeric columns are NumPy arrays when NumPy is used, ``array.array`` otherwise, with NaN
+    where a value is missing. The messages of conversation ``i`` are the rows
+    ``offsets[i]:offsets[i + 1]``.
+
+    :ivar list[str] conversation_ids: Id of each conversation.
+    :ivar offsets: First row of each conversation, followed by the number of rows (int64).
+    :ivar sentiment: ``MessageResponse.sentiment`` of each message (float64).
+    :ivar rating: ``MessageResponse.rating`` of each message (float64).
+    :ivar event_timestamp: ``MessageResponse.event_timestamp`` of each message, in POSIX
+     seconds (float64). Timestamps without a UTC offset are taken as UTC.
+    :ivar role: ``MessageResponse.role`` of each message.
+    :vartype role: ~getcontext.columnar.DictionaryColumn
+    :ivar language: ``MessageResponse.language`` of each message.
+    :vartype language: ~getcontext.columnar.DictionaryColumn
+    """
+
+    def __init__(
+        self,
+        conversation_ids: List[str],
+        offsets: Any,
+        sentiment: Any,
+        rating: Any,
+        event_timestamp: Any,
+        role: DictionaryColumn,
+        language: DictionaryColumn,
+    ) -> None:
+        self.conversation_ids = conversation_ids
+        self.offsets = offsets
+        self.sentiment = sentiment
+        self.rating = rating
+        self.event_timestamp = event_timestamp
+        self.role = role
+        self.language = language
+
+    def __len__(self) -> int:
+        return len(self.sentiment)
+
+    @property
+    def columns(self) -> Dict[str, Any]:
+        """The per-message columns by name."""
+        return {
+            "sentiment": self.sentiment,
+            "rating": self.rating,
+            "event_timestamp": self.event_timestamp,
+            "role": self.role,
+            "language": self.language,
+        }
+
+    def conversation_index(self) -> Any:
+        """Index into ``conversation_ids`` of each message's conversation.
+
+        :return: An int64 column with one entry per message.
+        """
+        counts = [self.offsets[i + 1] - self.offsets[i] for i in range(len(self.conversation_ids))]
+        if numpy is not None and isinstance(self.offsets, numpy.ndarray):
+            return numpy.repeat(numpy.arange(len(counts), dtype=numpy.int64), counts)
+        index = array.array("q")
+        for conversation, count in enumerate(counts):
+            index.extend([conversation] * count)
+        return index
+
+    def __repr__(self) -> str:
+        return "<MessageTable conversations={} messages={}>".format(len(self.conversation_ids), len(self))
+
+
+class _DictionaryEncoder:
+    def __init__(self) -> None:
+        self.codes = array.array("i")
+        self.categories: List[str] = []
+        self._index: Dict[Any, int] = {}
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(str(value))
+        self.codes.append(code)
+
+
+class MessageTableBuilder:
+    """Builds a :class:`MessageTable` from conversations as decoded from JSON.
+
+    Conversations are added as the dicts the API returns, e.g. from
+    :meth:`~getcontext.streaming.ConversationStream.read_json`, so no model is created for
+    any message. Add several pages to build one table over all of them.
+    """
+
+    def __init__(self) -> None:
+        self._conversation_ids: List[str] = []
+        self._offsets = array.array("q", [0])
+        self._sentiment = array.array("d")
+        self._rating = array.array("d")
+        self._event_timestamp = array.array("d")
+        self._role = _DictionaryEncoder()
+        self._language = _DictionaryEncoder()
+
+    def __len__(self) -> int:
+        return len(self._conversation_ids)
+
+    def add(self, conversation: Mapping[str, Any]) -> None:
+        """Appends a conversation and its messages.
+
+        :param conversation: A ``ConversationResponse`` as decoded from JSON.
+        :type conversation: dict
+        :raises ~azure.core.exceptions.DeserializationError: If a value has the wrong type.
+        """
+        messages: Sequence[Mapping[str, Any]] = conversation.get("messages") or ()
+        sentiment = self._sentiment.append
+        rating = self._rating.append
+        event_timestamp = self._event_timestamp.append
+        role = self._role.append
+        language = self._language.append
+        try:
+            for message in messages:
+                value = message.get("sentiment")
+                sentiment(_NAN if value is None else float(value))
+                value = message.get("rating")
+                rating(_NAN if value is None else float(value))
+                value = message.get("event_timestamp")
+                event_timestamp(_NAN if value is None else _posix_timestamp(value))
+                role(message.get("role"))
+                language(message.get("language"))
+        except (AttributeError, OverflowError, TypeError, ValueError) as err:
+            # Drop the rows added before the error, so that the columns stay aligned.
+            rows = self._offsets[-1]
+            for column in (
+                self._sentiment,
+                self._rating,
+                self._event_timestamp,
+                self._role.codes,
+                self._language.codes,
+            ):
+                del column[rows:]
+            raise DeserializationError(
+                "Unable to add messages of conversation {!r} to the table: {}".format(conversation.get("id"), err)
+            ) from err
+        self._conversation_ids.append(conversation.get("id"))  # type: ignore
+        self._offsets.append(len(self._sentiment))
+
+    def extend(self, conversations: Iterable[Mapping[str, Any]]) -> None:
+        """Appends several conversations.
+
+        :param conversations: ``ConversationResponse`` dicts as decoded from JSON.
+        :type conversations: iterable[dict]
+        """
+        for conversation in conversations:
+            self.add(conversation)
+
+    def build(self, use_numpy: Optional[bool] = None) -> MessageTable:
+        """Returns the table of everything added so far.
+
+        :param bool use_numpy: Whether columns are NumPy arrays. Default value is None, which
+         uses NumPy when it is installed.
+        :rtype: ~getcontext.columnar.MessageTable
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError("NumPy columns require the 'numpy' package. Install it with 'pip install numpy'.")
+        # Copy, so that the table is unaffected by later additions.
+        columns = [
+            array.array(column.typecode, column)
+            for column in (self._offsets, self._sentiment, self._rating, self._event_timestamp)
+        ]
+        codes = [array.array("i", self._role.codes), array.array("i", self._language.codes)]
+        if use_numpy:
+            columns = [numpy.frombuffer(column, dtype=column.typecode) for column in columns]
+            codes = [numpy.frombuffer(column, dtype=numpy.int32) for column in codes]
+        return MessageTable(
+            list(self._conversation_ids),
+            *columns,
+            role=DictionaryColumn(codes[0], list(self._role.categories)),
+            language=DictionaryColumn(codes[1], list(self._language.categories)),
+        )
+
+
+def _posix_timestamp(value: Any) -> float:
+    if isinstance(value, str):
+        value = _parse_iso_datetime_cached(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
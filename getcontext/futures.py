@@ -0,0 +1,111 @@
+import concurrent.futures
+import threading
+from typing import Any, Callable, Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from .generated.operations import LogOperations
+
+
+class FutureLogOperations:
+    """Runs ``log`` operations on a thread pool and returns :class:`concurrent.futures.Future` objects.
+
+    Every public method of the wrapped operations group is available under the same name
+    and signature, but returns a future for its result instead of blocking, e.g.
+    ``futures.conversation(body).result()``. All calls share the client's pipeline. At most
+    ``max_in_flight`` calls are queued or running; further calls block until one completes.
+
+    :param log_operations: The operations group to run, usually ``client.log``.
+    :type log_operations: ~getcontext.generated.operations.LogOperations
+    :keyword int max_workers: Threads sending calls. Default value is 8.
+    :keyword int max_in_flight: Calls queued or running before new calls block. Default value is 100.
+    :keyword executor: Executor to run calls on instead of a pool owned by this object. It is
+     not shut down by :meth:`close`. Default value is None.
+    :paramtype executor: ~concurrent.futures.Executor
+    """
+
+    def __init__(
+        self,
+        log_operations: "LogOperations",
+        *,
+        max_workers: int = 8,
+        max_in_flight: int = 100,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("Parameter 'max_in_flight' must be at least 1.")
+        self._log = log_operations
+        self._owns_executor = executor is None
+        self._executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="getcontext-log"
+        )
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+        self._pending: Set["concurrent.futures.Future[Any]"] = set()
+        self._closed = False
+
+    def __getattr__(self, name: str) -> Callable[..., "concurrent.futures.Future[Any]"]:
+        operation = getattr(self._log, name) if not name.startswith("_") else None
+        if not callable(operation):
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+        def submit(*args: Any, **kwargs: Any) -> "concurrent.futures.Future[Any]":
+            return self.submit(operation, *args, **kwargs)
+
+        submit.__name__ = name
+        submit.__doc__ = operation.__doc__
+        return submit
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "concurrent.futures.Future[Any]":
+        """Runs a callable on the pool, waiting while ``max_in_flight`` calls are pending.
+
+        :param fn: The callable, usually a method of ``client.log``.
+        :return: A future for the callable's result.
+        :rtype: ~concurrent.futures.Future
+        """
+        if self._closed:
+            raise RuntimeError("Cannot submit to a closed FutureLogOperations.")
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Waits for every call submitted so far to complete.
+
+        :param float timeout: Seconds to wait. Waits indefinitely by default.
+        :return: False if the timeout expired first.
+        :rtype: bool
+        """
+        with self._lock:
+            pending = set(self._pending)
+        _, not_done = concurrent.futures.wait(pending, timeout)
+        return not not_done
+
+    def close(self, wait: bool = True) -> None:
+        """Stops accepting calls and shuts down the owned pool.
+
+        :param bool wait: Whether to wait for pending calls to complete. Default value is True.
+        """
+        self._closed = True
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+        elif wait:
+            self.wait_all()
+
+    def __enter__(self) -> "FutureLogOperations":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+    def _done(self, future: "concurrent.futures.Future[Any]") -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
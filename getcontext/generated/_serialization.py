@@ -32,6 +32,7 @@ import calendar
 import datetime
 import decimal
 import email
+import functools
 from enum import Enum
 import json
 import logging
@@ -53,6 +54,7 @@ from typing import (
     Type,
     List,
     Mapping,
+    Tuple,
 )
 
 try:
@@ -81,7 +83,12 @@ class RawDeserializer:
     CONTEXT_NAME = "deserialized_data"
 
     @classmethod
-    def deserialize_from_text(cls, data: Optional[Union[AnyStr, IO]], content_type: Optional[str] = None) -> Any:
+    def deserialize_from_text(
+        cls,
+        data: Optional[Union[AnyStr, IO]],
+        content_type: Optional[str] = None,
+        json_loads: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
         """Decode data according to content-type.
 
         Accept a stream of data as well, but will be load at once in memory for now.
@@ -91,11 +98,18 @@ class RawDeserializer:
         :param data: Input, could be bytes or stream (will be decoded with UTF8) or text
         :type data: str or bytes or IO
         :param str content_type: The content type.
+        :param callable json_loads: Decodes JSON straight from the bytes or text, instead of json.loads.
         """
         if hasattr(data, "read"):
             # Assume a stream
             data = cast(IO, data).read()
 
+        if json_loads is not None and content_type is not None and cls.JSON_REGEXP.match(content_type):
+            try:
+                return json_loads(data)
+            except ValueError as err:
+                raise DeserializationError("JSON is invalid: {}".format(err), err)
+
         if isinstance(data, bytes):
             data_as_str = data.decode(encoding="utf-8-sig")
         else:
@@ -149,7 +163,12 @@ class RawDeserializer:
         raise DeserializationError("Cannot deserialize content-type: {}".format(content_type))
 
     @classmethod
-    def deserialize_from_http_generics(cls, body_bytes: Optional[Union[AnyStr, IO]], headers: Mapping) -> Any:
+    def deserialize_from_http_generics(
+        cls,
+        body_bytes: Optional[Union[AnyStr, IO]],
+        headers: Mapping,
+        json_loads: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
         """Deserialize from HTTP response.
 
         Use bytes and headers to NOT use any requests/aiohttp or whatever
@@ -168,7 +187,7 @@ class RawDeserializer:
             content_type = "application/json"
 
         if body_bytes:
-            return cls.deserialize_from_text(body_bytes, content_type)
+            return cls.deserialize_from_text(body_bytes, content_type, json_loads)
         return None
 
 
@@ -234,6 +253,73 @@ except ImportError:
 
 _FLATTEN = re.compile(r"(?<!\\)\.")
 
+# ISO-8601 date-times that datetime.fromisoformat() parses once "Z" and the fraction are normalized.
+_ISO_DATETIME = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:\d{2})?\Z")
+
+
+def _parse_iso_datetime(attr):
+    """Parse an ISO-8601 string as Deserializer.deserialize_iso() does, using fromisoformat() when possible.
+
+    :param str attr: The string to parse.
+    :rtype: Datetime
+    :raises: ValueError, OverflowError or AttributeError if the string is not a valid datetime.
+    """
+    match = _ISO_DATETIME.match(attr) if isinstance(attr, str) else None
+    if match:
+        date_time, fraction, offset = match.groups()
+        if fraction:
+            date_time += "." + fraction[:6].ljust(6, "0")
+        if offset:
+            date_time += "+00:00" if offset == "Z" else offset
+        date_obj = datetime.datetime.fromisoformat(date_time)
+    else:
+        attr = attr.upper()  # type: ignore
+        match = Deserializer.valid_date.match(attr)
+        if not match:
+            raise ValueError("Invalid datetime string: " + attr)
+
+        check_decimal = attr.split(".")
+        if len(check_decimal) > 1:
+            decimal_str = ""
+            for digit in check_decimal[1]:
+                if digit.isdigit():
+                    decimal_str += digit
+                else:
+                    break
+            if len(decimal_str) > 6:
+                attr = attr.replace(decimal_str, decimal_str[0:6])
+
+        date_obj = isodate.parse_datetime(attr)
+    test_utc = date_obj.utctimetuple()
+    if test_utc.tm_year > 9999 or test_utc.tm_year < 1:
+        raise OverflowError("Hit max or min date")
+    return date_obj
+
+
+# Timestamps repeat heavily within a conversation, and datetimes are immutable, so parses are shared.
+_parse_iso_datetime_cached = functools.lru_cache(maxsize=1024)(_parse_iso_datetime)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_iso_datetime(attr):
+    """Format a datetime as Serializer.serialize_iso() does, converted to UTC.
+
+    :param Datetime attr: The datetime to format.
+    :rtype: str
+    :raises: ValueError or OverflowError if the datetime is out of range.
+    """
+    utc = attr.utctimetuple()
+    if utc.tm_year > 9999 or utc.tm_year < 1:
+        raise OverflowError("Hit max or min date")
+
+    microseconds = str(attr.microsecond).rjust(6, "0").rstrip("0").ljust(3, "0")
+    if microseconds:
+        microseconds = "." + microseconds
+    date = "{:04}-{:02}-{:02}T{:02}:{:02}:{:02}".format(
+        utc.tm_year, utc.tm_mon, utc.tm_mday, utc.tm_hour, utc.tm_min, utc.tm_sec
+    )
+    return date + microseconds + "Z"
+
 
 def attribute_transformer(key, attr_desc, value):
     """A key transformer that returns the Python attribute.
@@ -285,6 +371,9 @@ class Model(object):
     serialization and deserialization.
     """
 
+    # Empty, so that subclasses declaring __slots__ have no instance __dict__.
+    __slots__ = ()
+
     _subtype_map: Dict[str, Dict[str, Any]] = {}
     _attribute_map: Dict[str, Dict[str, Any]] = {}
     _validation: Dict[str, Dict[str, Any]] = {}
@@ -345,7 +434,7 @@ class Model(object):
         :returns: A dict JSON compatible object
         :rtype: dict
         """
-        serializer = Serializer(self._infer_class_models())
+        serializer = self._get_serializer()
         return serializer._serialize(self, keep_readonly=keep_readonly, **kwargs)  # type: ignore
 
     def as_dict(
@@ -387,6 +476,26 @@ class Model(object):
         serializer = Serializer(self._infer_class_models())
         return serializer._serialize(self, key_transformer=key_transformer, keep_readonly=keep_readonly, **kwargs)  # type: ignore
 
+    @classmethod
+    def _get_serializer(cls) -> "Serializer":
+        """Serializer for this class, created once so its compiled encoders are reused."""
+        try:
+            return cls.__dict__["_class_serializer"]
+        except KeyError:
+            serializer = Serializer(cls._infer_class_models())
+            cls._class_serializer = serializer  # type: ignore
+            return serializer
+
+    @classmethod
+    def _get_deserializer(cls) -> "Deserializer":
+        """Deserializer for this class, created once so its compiled decoders are reused."""
+        try:
+            return cls.__dict__["_class_deserializer"]
+        except KeyError:
+            deserializer = Deserializer(cls._infer_class_models())
+            cls._class_deserializer = deserializer  # type: ignore
+            return deserializer
+
     @classmethod
     def _infer_class_models(cls):
         try:
@@ -409,7 +518,7 @@ class Model(object):
         :returns: An instance of this model
         :raises: DeserializationError if something went wrong
         """
-        deserializer = Deserializer(cls._infer_class_models())
+        deserializer = cls._get_deserializer()
         return deserializer(cls.__name__, data, content_type=content_type)  # type: ignore
 
     @classmethod
@@ -505,6 +614,87 @@ def _decode_attribute_map_key(key):
     return key.replace("\\.", ".")
 
 
+class _DirectEncodingUnsupported(Exception):
+    """Raised when a request body has to be deserialized into models before it can be serialized."""
+
+
+# Errors raised by direct encoding for input that the generic path handles, or reports itself.
+_DIRECT_ENCODING_ERRORS = (_DirectEncodingUnsupported, SerializationError, TypeError, ValueError, AttributeError)
+
+
+def _is_exact_basic(data, data_type):
+    """Whether deserializing data as a basic type would leave it unchanged.
+
+    :param data: The value.
+    :param str data_type: One of "str", "int", "float" or "bool".
+    :rtype: bool
+    """
+    if data_type == "str":
+        return isinstance(data, str)
+    if data_type == "bool":
+        return isinstance(data, bool)
+    if isinstance(data, bool):
+        return False
+    if data_type == "int":
+        return isinstance(data, int)
+    return isinstance(data, (int, float))
+
+
+def _is_plain_json(data):
+    """Whether data only holds dicts, lists, strings, numbers, booleans and None.
+
+    :param data: The value.
+    :rtype: bool
+    """
+    if data is None or type(data) in (str, int, float, bool):
+        return True
+    if type(data) is dict:  # pylint: disable=unidiomatic-typecheck
+        return all(isinstance(key, str) and _is_plain_json(value) for key, value in data.items())
+    if type(data) is list:  # pylint: disable=unidiomatic-typecheck
+        return all(_is_plain_json(value) for value in data)
+    return False
+
+
+_COMPILED_ENCODER_KWARGS = frozenset(["keep_readonly", "is_xml", "serialization_ctxt"])
+
+
+def _encode_str(data):
+    return data if type(data) is str else Serializer.serialize_unicode(data)  # pylint: disable=unidiomatic-typecheck
+
+
+def _encode_int(data):
+    return data if type(data) is int else int(data)  # pylint: disable=unidiomatic-typecheck
+
+
+def _encode_float(data):
+    return data if type(data) is float else float(data)  # pylint: disable=unidiomatic-typecheck
+
+
+def _encode_bool(data):
+    return data if type(data) is bool else bool(data)  # pylint: disable=unidiomatic-typecheck
+
+
+_BASIC_ENCODERS = {"str": _encode_str, "int": _encode_int, "float": _encode_float, "bool": _encode_bool}
+
+
+def _build_model_encoder(fields):
+    """Encoder for a model's (attribute, REST key, value encoder) fields.
+
+    :param tuple fields: The fields, in _attribute_map order.
+    :rtype: callable
+    """
+
+    def encode(target_obj):
+        serialized = {}
+        for attr, key, encoder in fields:
+            value = getattr(target_obj, attr)
+            if value is not None:
+                serialized[key] = None if value is CoreNull else encoder(value)
+        return serialized
+
+    return encode
+
+
 class Serializer(object):
     """Request object model serializer."""
 
@@ -559,6 +749,9 @@ class Serializer(object):
         self.dependencies: Dict[str, type] = dict(classes) if classes else {}
         self.key_transformer = full_restapi_key_transformer
         self.client_side_validation = True
+        self._body_deserializers: Dict[bool, "Deserializer"] = {}
+        self._rest_key_maps: Dict[type, Dict[str, Tuple[str, str]]] = {}
+        self._model_encoders: Dict[Tuple[type, bool, int], Optional[Callable[[Any], Dict[str, Any]]]] = {}
 
     def _serialize(self, target_obj, data_type=None, **kwargs):
         """Serialize data into a string according to type.
@@ -573,6 +766,21 @@ class Serializer(object):
         if target_obj is None:
             return None
 
+        if (
+            data_type is None
+            and isinstance(target_obj, Model)
+            and key_transformer is full_restapi_key_transformer
+            and not kwargs.get("is_xml", False)
+            and kwargs.keys() <= _COMPILED_ENCODER_KWARGS
+        ):
+            encoder = self._model_encoder(type(target_obj), keep_readonly)
+            if encoder is not None:
+                try:
+                    return encoder(target_obj)
+                except _DIRECT_ENCODING_ERRORS as err:
+                    # Let the generic path below serialize the value, or report the error.
+                    _LOGGER.debug("Serializing %s through the generic path: %r", type(target_obj).__name__, err)
+
         attr_name = None
         class_name = target_obj.__class__.__name__
 
@@ -680,6 +888,18 @@ class Serializer(object):
         # Just in case this is a dict
         internal_data_type_str = data_type.strip("[]{}")
         internal_data_type = self.dependencies.get(internal_data_type_str, None)
+        if (
+            not kwargs
+            and self.key_transformer is full_restapi_key_transformer
+            and isinstance(internal_data_type, type)
+            and issubclass(internal_data_type, Model)
+            and not internal_data_type.is_xml_model()
+        ):
+            try:
+                return self._encode_direct(data, data_type, not isinstance(data, Model))
+            except _DIRECT_ENCODING_ERRORS as err:
+                # Fall back to building models first, which also reports errors consistently
+                _LOGGER.debug("Serializing %s body through models: %r", data_type, err)
         try:
             is_xml_model_serialization = kwargs["is_xml"]
         except KeyError:
@@ -689,26 +909,215 @@ class Serializer(object):
                 is_xml_model_serialization = False
         if internal_data_type and not isinstance(internal_data_type, Enum):
             try:
-                deserializer = Deserializer(self.dependencies)
-                # Since it's on serialization, it's almost sure that format is not JSON REST
-                # We're not able to deal with additional properties for now.
-                deserializer.additional_properties_detection = False
-                if is_xml_model_serialization:
-                    deserializer.key_extractors = [  # type: ignore
-                        attribute_key_case_insensitive_extractor,
-                    ]
-                else:
-                    deserializer.key_extractors = [
-                        rest_key_case_insensitive_extractor,
-                        attribute_key_case_insensitive_extractor,
-                        last_rest_key_case_insensitive_extractor,
-                    ]
+                deserializer = self._body_deserializer(is_xml_model_serialization)
                 data = deserializer._deserialize(data_type, data)
             except DeserializationError as err:
                 raise SerializationError("Unable to build a model: " + str(err)) from err
 
         return self._serialize(data, data_type, **kwargs)
 
+    def _body_deserializer(self, is_xml):
+        """Deserializer used by body() to build models from user input, created once per format.
+
+        :param bool is_xml: Whether the body is serialized as XML.
+        :rtype: Deserializer
+        """
+        try:
+            return self._body_deserializers[is_xml]
+        except KeyError:
+            pass
+        deserializer = Deserializer(self.dependencies)
+        # Since it's on serialization, it's almost sure that format is not JSON REST
+        # We're not able to deal with additional properties for now.
+        deserializer.additional_properties_detection = False
+        if is_xml:
+            deserializer.key_extractors = [  # type: ignore
+                attribute_key_case_insensitive_extractor,
+            ]
+        else:
+            deserializer.key_extractors = [
+                rest_key_case_insensitive_extractor,
+                attribute_key_case_insensitive_extractor,
+                last_rest_key_case_insensitive_extractor,
+            ]
+        self._body_deserializers[is_xml] = deserializer
+        return deserializer
+
+    def _encode_direct(self, data, data_type, from_input):
+        """Serialize a JSON body without first building models from it.
+
+        Produces the same output as deserializing ``data`` into models and serializing
+        those. Anything that round trip would reinterpret (keys that are not exact REST
+        keys, strings for datetimes, loosely typed basic values, flattening, polymorphism)
+        raises _DirectEncodingUnsupported, and body() falls back to the round trip.
+
+        :param data: The data to be serialized.
+        :param str data_type: The type to be serialized from.
+        :param bool from_input: Whether data comes from a plain dict, which the round trip
+         would deserialize, rather than from a model attribute, which it leaves as is.
+        :rtype: dict, list, str, int, float, bool or None
+        :raises: _DirectEncodingUnsupported if data needs the round trip.
+        """
+        if data is None:
+            return None
+        if data is CoreNull:
+            if from_input:
+                raise _DirectEncodingUnsupported(data_type)
+            return None
+        if data_type in self.basic_types.values():
+            if from_input and not _is_exact_basic(data, data_type):
+                raise _DirectEncodingUnsupported(data_type)
+            return self.serialize_basic(data, data_type)
+        if data_type == "object":
+            if from_input and not _is_plain_json(data):
+                raise _DirectEncodingUnsupported(data_type)
+            return self.serialize_object(data)
+        if data_type == "iso-8601":
+            if not isinstance(data, datetime.datetime):
+                raise _DirectEncodingUnsupported(data_type)
+            return self.serialize_iso(data)
+        if data_type[:1] == "[" and data_type[-1:] == "]":
+            if not isinstance(data, list):
+                raise _DirectEncodingUnsupported(data_type)
+            return [self._encode_direct(item, data_type[1:-1], from_input) for item in data]
+        if data_type[:1] == "{" and data_type[-1:] == "}":
+            if not isinstance(data, dict) or not all(isinstance(key, str) for key in data):
+                raise _DirectEncodingUnsupported(data_type)
+            return {key: self._encode_direct(value, data_type[1:-1], from_input) for key, value in data.items()}
+
+        target = self.dependencies.get(data_type)
+        if isinstance(target, type) and issubclass(target, Enum):
+            # Enum attributes are always rebuilt by the round trip, so only accept exact values.
+            if isinstance(data, target) or (isinstance(data, str) and data in target._value2member_map_):
+                return Serializer.serialize_enum(data, enum_obj=target)
+            raise _DirectEncodingUnsupported(data_type)
+        if isinstance(target, type) and issubclass(target, Model):
+            if isinstance(data, Model):
+                encoder = self._model_encoder(type(data), False)
+                if encoder is None:
+                    raise _DirectEncodingUnsupported(data_type)
+                return encoder(data)
+            if isinstance(data, dict):
+                return self._encode_model_dict(data, target)
+        raise _DirectEncodingUnsupported(data_type)
+
+    def _model_encoder(self, model_type, keep_readonly):
+        """Encoder built once from a model's _attribute_map, emitting its JSON REST dict.
+
+        Equivalent to _serialize() with the default key transformer and no XML. Models that
+        use XML, flattening or additional properties have no encoder.
+
+        :param type model_type: The model class.
+        :param bool keep_readonly: Whether readonly attributes are serialized.
+        :rtype: callable or None
+        """
+        # The map length is part of the key, since enable_additional_properties_sending() mutates it.
+        cache_key = (model_type, keep_readonly, len(model_type._attribute_map))
+        try:
+            return self._model_encoders[cache_key]
+        except KeyError:
+            pass
+        fields = []
+        encoder = None
+        if not model_type.is_xml_model():
+            for attr, attr_desc in model_type._attribute_map.items():
+                if not keep_readonly and model_type._validation.get(attr, {}).get("readonly", False):
+                    continue
+                keys = _FLATTEN.split(attr_desc["key"])
+                if attr_desc["key"] == "" or len(keys) != 1:
+                    break
+                fields.append(
+                    (attr, _decode_attribute_map_key(keys[0]), self._type_encoder(attr_desc["type"], keep_readonly))
+                )
+            else:
+                encoder = _build_model_encoder(tuple(fields))
+        self._model_encoders[cache_key] = encoder
+        return encoder
+
+    def _type_encoder(self, data_type, keep_readonly):
+        """Function serializing a non-None value of the given type, as serialize_data() would.
+
+        :param str data_type: The type to be serialized from.
+        :param bool keep_readonly: Whether readonly attributes of nested models are serialized.
+        :rtype: callable
+        """
+        if data_type in _BASIC_ENCODERS:
+            return _BASIC_ENCODERS[data_type]
+        if data_type in self.serialize_type and data_type not in ("[]", "{}"):
+            return self.serialize_type[data_type]
+        if len(data_type) > 1 and data_type[0] + data_type[-1] == "[]":
+            item_encoder = self._type_encoder(data_type[1:-1], keep_readonly)
+
+            def encode_list(data):
+                if isinstance(data, str):
+                    raise SerializationError("Refuse str type as a valid iter type.")
+                return [None if item is None or item is CoreNull else item_encoder(item) for item in data]
+
+            return encode_list
+        if len(data_type) > 1 and data_type[0] + data_type[-1] == "{}":
+            value_encoder = self._type_encoder(data_type[1:-1], keep_readonly)
+
+            def encode_dict(data):
+                return {
+                    (
+                        key if type(key) is str else Serializer.serialize_unicode(key)
+                    ): (  # pylint: disable=unidiomatic-typecheck
+                        None if value is None or value is CoreNull else value_encoder(value)
+                    )
+                    for key, value in data.items()
+                }
+
+            return encode_dict
+
+        target = self.dependencies.get(data_type)
+        if isinstance(target, type) and issubclass(target, Enum):
+            return functools.partial(Serializer.serialize_enum, enum_obj=target)
+
+        def encode_other(data):
+            if target is None and isinstance(data, Enum):
+                return Serializer.serialize_enum(data, enum_obj=data.__class__)
+            if isinstance(data, Model):
+                encoder = self._model_encoder(type(data), keep_readonly)
+                if encoder is not None:
+                    return encoder(data)
+            raise _DirectEncodingUnsupported(data_type)
+
+        return encode_other
+
+    def _encode_model_dict(self, data, model_type):
+        rest_keys = self._rest_keys(model_type)
+        if getattr(model_type, "_subtype_map", None) or not all(key in rest_keys for key in data):
+            raise _DirectEncodingUnsupported(model_type.__name__)
+        if any(config.get("constant") for config in model_type._validation.values()):
+            raise _DirectEncodingUnsupported(model_type.__name__)
+        serialized = {}
+        for key, (attr, attr_type) in rest_keys.items():
+            value = data.get(key)
+            if value is None or model_type._validation.get(attr, {}).get("readonly", False):
+                continue
+            serialized[key] = self._encode_direct(value, attr_type, True)
+        return serialized
+
+    def _rest_keys(self, model_type):
+        """Map each REST key of a model to its attribute name and type, in _attribute_map order.
+
+        :param type model_type: The model class.
+        :rtype: dict
+        :raises: _DirectEncodingUnsupported if the model uses flattening or additional properties.
+        """
+        try:
+            return self._rest_key_maps[model_type]
+        except KeyError:
+            pass
+        rest_keys = {}
+        for attr, attr_desc in model_type._attribute_map.items():
+            keys = _FLATTEN.split(attr_desc["key"])
+            if attr_desc["key"] == "" or len(keys) != 1:
+                raise _DirectEncodingUnsupported(model_type.__name__)
+            rest_keys[_decode_attribute_map_key(keys[0])] = (attr, attr_desc["type"])
+        self._rest_key_maps[model_type] = rest_keys
+        return rest_keys
+
     def url(self, name, data, data_type, **kwargs):
         """Serialize data intended for a URL path.
 
@@ -1153,17 +1562,7 @@ class Serializer(object):
         try:
             if not attr.tzinfo:
                 _LOGGER.warning("Datetime with no tzinfo will be considered UTC.")
-            utc = attr.utctimetuple()
-            if utc.tm_year > 9999 or utc.tm_year < 1:
-                raise OverflowError("Hit max or min date")
-
-            microseconds = str(attr.microsecond).rjust(6, "0").rstrip("0").ljust(3, "0")
-            if microseconds:
-                microseconds = "." + microseconds
-            date = "{:04}-{:02}-{:02}T{:02}:{:02}:{:02}".format(
-                utc.tm_year, utc.tm_mon, utc.tm_mday, utc.tm_hour, utc.tm_min, utc.tm_sec
-            )
-            return date + microseconds + "Z"
+            return _format_iso_datetime(attr)
         except (ValueError, OverflowError) as err:
             msg = "Unable to serialize datetime object."
             raise SerializationError(msg) from err
@@ -1354,6 +1753,252 @@ def xml_key_extractor(attr, attr_desc, data):
     return children[0]
 
 
+# Errors raised by compiled decoders for input that the generic path reports, or handles itself.
+_COMPILED_DECODING_ERRORS = (DeserializationError, TypeError, ValueError, AttributeError, KeyError)
+
+
+def _build_model_decoder(model_type, fields, readonly_fields, known_keys):
+    """Decoder instantiating a model from its JSON REST dict.
+
+    :param type model_type: The model class.
+    :param tuple fields: (attribute, REST key, value decoder) of the constructor arguments.
+    :param tuple readonly_fields: (attribute, REST key, value decoder) of readonly attributes.
+    :param frozenset known_keys: REST keys of the model, or None to skip additional properties.
+    :rtype: callable
+    """
+
+    def decode(data):
+        get = data.get
+        kwargs = {}
+        for attr, key, decoder in fields:
+            value = get(key)
+            kwargs[attr] = None if value is None else decoder(value)
+        response_obj = model_type(**kwargs)
+        for attr, key, decoder in readonly_fields:
+            value = get(key)
+            setattr(response_obj, attr, None if value is None else decoder(value))
+        if known_keys is not None:
+            missing_keys = data.keys() - known_keys
+            if missing_keys:
+                response_obj.additional_properties = {key: data[key] for key in missing_keys}
+        return response_obj
+
+    return decode
+
+
+class _LazyModel(object):
+    """Per-class state shared by the lazily deserialized instances of a model.
+
+    :ivar dict decoders: Attribute name to (value decoder, generic deserializer) of the deferred attributes.
+    """
+
+    def __init__(self, decoders):
+        self.decoders = decoders
+
+
+class _LazyAttributes(object):
+    """Raw JSON values of the attributes a lazily deserialized instance has not deserialized yet."""
+
+    __slots__ = ("model", "pending")
+
+    def __init__(self, model, pending):
+        self.model = model
+        self.pending = pending
+
+
+class _LazyAttribute(object):
+    """Descriptor of the lazy model subclasses, deserializing an attribute on first access.
+
+    Until then the instance __dict__ holds None for the attribute, in its usual position, and
+    the raw value is kept in ``_lazy_attributes``. Assigning or deleting the attribute discards
+    the raw value. Instances without pending attributes read and write their __dict__ as usual.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        state = instance.__dict__
+        lazy = state.get("_lazy_attributes")
+        if lazy is None or self.name not in lazy.pending:
+            try:
+                return state[self.name]
+            except KeyError:
+                raise AttributeError(  # pylint: disable=raise-missing-from
+                    "'{}' object has no attribute '{}'".format(type(instance).__name__, self.name)
+                )
+        decoder, deserialize = lazy.model.decoders[self.name]
+        raw_value = lazy.pending[self.name]
+        try:
+            value = decoder(raw_value)
+        except _COMPILED_DECODING_ERRORS:
+            value = deserialize(raw_value)  # Raises the DeserializationError the eager path would
+        self.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        state = instance.__dict__
+        state[self.name] = value
+        self._discard(state)
+
+    def __delete__(self, instance):
+        state = instance.__dict__
+        if self.name not in state:
+            raise AttributeError(self.name)
+        del state[self.name]
+        self._discard(state)
+
+    def _discard(self, state):
+        lazy = state.get("_lazy_attributes")
+        if lazy is not None:
+            lazy.pending.pop(self.name, None)
+            if not lazy.pending:
+                del state["_lazy_attributes"]
+
+
+class _LazyModelMixin(object):
+    """Methods of the lazy subclasses of models, deserializing pending attributes before using __dict__."""
+
+    def __eq__(self, other):
+        # Lazy and eager instances of a model compare equal, whichever side the lazy one is on.
+        base = type(self)._lazy_base
+        if isinstance(other, base):
+            self._materialize()
+            if isinstance(other, _LazyModelMixin):
+                other._materialize()
+            return self.__dict__ == other.__dict__
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __str__(self):
+        self._materialize()
+        return str(self.__dict__)
+
+    def __reduce_ex__(self, protocol):
+        # Lazy subclasses cannot be looked up by name, so copies and pickles are of the generated model.
+        self._materialize()
+        return _new_model, (type(self)._lazy_base,), dict(self.__dict__)
+
+    def _materialize(self):
+        """Deserialize the attributes this instance has not deserialized yet."""
+        lazy = self.__dict__.get("_lazy_attributes")
+        if lazy is not None:
+            for attr in list(lazy.pending):
+                getattr(self, attr)
+
+
+def _new_model(model_type):
+    return model_type.__new__(model_type)
+
+
+_LAZY_MODEL_TYPES: Dict[Tuple[type, Tuple[str, ...]], type] = {}
+
+
+def _lazy_model_type(model_type, attrs):
+    """Subclass of a model deserializing the given attributes on access, created once per model.
+
+    The generated model classes are left untouched, so the instances other deserializers create
+    never go through a descriptor.
+
+    :param type model_type: The model class.
+    :param tuple attrs: Names of the deferred attributes.
+    :rtype: type
+    """
+    key = (model_type, attrs)
+    try:
+        return _LAZY_MODEL_TYPES[key]
+    except KeyError:
+        pass
+    namespace = {attr: _LazyAttribute(attr) for attr in attrs}
+    namespace.update(
+        __module__=model_type.__module__,
+        __qualname__=model_type.__qualname__,
+        __doc__=model_type.__doc__,
+        _lazy_base=model_type,
+    )
+    lazy_type = type(model_type.__name__, (_LazyModelMixin, model_type), namespace)
+    return _LAZY_MODEL_TYPES.setdefault(key, lazy_type)
+
+
+def _decode_as_none(_):
+    return None
+
+
+def _build_lazy_model_decoder(model_type, fields, readonly_fields, deferred_fields, known_keys, lazy_model):
+    """Decoder instantiating a model from its JSON REST dict, deferring some attributes until accessed.
+
+    :param type model_type: The model class.
+    :param tuple fields: (attribute, REST key, value decoder) of the constructor arguments.
+    :param tuple readonly_fields: (attribute, REST key, value decoder) of readonly attributes.
+    :param tuple deferred_fields: (attribute, REST key, shape check) of the attributes deserialized
+     on access. Values failing their shape check are deserialized straight away, so that invalid
+     input is reported by the decoder.
+    :param frozenset known_keys: REST keys of the model, or None to skip additional properties.
+    :param _LazyModel lazy_model: Shared state of the model's lazy instances.
+    :rtype: callable
+    """
+    eager_decode = _build_model_decoder(model_type, fields, readonly_fields, None)
+    decoders = lazy_model.decoders
+
+    def decode(data):
+        response_obj = eager_decode(data)
+        state = response_obj.__dict__
+        get = data.get
+        pending = {}
+        for attr, key, check in deferred_fields:
+            value = get(key)
+            if value is None:
+                continue
+            if check(value):
+                pending[attr] = value
+            else:
+                state[attr] = decoders[attr][0](value)
+        if pending:
+            state["_lazy_attributes"] = _LazyAttributes(lazy_model, pending)
+        if known_keys is not None:
+            missing_keys = data.keys() - known_keys
+            if missing_keys:
+                response_obj.additional_properties = {key: data[key] for key in missing_keys}
+        return response_obj
+
+    return decode
+
+
+def _is_list(data):
+    return type(data) is list  # pylint: disable=unidiomatic-typecheck
+
+
+def _is_dict(data):
+    return type(data) is dict  # pylint: disable=unidiomatic-typecheck
+
+
+def _is_any(_):
+    return True
+
+
+def _build_shared_model_decoder(model_type, decoder, intern_cache):
+    """Decoder returning one shared instance per distinct JSON dict whose values are all strings.
+
+    :param type model_type: The model class.
+    :param callable decoder: Decoder instantiating the model.
+    :param intern_cache: The getcontext.interning.InternCache holding the instances.
+    :rtype: callable
+    """
+    instance = intern_cache.instance
+
+    def decode(data):
+        for value in data.values():
+            if type(value) is not str:  # pylint: disable=unidiomatic-typecheck
+                return decoder(data)
+        return instance((model_type, tuple(data.items())), lambda: decoder(data))
+
+    return decode
+
+
 class Deserializer(object):
     """Response object model deserializer.
 
@@ -1394,6 +2039,13 @@ class Deserializer(object):
         # used if your expect the deserialization to NOT come from a JSON REST syntax.
         # Otherwise, result are unexpected
         self.additional_properties_detection = True
+        self._model_decoders: Dict[Tuple[type, int, bool, bool, Any], Optional[Callable[[Dict[str, Any]], Any]]] = {}
+        # Decodes JSON response bodies straight from their bytes when set, instead of json.loads.
+        self.json_loads: Optional[Callable[[Any], Any]] = None
+        # Defers deserializing nested models, collections and dates of JSON responses until accessed.
+        self.lazy_models = False
+        # Shares repeated strings and small models between responses when set, see getcontext.interning.
+        self.intern_cache: Optional[Any] = None
 
     def __call__(self, target_obj, response_data, content_type=None):
         """Call the deserializer to process a REST response.
@@ -1404,7 +2056,7 @@ class Deserializer(object):
         :raises: DeserializationError if deserialization fails.
         :return: Deserialized object.
         """
-        data = self._unpack_content(response_data, content_type)
+        data = self._unpack_content(response_data, content_type, self.json_loads)
         return self._deserialize(target_obj, data)
 
     def _deserialize(self, target_obj, data):
@@ -1445,6 +2097,21 @@ class Deserializer(object):
 
         if data is None or data is CoreNull:
             return data
+
+        if (
+            isinstance(data, dict)
+            and isinstance(response, type)
+            and issubclass(response, Model)
+            and self.key_extractors == [rest_key_extractor, xml_key_extractor]
+        ):
+            decoder = self._model_decoder(response)
+            if decoder is not None:
+                try:
+                    return decoder(data)
+                except _COMPILED_DECODING_ERRORS as err:
+                    # Let the generic path below deserialize the data, or report the error.
+                    _LOGGER.debug("Deserializing %s through the generic path: %r", response.__name__, err)
+
         try:
             attributes = response._attribute_map  # type: ignore
             d_attrs = {}
@@ -1480,6 +2147,206 @@ class Deserializer(object):
             additional_properties = self._build_additional_properties(attributes, data)
             return self._instantiate_model(response, d_attrs, additional_properties)
 
+    def _model_decoder(self, model_type):
+        """Decoder built once from a model's _attribute_map, instantiating it from a JSON REST dict.
+
+        Equivalent to _deserialize() with the default key extractors. Polymorphic and
+        flattened models have no decoder.
+
+        :param type model_type: The model class.
+        :rtype: callable or None
+        """
+        # The map length is part of the key, since enable_additional_properties_sending() mutates it.
+        attribute_map = model_type._attribute_map
+        intern_cache = self.intern_cache
+        cache_key = (
+            model_type,
+            len(attribute_map),
+            self.additional_properties_detection,
+            self.lazy_models,
+            intern_cache,
+        )
+        try:
+            return self._model_decoders[cache_key]
+        except KeyError:
+            pass
+        decoder = None
+        if not getattr(model_type, "_subtype_map", None):
+            validation = model_type._validation
+            fields = []
+            readonly_fields = []
+            deferred_fields = []
+            lazy_decoders = {}
+            # Models storing their attributes in __slots__ have no instance __dict__ to defer them in.
+            lazy = self.lazy_models and not getattr(model_type, "__slots__", ())
+            for attr, attr_desc in attribute_map.items():
+                key = attr_desc["key"]
+                if attr == "additional_properties" and key == "":
+                    continue
+                if "." in key:
+                    keys = _FLATTEN.split(key)
+                    if len(keys) != 1:
+                        break
+                    key = _decode_attribute_map_key(keys[0])
+                if validation.get(attr, {}).get("constant"):
+                    continue
+                if intern_cache is not None:
+                    field = (attr, key, self._interning_decoder(attr, attr_desc["type"]))
+                else:
+                    field = (attr, key, self._type_decoder(attr_desc["type"]))
+                check = self._deferred_check(attr_desc["type"]) if lazy else None
+                if check is not None:
+                    # Constructed as None, and the raw value kept until accessed.
+                    lazy_decoders[attr] = (
+                        field[2],
+                        functools.partial(self.deserialize_data, data_type=attr_desc["type"]),
+                    )
+                    deferred_fields.append((attr, key, check))
+                    field = (attr, key, _decode_as_none)
+                if validation.get(attr, {}).get("readonly"):
+                    readonly_fields.append(field)
+                else:
+                    fields.append(field)
+            else:
+                known_keys = None
+                if self.additional_properties_detection and (
+                    "additional_properties" not in attribute_map or attribute_map["additional_properties"]["key"] == ""
+                ):
+                    known_keys = frozenset(
+                        _decode_attribute_map_key(_FLATTEN.split(desc["key"])[0])
+                        for desc in attribute_map.values()
+                        if desc["key"] != ""
+                    )
+                if deferred_fields:
+                    decoder = _build_lazy_model_decoder(
+                        _lazy_model_type(model_type, tuple(attr for attr, _, _ in deferred_fields)),
+                        tuple(fields),
+                        tuple(readonly_fields),
+                        tuple(deferred_fields),
+                        known_keys,
+                        _LazyModel(lazy_decoders),
+                    )
+                else:
+                    decoder = _build_model_decoder(model_type, tuple(fields), tuple(readonly_fields), known_keys)
+                if intern_cache is not None and (
+                    model_type.__name__ in intern_cache.models
+                    or any(self.dependencies.get(name) is model_type for name in intern_cache.models)
+                ):
+                    decoder = _build_shared_model_decoder(model_type, decoder, intern_cache)
+        self._model_decoders[cache_key] = decoder
+        return decoder
+
+    def _interning_decoder(self, attr, data_type):
+        """Like _type_decoder(), interning dict keys, and the value of the string fields of intern_cache.
+
+        :param str attr: The attribute name.
+        :param str data_type: The type to deserialize to.
+        :rtype: callable
+        """
+        intern_string = self.intern_cache.string  # type: ignore
+        decoder = self._type_decoder(data_type)
+        if data_type == "str" and attr in self.intern_cache.string_fields:  # type: ignore
+            return lambda data: intern_string(decoder(data))
+        if len(data_type) > 1 and data_type[0] + data_type[-1] == "{}":
+            value_decoder = self._type_decoder(data_type[1:-1])
+
+            def decode_dict(data):
+                if not isinstance(data, dict):
+                    return decoder(data)
+                return {
+                    intern_string(key): None if value is None else value_decoder(value) for key, value in data.items()
+                }
+
+            return decode_dict
+        return decoder
+
+    def _deferred_check(self, data_type):
+        """Shape check of the raw values lazy models defer for an attribute type, or None if not deferred.
+
+        Nested models, lists, dicts and objects are deferred. Other values are cheap to deserialize,
+        or can only be validated by deserializing them.
+
+        :param str data_type: The attribute type.
+        :rtype: callable or None
+        """
+        if data_type == "object":
+            return _is_any
+        if len(data_type) > 1 and data_type[0] + data_type[-1] == "[]":
+            return _is_list
+        if len(data_type) > 1 and data_type[0] + data_type[-1] == "{}":
+            return _is_dict
+        target = self.dependencies.get(data_type)
+        if isinstance(target, type) and issubclass(target, Model):
+            return _is_dict
+        return None
+
+    def _type_decoder(self, data_type):
+        """Function deserializing a non-None JSON value of the given type, as deserialize_data() would.
+
+        :param str data_type: The type to deserialize to.
+        :rtype: callable
+        """
+        if not data_type:
+            return lambda data: data
+        basic_type = {name: type_ for type_, name in self.basic_types.items()}.get(data_type)
+        if basic_type is not None:
+            deserialize_basic = self.deserialize_basic
+
+            def decode_basic(data):
+                # pylint: disable=unidiomatic-typecheck
+                return data if type(data) is basic_type else deserialize_basic(data, data_type)
+
+            return decode_basic
+        if data_type in self.deserialize_type and data_type not in ("[]", "{}"):
+            deserialize = self.deserialize_type[data_type]
+            expected_types = self.deserialize_expected_types.get(data_type, tuple())
+            if not expected_types:
+                return deserialize
+            return lambda data: data if isinstance(data, expected_types) else deserialize(data)
+        if len(data_type) > 1 and data_type[0] + data_type[-1] == "[]":
+            item_decoder = self._type_decoder(data_type[1:-1])
+
+            def decode_list(data):
+                if not isinstance(data, (list, set)):
+                    raise DeserializationError(
+                        "Cannot deserialize as [{}] an object of type {}".format(data_type[1:-1], type(data))
+                    )
+                return [None if item is None else item_decoder(item) for item in data]
+
+            return decode_list
+        if len(data_type) > 1 and data_type[0] + data_type[-1] == "{}":
+            value_decoder = self._type_decoder(data_type[1:-1])
+            deserialize_dict = self.deserialize_dict
+
+            def decode_dict(data):
+                if not isinstance(data, dict):
+                    return deserialize_dict(data, data_type[1:-1])
+                return {key: None if value is None else value_decoder(value) for key, value in data.items()}
+
+            return decode_dict
+
+        target = self.dependencies.get(data_type)
+        if isinstance(target, type) and issubclass(target, Enum):
+            members = {member.value: member for member in target if isinstance(member.value, str)}
+
+            def decode_enum(data):
+                # pylint: disable=unidiomatic-typecheck
+                member = members.get(data) if type(data) is str else None
+                return member if member is not None else Deserializer.deserialize_enum(data, target)
+
+            return decode_enum
+        if isinstance(target, type) and issubclass(target, Model):
+
+            def decode_model(data):
+                if isinstance(data, dict):
+                    decoder = self._model_decoder(target)
+                    if decoder is not None:
+                        return decoder(data)
+                return self._deserialize(target, data)
+
+            return decode_model
+        return functools.partial(self.deserialize_data, data_type=data_type)
+
     def _build_additional_properties(self, attribute_map, data):
         if not self.additional_properties_detection:
             return None
@@ -1541,7 +2408,7 @@ class Deserializer(object):
             return None
 
     @staticmethod
-    def _unpack_content(raw_data, content_type=None):
+    def _unpack_content(raw_data, content_type=None, json_loads=None):
         """Extract the correct structure for deserialization.
 
         If raw_data is a PipelineResponse, try to extract the result of RawDeserializer.
@@ -1554,6 +2421,8 @@ class Deserializer(object):
 
         :param raw_data: Data to be processed.
         :param content_type: How to parse if raw_data is a string/bytes.
+        :param json_loads: Decodes JSON from bytes instead of json.loads. The bytes of an HTTP response
+         are then decoded without reading them as text first.
         :raises JSONDecodeError: If JSON is requested and parsing is impossible.
         :raises UnicodeDecodeError: If bytes is not UTF8
         """
@@ -1564,6 +2433,10 @@ class Deserializer(object):
                 return context[RawDeserializer.CONTEXT_NAME]
             raise ValueError("This pipeline didn't have the RawDeserializer policy; can't deserialize")
 
+        # Assume this is enough to recognize a loaded azure.core.rest.HttpResponse
+        if json_loads is not None and hasattr(raw_data, "content") and hasattr(raw_data, "headers"):
+            return RawDeserializer.deserialize_from_http_generics(raw_data.content, raw_data.headers, json_loads)
+
         # Assume this is enough to recognize universal_http.ClientResponse without importing it
         if hasattr(raw_data, "body"):
             return RawDeserializer.deserialize_from_http_generics(raw_data.text(), raw_data.headers)
@@ -1573,7 +2446,7 @@ class Deserializer(object):
             return RawDeserializer.deserialize_from_http_generics(raw_data.text, raw_data.headers)
 
         if isinstance(raw_data, (str, bytes)) or hasattr(raw_data, "read"):
-            return RawDeserializer.deserialize_from_text(raw_data, content_type)  # type: ignore
+            return RawDeserializer.deserialize_from_text(raw_data, content_type, json_loads)  # type: ignore
         return raw_data
 
     def _instantiate_model(self, response, attrs, additional_properties=None):
@@ -1946,6 +2819,10 @@ class Deserializer(object):
     def deserialize_iso(attr):
         """Deserialize ISO-8601 formatted string into Datetime object.
 
+        Strings such as ``2024-01-02T03:04:05.678Z`` or ``...+05:30`` get a
+        :class:`datetime.timezone` tzinfo, not one of isodate's tzinfo classes. Other
+        ISO-8601 strings are still parsed by isodate.
+
         :param str attr: response string to be deserialized.
         :rtype: Datetime
         :raises: DeserializationError if string format invalid.
@@ -1953,31 +2830,12 @@ class Deserializer(object):
         if isinstance(attr, ET.Element):
             attr = attr.text
         try:
-            attr = attr.upper()  # type: ignore
-            match = Deserializer.valid_date.match(attr)
-            if not match:
-                raise ValueError("Invalid datetime string: " + attr)
-
-            check_decimal = attr.split(".")
-            if len(check_decimal) > 1:
-                decimal_str = ""
-                for digit in check_decimal[1]:
-                    if digit.isdigit():
-                        decimal_str += digit
-                    else:
-                        break
-                if len(decimal_str) > 6:
-                    attr = attr.replace(decimal_str, decimal_str[0:6])
-
-            date_obj = isodate.parse_datetime(attr)
-            test_utc = date_obj.utctimetuple()
-            if test_utc.tm_year > 9999 or test_utc.tm_year < 1:
-                raise OverflowError("Hit max or min date")
+            if type(attr) is str:  # pylint: disable=unidiomatic-typecheck
+                return _parse_iso_datetime_cached(attr)
+            return _parse_iso_datetime(attr)
         except (ValueError, OverflowError, AttributeError) as err:
             msg = "Cannot deserialize datetime object."
             raise DeserializationError(msg) from err
-        else:
-            return date_obj
 
     @staticmethod
     def deserialize_unix(attr):
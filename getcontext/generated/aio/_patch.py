@@ -6,9 +6,518 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+import datetime
+from typing import Any, Awaitable, Dict, List, Optional, Type, TYPE_CHECKING, Union
+
+from azure.core.exceptions import (
+    ClientAuthenticationError,
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+    ResourceNotModifiedError,
+    map_error,
+)
+from azure.core.pipeline import PipelineResponse
+from azure.core.rest import AsyncHttpResponse, HttpRequest
+from azure.core.tracing.decorator_async import distributed_trace_async
+
+from ._client import ContextAPI as ContextAPIGenerated
+from ._configuration import ContextAPIConfiguration
+from .._patch import _check_same_kwargs
+from ..models import COMPACT_MODELS, ConversationResponse
+from ..operations._operations import MutableMapping, build_context_api_conversations_request
+from ...background import AsyncBackgroundLogger
+from ...bodies import copy_request
+from ...caching import ConversationCache, _response_and_value, get_conversation_cache
+from ...coalesce import AsyncUpsertCoalescer
+from ...columnar import MessageTable, MessageTableBuilder
+from ...interning import InternCache, get_intern_cache
+from ...json_backends import JSONBackend, StdlibJSONBackend, get_json_backend
+from ...paging import AsyncConversationFanOut, AsyncConversationPager
+from ...policies import (
+    AdaptiveSampler,
+    AsyncRateLimitPolicy,
+    RequestCompressionPolicy,
+    _insert_policies,
+    _policies_without_content_decoding,
+)
+from ...sharding import AsyncShardedConversationExport, TimeShard
+from ...streaming import AsyncConversationStream
+from ...threads import AsyncThreadTracker
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from azure.core.credentials_async import AsyncTokenCredential
+
+
+class ContextAPI(ContextAPIGenerated):  # pylint: disable=client-accepts-api-version-keyword
+    """ContextAPI.
+
+    Unlike the sync client, this client takes no ``spool``: the on-disk spool of
+    :mod:`getcontext.spool` is sync-only. Async callers can spool failed calls themselves
+    with :meth:`~getcontext.spool.Spool.append`, and replay them through a sync client.
+
+    :ivar evaluations: EvaluationsOperations operations
+    :vartype evaluations: context_api.aio.operations.EvaluationsOperations
+    :ivar log: LogOperations operations
+    :vartype log: context_api.aio.operations.LogOperations
+    :param credential: Credential needed for the client to connect to Azure. Required.
+    :type credential: ~azure.core.credentials_async.AsyncTokenCredential
+    :keyword endpoint: Service URL. Default value is "https://api.context.ai".
+    :paramtype endpoint: str
+    :keyword close_timeout: Seconds to wait for the background logger to drain when the client
+     is closed. Default value is None, which waits indefinitely.
+    :paramtype close_timeout: float
+    :keyword request_compression: Policy that gzips large request bodies. Default value is None.
+    :paramtype request_compression: ~getcontext.policies.RequestCompressionPolicy
+    :keyword rate_limit: Token-bucket rate limit for ``log`` calls. Default value is None.
+    :paramtype rate_limit: ~getcontext.policies.AsyncRateLimitPolicy
+    :keyword sampler: Adaptive sampler that drops a share of ``log`` calls. Default value is None.
+    :paramtype sampler: ~getcontext.policies.AdaptiveSampler
+    :keyword json_backend: Encodes ``log`` request bodies and decodes response bodies: a
+     :class:`~getcontext.json_backends.JSONBackend`, ``"json"``, ``"orjson"`` or ``"auto"``.
+     With a backend other than ``"json"``, responses are decoded by the backend alone and the
+     pipeline has no ``ContentDecodePolicy``, so ``deserialized_data`` is not set in the context of
+     pipeline responses. Default value is "json".
+    :paramtype json_backend: str or ~getcontext.json_backends.JSONBackend
+    :keyword lazy_models: Whether response models defer deserializing nested models, lists and
+     dicts until they are first accessed. The models are then instances of subclasses of the
+     generated models. Default value is False.
+    :paramtype lazy_models: bool
+    :keyword compact_models: Whether responses use the compact ``__slots__`` variants of
+     high-cardinality models, such as :class:`~getcontext.generated.models.CompactMessageResponse`
+     for ``MessageResponse``. Default value is False.
+    :paramtype compact_models: bool
+    :keyword intern_cache: Shares repeated topics, metadata keys and role and language strings
+     between deserialized responses, or True for a cache with the default settings. Default value is None.
+    :paramtype intern_cache: ~getcontext.interning.InternCache or bool
+    :keyword conversation_cache: Caches ``conversation(id)`` responses, or True for a cache with
+     the default settings. Default value is None.
+    :paramtype conversation_cache: ~getcontext.caching.ConversationCache or bool
+    """
+
+    def __init__(
+        self, credential: "AsyncTokenCredential", *, endpoint: str = "https://api.context.ai", **kwargs: Any
+    ) -> None:
+        if "spool" in kwargs:
+            raise TypeError("The aio ContextAPI does not support 'spool'; it is only available on the sync client.")
+        self._close_timeout: Optional[float] = kwargs.pop("close_timeout", None)
+        request_compression: Optional[RequestCompressionPolicy] = kwargs.pop("request_compression", None)
+        rate_limit: Optional[AsyncRateLimitPolicy] = kwargs.pop("rate_limit", None)
+        sampler: Optional[AdaptiveSampler] = kwargs.pop("sampler", None)
+        json_backend: JSONBackend = get_json_backend(kwargs.pop("json_backend", None))
+        lazy_models: bool = kwargs.pop("lazy_models", False)
+        compact_models: bool = kwargs.pop("compact_models", False)
+        intern_cache: Optional[InternCache] = get_intern_cache(kwargs.pop("intern_cache", None))
+        conversation_cache: Optional[ConversationCache] = get_conversation_cache(kwargs.pop("conversation_cache", None))
+        if kwargs.get("policies") is None and not isinstance(json_backend, StdlibJSONBackend):
+            # Response bodies are decoded by the backend, so stdlib decoding in the pipeline would be wasted.
+            config = ContextAPIConfiguration(credential=credential, **kwargs)
+            kwargs["policies"] = _policies_without_content_decoding(config, kwargs)
+        if request_compression is not None:
+            _insert_policies(kwargs, "per_call_policies", request_compression)
+        if rate_limit is not None or sampler is not None:
+            _insert_policies(kwargs, "per_retry_policies", rate_limit, sampler)
+        super().__init__(credential, endpoint=endpoint, **kwargs)
+        self._config.request_compression = request_compression
+        self._config.rate_limit = rate_limit
+        self._config.sampler = sampler
+        self._config.json_backend = json_backend
+        self._deserialize.json_loads = json_backend.loads
+        self._deserialize.lazy_models = lazy_models
+        if compact_models:
+            self._deserialize.dependencies.update(COMPACT_MODELS)
+        self._config.intern_cache = intern_cache
+        self._deserialize.intern_cache = intern_cache
+        self._config.endpoint = endpoint
+        self._config.conversation_cache = conversation_cache
+        self._background_logger: Optional[AsyncBackgroundLogger] = None
+        self._background_logger_kwargs: Dict[str, Any] = {}
+        self._thread_tracker: Optional[AsyncThreadTracker] = None
+        self._thread_tracker_kwargs: Dict[str, Any] = {}
+        self._upsert_coalescer: Optional[AsyncUpsertCoalescer] = None
+        self._upsert_coalescer_kwargs: Dict[str, Any] = {}
+
+    def send_request(
+        self, request: HttpRequest, *, stream: bool = False, **kwargs: Any
+    ) -> Awaitable[AsyncHttpResponse]:
+        """Runs the network request through the client's chained policies.
+
+        The request is copied, so that policies don't modify it, but its body is shared with
+        the copy rather than deep-copied. Don't modify a ``bytearray`` or ``memoryview`` body
+        until the call returns.
+
+        :param request: The network request you want to make. Required.
+        :type request: ~azure.core.rest.HttpRequest
+        :keyword bool stream: Whether the response payload will be streamed. Defaults to False.
+        :return: The response of your network call. Does not do error handling on your response.
+        :rtype: ~azure.core.rest.AsyncHttpResponse
+        """
+        request_copy = copy_request(request)
+        request_copy.url = self._client.format_url(request_copy.url)
+        return self._client.send_request(request_copy, stream=stream, **kwargs)  # type: ignore
+
+    async def conversation(  # type: ignore[override]
+        self, id: str, *, authorization: Optional[str] = None, **kwargs: Any
+    ) -> ConversationResponse:
+        """Returns conversation details, from the client's ``conversation_cache`` when it has them.
+
+        Without a cache, or with a ``cls`` callback, this is the generated operation. Otherwise a
+        fresh cached response is returned without a request, and a stale one that has validators
+        is revalidated with ``If-None-Match``/``If-Modified-Since``.
+
+        :param id: Required.
+        :type id: str
+        :keyword authorization: Default value is None.
+        :paramtype authorization: str
+        :return: ConversationResponse
+        :rtype: ~context_api.models.ConversationResponse
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        cache = self._config.conversation_cache
+        if cache is None or "cls" in kwargs:
+            return await super().conversation(id, authorization=authorization, **kwargs)
+        key = (self._config.endpoint, authorization, id)
+        entry, fresh = cache.lookup(key)
+        if fresh:
+            return entry.value  # type: ignore[union-attr]
+        headers = cache.conditional_headers(entry, kwargs.pop("headers", None))
+        try:
+            response, deserialized = await super().conversation(
+                id, authorization=authorization, headers=headers, cls=_response_and_value, **kwargs
+            )
+        except ResourceNotModifiedError:
+            if entry is None:
+                raise
+            return cache.revalidated(key, entry)
+        cache.store(key, deserialized, response.headers, len(response.content))
+        return deserialized
+
+    @distributed_trace_async
+    async def stream_conversations(
+        self,
+        *,
+        authorization: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        **kwargs: Any
+    ) -> AsyncConversationStream:
+        """Returns a page of conversations, deserialized incrementally as the response body arrives.
+
+        Takes the same keywords as :meth:`conversations`. Iterating the result yields each
+        conversation as soon as it is received, so memory stays bounded by one conversation
+        for any ``per_page``. The page's pagination is available once the iteration is complete.
+
+        :keyword authorization: Default value is None.
+        :paramtype authorization: str
+        :keyword start_time: Limits returned conversations to those that occurred after given time.
+         Must be ISO 8601. Default value is None.
+        :paramtype start_time: str
+        :keyword end_time: Limits returned conversations to those that occurred before given time.
+         Must be ISO 8601. Default value is None.
+        :paramtype end_time: str
+        :keyword page: Page number of results to return. Default value is None.
+        :paramtype page: int
+        :keyword per_page: Number of results to return per page. Default value is None.
+        :paramtype per_page: int
+        :keyword tenant_id: Filter by tenant id. Default value is None.
+        :paramtype tenant_id: int
+        :return: The conversations of the page.
+        :rtype: ~getcontext.streaming.AsyncConversationStream
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _request = build_context_api_conversations_request(
+            authorization=authorization,
+            start_time=start_time,
+            end_time=end_time,
+            page=page,
+            per_page=per_page,
+            tenant_id=tenant_id,
+            headers=kwargs.pop("headers", {}) or {},
+            params=kwargs.pop("params", {}) or {},
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
+            _request, stream=True, **kwargs
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            await response.read()
+            map_error(status_code=response.status_code, response=response, error_map=error_map)
+            raise HttpResponseError(response=response)
+
+        return AsyncConversationStream(response, self._deserialize, self._deserialize.json_loads)
+
+    async def conversations_table(self, **kwargs: Any) -> MessageTable:
+        """Returns the messages of a page of conversations as a columnar table.
+
+        Takes the same keywords as :meth:`conversations`. The page is decoded from JSON in one
+        call, and no model is created for any conversation or message. To build one table over
+        several pages, add each page's :meth:`~getcontext.streaming.AsyncConversationStream.read_json`
+        to a :class:`~getcontext.columnar.MessageTableBuilder`.
+
+        :return: The messages of the page.
+        :rtype: ~getcontext.columnar.MessageTable
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        builder = MessageTableBuilder()
+        stream = await self.stream_conversations(**kwargs)
+        builder.extend(await stream.read_json())
+        return builder.build()
+
+    def iter_conversations(
+        self,
+        *,
+        authorization: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        per_page: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        prefetch: int = 1,
+        **kwargs: Any
+    ) -> AsyncConversationPager:
+        """Iterates over the conversations of every page, fetching the next pages while one is consumed.
+
+        Takes the same keywords as :meth:`conversations`, except ``page``. Up to ``prefetch``
+        pages after the current one are requested as tasks, so the next page is usually
+        ready by the time the current one has been consumed. Use the pager with ``async with``
+        to cancel the pending fetches as soon as the iteration is left early.
+
+        :keyword authorization: Default value is None.
+        :paramtype authorization: str
+        :keyword start_time: Limits returned conversations to those that occurred after given time.
+         Must be ISO 8601. Default value is None.
+        :paramtype start_time: str
+        :keyword end_time: Limits returned conversations to those that occurred before given time.
+         Must be ISO 8601. Default value is None.
+        :paramtype end_time: str
+        :keyword per_page: Number of results to return per page. Default value is None.
+        :paramtype per_page: int
+        :keyword tenant_id: Filter by tenant id. Default value is None.
+        :paramtype tenant_id: int
+        :keyword int prefetch: Pages fetched ahead of the one being consumed. Default value is 1.
+        :return: The conversations of all pages.
+        :rtype: ~getcontext.paging.AsyncConversationPager
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+
+        def fetch(page: int) -> Any:
+            return self.conversations(
+                authorization=authorization,
+                start_time=start_time,
+                end_time=end_time,
+                page=page,
+                per_page=per_page,
+                tenant_id=tenant_id,
+                **kwargs
+            )
+
+        return AsyncConversationPager(fetch, prefetch=prefetch)
+
+    def fetch_all_conversations(
+        self,
+        *,
+        authorization: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        per_page: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        concurrency: int = 8,
+        ordered: bool = True,
+        page_retries: int = 3,
+        **kwargs: Any
+    ) -> AsyncConversationFanOut:
+        """Fetches every page of conversations, requesting the remaining pages concurrently.
+
+        Takes the same keywords as :meth:`conversations`, except ``page``. The first page is
+        fetched to learn the page count, then up to ``concurrency`` pages are fetched at a
+        time as tasks over the client's connection pool. Pages failing with a retryable error are
+        fetched again up to ``page_retries`` times without restarting the others.
+
+        :keyword authorization: Default value is None.
+        :paramtype authorization: str
+        :keyword start_time: Limits returned conversations to those that occurred after given time.
+         Must be ISO 8601. Default value is None.
+        :paramtype start_time: str
+        :keyword end_time: Limits returned conversations to those that occurred before given time.
+         Must be ISO 8601. Default value is None.
+        :paramtype end_time: str
+        :keyword per_page: Number of results to return per page. Default value is None.
+        :paramtype per_page: int
+        :keyword tenant_id: Filter by tenant id. Default value is None.
+        :paramtype tenant_id: int
+        :keyword int concurrency: Pages fetched at the same time. Default value is 8.
+        :keyword bool ordered: Whether pages are yielded in page order rather than as they
+         complete. Default value is True.
+        :keyword int page_retries: Times a failed page is fetched again. Default value is 3.
+        :return: The conversations of all pages. Use ``iter_pages()`` for the page responses.
+        :rtype: ~getcontext.paging.AsyncConversationFanOut
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+
+        def fetch(page: int) -> Any:
+            return self.conversations(
+                authorization=authorization,
+                start_time=start_time,
+                end_time=end_time,
+                page=page,
+                per_page=per_page,
+                tenant_id=tenant_id,
+                **kwargs
+            )
+
+        return AsyncConversationFanOut(fetch, concurrency=concurrency, ordered=ordered, page_retries=page_retries)
+
+    def export_conversations(
+        self,
+        *,
+        start_time: Union[str, datetime.datetime],
+        end_time: Optional[Union[str, datetime.datetime]] = None,
+        authorization: Optional[str] = None,
+        per_page: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        shards: int = 8,
+        concurrency: int = 8,
+        max_shard_records: int = 10000,
+        min_shard_duration: datetime.timedelta = datetime.timedelta(seconds=1),
+        page_retries: int = 3,
+        **kwargs: Any
+    ) -> AsyncShardedConversationExport:
+        """Exports the conversations of a time range as concurrently paginated time shards.
+
+        The range is split into ``shards`` windows, each paginated on its own with up to
+        ``concurrency`` windows fetched at a time as tasks. Windows reporting more than
+        ``max_shard_records`` records are split further. Conversations are yielded window by
+        window in time order, and a conversation returned by two windows is yielded once.
+
+        :keyword start_time: Start of the range, as a datetime or ISO 8601 string. Required.
+        :paramtype start_time: str or ~datetime.datetime
+        :keyword end_time: End of the range. Default value is None, for now.
+        :paramtype end_time: str or ~datetime.datetime
+        :keyword authorization: Default value is None.
+        :paramtype authorization: str
+        :keyword per_page: Number of results to return per page. Default value is None.
+        :paramtype per_page: int
+        :keyword tenant_id: Filter by tenant id. Default value is None.
+        :paramtype tenant_id: int
+        :keyword int shards: Number of windows the range is split into initially. Default value is 8.
+        :keyword int concurrency: Windows fetched at the same time. Default value is 8.
+        :keyword int max_shard_records: Records above which a window is split. Default value is 10000.
+        :keyword min_shard_duration: Duration below which windows are not split. Default value
+         is one second.
+        :paramtype min_shard_duration: ~datetime.timedelta
+        :keyword int page_retries: Times a failed page is fetched again. Default value is 3.
+        :return: The conversations of the range.
+        :rtype: ~getcontext.sharding.AsyncShardedConversationExport
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+
+        def fetch(shard: TimeShard, page: int) -> Any:
+            return self.conversations(
+                authorization=authorization,
+                start_time=shard.start_time,
+                end_time=shard.end_time,
+                page=page,
+                per_page=per_page,
+                tenant_id=tenant_id,
+                **kwargs
+            )
+
+        return AsyncShardedConversationExport(
+            fetch,
+            start_time,
+            end_time,
+            shards=shards,
+            concurrency=concurrency,
+            max_shard_records=max_shard_records,
+            min_shard_duration=min_shard_duration,
+            page_retries=page_retries,
+        )
+
+    def background_logger(self, **kwargs: Any) -> AsyncBackgroundLogger:
+        """Returns the client's background logger, creating it on first use.
+
+        The logger is drained when the client is closed. Keyword arguments are passed to
+        :class:`~getcontext.background.AsyncBackgroundLogger` on first use. Later calls take no
+        keyword arguments, or the same ones.
+
+        :return: The background logger.
+        :rtype: ~getcontext.background.AsyncBackgroundLogger
+        :raises ValueError: If the logger was already created with other keyword arguments.
+        """
+        if self._background_logger is None:
+            self._background_logger = AsyncBackgroundLogger(self.log, **kwargs)
+            self._background_logger_kwargs = kwargs
+        else:
+            _check_same_kwargs("background_logger", self._background_logger_kwargs, kwargs)
+        return self._background_logger
+
+    def thread_tracker(self, **kwargs: Any) -> AsyncThreadTracker:
+        """Returns the client's thread tracker, creating it on first use.
+
+        Keyword arguments are passed to :class:`~getcontext.threads.AsyncThreadTracker` on first use.
+        Later calls take no keyword arguments, or the same ones.
+
+        :return: The thread tracker.
+        :rtype: ~getcontext.threads.AsyncThreadTracker
+        :raises ValueError: If the tracker was already created with other keyword arguments.
+        """
+        if self._thread_tracker is None:
+            self._thread_tracker = AsyncThreadTracker(self.log, **kwargs)
+            self._thread_tracker_kwargs = kwargs
+        else:
+            _check_same_kwargs("thread_tracker", self._thread_tracker_kwargs, kwargs)
+        return self._thread_tracker
+
+    def upsert_coalescer(self, **kwargs: Any) -> AsyncUpsertCoalescer:
+        """Returns the client's upsert coalescer, creating it on first use.
+
+        Pending upserts are sent when the client is closed. Keyword arguments are passed to
+        :class:`~getcontext.coalesce.AsyncUpsertCoalescer` on first use. Later calls take no
+        keyword arguments, or the same ones.
+
+        :return: The upsert coalescer.
+        :rtype: ~getcontext.coalesce.AsyncUpsertCoalescer
+        :raises ValueError: If the coalescer was already created with other keyword arguments.
+        """
+        if self._upsert_coalescer is None:
+            self._upsert_coalescer = AsyncUpsertCoalescer(self.log, **kwargs)
+            self._upsert_coalescer_kwargs = kwargs
+        else:
+            _check_same_kwargs("upsert_coalescer", self._upsert_coalescer_kwargs, kwargs)
+        return self._upsert_coalescer
+
+    async def _close_sinks(self) -> None:
+        if self._background_logger is not None:
+            await self._background_logger.aclose(self._close_timeout)
+        if self._upsert_coalescer is not None:
+            await self._upsert_coalescer.aclose()
+
+    async def close(self) -> None:
+        await self._close_sinks()
+        await super().close()
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self._close_sinks()
+        await super().__aexit__(*exc_details)
+
+
+__all__: List[str] = ["ContextAPI"]  # Add all objects you want publicly available to users at this package level
 
 
 def patch_sdk():
@@ -6,9 +6,75 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from io import IOBase
+from typing import Any, IO, List, Optional, Union
+
+from ... import models as _models
+from ._operations import LogOperations as LogOperationsGenerated
+from ...operations._patch import _BODY_TYPES, _DEFAULT_JSON_BACKEND, _prepare_raw_body
+from ....bodies import RawBody
+
+
+class LogOperations(LogOperationsGenerated):
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~context_api.aio.ContextAPI`'s
+        :attr:`log` attribute.
+
+    When the client was created with a ``sampler``, ``conversation``, ``conversation_upsert``
+    and ``conversation_thread`` calls it drops are not sent and return None. Pass
+    ``sample_key`` to a call to sample on your own conversation identity.
+
+    Model and dict bodies are encoded to JSON bytes with the client's ``json_backend``.
+    Already encoded bodies can be passed as a :class:`~getcontext.bodies.RawBody`, which
+    wraps ``bytes``, a ``memoryview`` or a file region and is sent without being copied.
+    """
+
+    async def conversation(  # type: ignore[override]  # pylint: disable=inconsistent-return-statements
+        self,
+        body: Optional[
+            Union[_models.PathsLi5TynApiV1LogConversationPostRequestbodyContentApplicationJsonSchema, IO[bytes]]
+        ] = None,
+        **kwargs: Any
+    ) -> None:
+        return await self._send("conversation", body, **kwargs)
+
+    async def conversation_upsert(  # type: ignore[override]  # pylint: disable=inconsistent-return-statements
+        self,
+        body: Optional[
+            Union[_models.PathsRai0VpApiV1LogConversationUpsertPostRequestbodyContentApplicationJsonSchema, IO[bytes]]
+        ] = None,
+        **kwargs: Any
+    ) -> None:
+        return await self._send("conversation_upsert", body, **kwargs)
+
+    async def conversation_thread(  # type: ignore[override]
+        self,
+        body: Optional[
+            Union[_models.Paths1S2Rf6XApiV1LogConversationThreadPostRequestbodyContentApplicationJsonSchema, IO[bytes]]
+        ] = None,
+        **kwargs: Any
+    ) -> Optional[_models.PathsDo7Pm8ApiV1LogConversationThreadPostResponses201ContentApplicationJsonSchema]:
+        return await self._send("conversation_thread", body, **kwargs)
+
+    async def _send(self, operation: str, body: Any, **kwargs: Any) -> Any:
+        sampler = getattr(self._config, "sampler", None)
+        sample_key = kwargs.pop("sample_key", None)
+        if sampler is not None and not sampler.keep(body, sample_key=sample_key):
+            return None
+        if body is not None and not isinstance(body, (bytes, IOBase)):
+            data = self._serialize.body(body, _BODY_TYPES[operation])
+            body = getattr(self._config, "json_backend", _DEFAULT_JSON_BACKEND).dumps(data)
+        if isinstance(body, RawBody):
+            _prepare_raw_body(body, kwargs)
+        return await getattr(super(), operation)(body, **kwargs)
+
+
+__all__: List[str] = ["LogOperations"]  # Add all objects you want publicly available to users at this package level
 
 
 def patch_sdk():
@@ -6,9 +6,147 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+import inspect
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from .. import _serialization
+from ._models import Message, MessageResponse, Topic
+
+_LOGGER = logging.getLogger(__name__)
+
+__all__: List[str] = [
+    "CompactModel",
+    "CompactMessage",
+    "CompactMessageResponse",
+    "CompactTopic",
+    "COMPACT_MODELS",
+]  # Add all objects you want publicly available to users at this package level
+
+_REQUIRED = object()
+
+
+class CompactModel(_serialization.Model):
+    """Base of the compact variants of high-cardinality models.
+
+    A compact model has the same attributes, ``_attribute_map`` and constructor keywords as
+    the model it is derived from, but stores its attributes in ``__slots__`` instead of an
+    instance ``__dict__``, and only allocates ``additional_properties`` when it is used.
+    It works with the serializer and deserializer like the original, but is not an instance
+    of it.
+    """
+
+    __slots__ = ("_additional_properties",)
+
+    # (attribute, default) of each slot, with _REQUIRED for required keywords.
+    _defaults: Tuple[Tuple[str, Any], ...] = ()
+
+    def __init__(self, **kwargs: Any) -> None:  # pylint: disable=super-init-not-called
+        self._additional_properties: Optional[Dict[str, Any]] = None
+        for attr, default in self._defaults:
+            value = kwargs.pop(attr, default)
+            if value is _REQUIRED:
+                raise TypeError(
+                    "{}.__init__() missing required keyword-only argument: '{}'".format(type(self).__name__, attr)
+                )
+            setattr(self, attr, value)
+        for k, value in kwargs.items():
+            if k not in self._attribute_map and k != "additional_properties":
+                _LOGGER.warning("%s is not a known attribute of class %s and will be ignored", k, self.__class__)
+            elif k in self._validation and self._validation[k].get("readonly", False):
+                _LOGGER.warning("Readonly attribute %s will be ignored in class %s", k, self.__class__)
+            else:
+                setattr(self, k, value)
+
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Optional[Dict[str, Any]]) -> None:
+        self._additional_properties = value or None
+
+    def _state(self) -> Dict[str, Any]:
+        """The attributes, as an instance __dict__ of the original model would hold them."""
+        state: Dict[str, Any] = {"additional_properties": self._additional_properties or {}}
+        for attr in type(self).__slots__:
+            state[attr] = getattr(self, attr, None)
+        return state
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare objects by comparing all attributes."""
+        if isinstance(other, self.__class__):
+            return self._state() == other._state()
+        return False
+
+    def __str__(self) -> str:
+        return str(self._state())
+
+    def __getstate__(self) -> Dict[str, Any]:  # type: ignore
+        state = self._state()
+        state["additional_properties"] = self._additional_properties
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    def _materialize(self) -> None:
+        pass
+
+    @classmethod
+    def _infer_class_models(cls):
+        # Nested models of a compact model are compact as well, when there is a compact variant.
+        client_models = super()._infer_class_models()
+        client_models.update(COMPACT_MODELS)
+        return client_models
+
+
+def _compact(model: Type[_serialization.Model]) -> Type[CompactModel]:
+    """Builds the compact variant of a generated model class.
+
+    Attributes are stored in ``_attribute_map`` order, the order generated constructors assign them in.
+
+    :param type model: The generated model class.
+    :return: A CompactModel subclass named ``Compact<model>``.
+    :rtype: type
+    """
+    defaults = []
+    parameters = inspect.signature(model.__init__).parameters
+    for attr in model._attribute_map:  # pylint: disable=protected-access
+        if attr == "additional_properties":
+            continue
+        parameter = parameters.get(attr)
+        if parameter is None:
+            defaults.append((attr, None))  # Readonly, set by the deserializer
+        else:
+            defaults.append((attr, _REQUIRED if parameter.default is inspect.Parameter.empty else parameter.default))
+    return type(
+        "Compact" + model.__name__,
+        (CompactModel,),
+        {
+            "__slots__": tuple(attr for attr, _ in defaults),
+            "__doc__": "Compact variant of :class:`~context_api.models.{}`.".format(model.__name__),
+            "__module__": __name__,
+            "_attribute_map": model._attribute_map,  # pylint: disable=protected-access
+            "_validation": model._validation,  # pylint: disable=protected-access
+            "_defaults": tuple(defaults),
+        },
+    )
+
+
+CompactMessage = _compact(Message)
+CompactMessageResponse = _compact(MessageResponse)
+CompactTopic = _compact(Topic)
+
+# Compact variants by the name of the model they replace, e.g. as deserializer dependencies.
+COMPACT_MODELS: Dict[str, Type[CompactModel]] = {
+    "Message": CompactMessage,
+    "MessageResponse": CompactMessageResponse,
+    "Topic": CompactTopic,
+}
 
 
 def patch_sdk():
@@ -6,9 +6,126 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from io import IOBase
+import logging
+from typing import Any, IO, List, Optional, Union
+
+from azure.core.utils import case_insensitive_dict
+
+from .. import models as _models
+from ._operations import LogOperations as LogOperationsGenerated
+from ...bodies import RawBody
+from ...json_backends import StdlibJSONBackend
+from ...spool import is_retryable
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_JSON_BACKEND = StdlibJSONBackend()
+
+_BODY_TYPES = {
+    "conversation": "PathsLi5TynApiV1LogConversationPostRequestbodyContentApplicationJsonSchema",
+    "conversation_upsert": "PathsRai0VpApiV1LogConversationUpsertPostRequestbodyContentApplicationJsonSchema",
+    "conversation_thread": "Paths1S2Rf6XApiV1LogConversationThreadPostRequestbodyContentApplicationJsonSchema",
+}
+
+
+class LogOperations(LogOperationsGenerated):
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~context_api.ContextAPI`'s
+        :attr:`log` attribute.
+
+    When the client was created with a ``spool``, ``conversation``, ``conversation_upsert``
+    and ``conversation_thread`` calls that fail with a retryable error are written to the
+    spool for later replay instead of raising, and return None. Pass ``spool=False`` to a
+    call to opt out.
+
+    When the client was created with a ``sampler``, calls it drops are not sent and return
+    None. Pass ``sample_key`` to a call to sample on your own conversation identity.
+
+    Model and dict bodies are encoded to JSON bytes with the client's ``json_backend``.
+    Already encoded bodies can be passed as a :class:`~getcontext.bodies.RawBody`, which
+    wraps ``bytes``, a ``memoryview`` or a file region and is sent without being copied.
+    """
+
+    def conversation(  # type: ignore[override]  # pylint: disable=inconsistent-return-statements
+        self,
+        body: Optional[
+            Union[_models.PathsLi5TynApiV1LogConversationPostRequestbodyContentApplicationJsonSchema, IO[bytes]]
+        ] = None,
+        **kwargs: Any
+    ) -> None:
+        return self._send("conversation", body, **kwargs)
+
+    def conversation_upsert(  # type: ignore[override]  # pylint: disable=inconsistent-return-statements
+        self,
+        body: Optional[
+            Union[_models.PathsRai0VpApiV1LogConversationUpsertPostRequestbodyContentApplicationJsonSchema, IO[bytes]]
+        ] = None,
+        **kwargs: Any
+    ) -> None:
+        return self._send("conversation_upsert", body, **kwargs)
+
+    def conversation_thread(  # type: ignore[override]
+        self,
+        body: Optional[
+            Union[_models.Paths1S2Rf6XApiV1LogConversationThreadPostRequestbodyContentApplicationJsonSchema, IO[bytes]]
+        ] = None,
+        **kwargs: Any
+    ) -> Optional[_models.PathsDo7Pm8ApiV1LogConversationThreadPostResponses201ContentApplicationJsonSchema]:
+        return self._send("conversation_thread", body, **kwargs)
+
+    def _encode_body(self, operation: str, body: Any) -> bytes:
+        if isinstance(body, bytes):
+            return body
+        if isinstance(body, RawBody):
+            return body.getbuffer()  # type: ignore[return-value]
+        if isinstance(body, IOBase):
+            return body.read()
+        data = self._serialize.body(body, _BODY_TYPES[operation])
+        return getattr(self._config, "json_backend", _DEFAULT_JSON_BACKEND).dumps(data)
+
+    def _send(self, operation: str, body: Any, **kwargs: Any) -> Any:
+        send = getattr(super(), operation)
+        sampler = getattr(self._config, "sampler", None)
+        sample_key = kwargs.pop("sample_key", None)
+        if sampler is not None and not sampler.keep(body, sample_key=sample_key):
+            return None
+        if body is not None and not isinstance(body, (bytes, IOBase)):
+            body = self._encode_body(operation, body)
+        if isinstance(body, RawBody):
+            _prepare_raw_body(body, kwargs)
+        spool = getattr(self._config, "spool", None) if kwargs.pop("spool", True) else None
+        if spool is None or body is None:
+            return send(body, **kwargs)
+
+        content = self._encode_body(operation, body)
+        try:
+            # A RawBody is sent as is, and only viewed (not copied) if it has to be spooled.
+            return send(body if isinstance(body, RawBody) else content, **kwargs)
+        except Exception as err:  # pylint: disable=broad-except
+            if not is_retryable(err):
+                raise
+            params = {"tenant_id": kwargs["tenant_id"]} if kwargs.get("tenant_id") is not None else {}
+            if not spool.append(operation, content, **params):
+                raise
+            _LOGGER.warning("Spooled %s call for later replay: %s", operation, err)
+            return None
+
+
+def _prepare_raw_body(body: RawBody, kwargs: Any) -> None:
+    """Rewinds a raw body and sets its Content-Length, so that it is not sent chunked."""
+    body.seek(0)
+    headers = case_insensitive_dict(kwargs.pop("headers", None) or {})
+    headers["Content-Length"] = str(len(body))
+    kwargs["headers"] = headers
+
+
+__all__: List[str] = ["LogOperations"]  # Add all objects you want publicly available to users at this package level
 
 
 def patch_sdk():
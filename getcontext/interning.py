@@ -0,0 +1,110 @@
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_STRING_FIELDS = ("role", "language", "type")
+DEFAULT_MODELS = ("Topic",)
+
+
+class InternCache:
+    """Shares repeated strings and small models between deserialized responses.
+
+    Pass an instance to the client as ``intern_cache``, or to several clients to share it.
+    While it is set, the deserializer
+
+    * returns one shared instance for models listed in ``models`` with the same JSON, e.g.
+      the same ``Topic`` in every conversation and message of a page;
+    * interns the keys of every dict attribute, such as ``metadata``;
+    * interns the values of string attributes named in ``string_fields``.
+
+    Shared model instances are the same object, so modifying one modifies it everywhere it
+    appears. Each table is cleared when it reaches ``max_size`` entries, so memory stays
+    bounded over long syncs. Use :meth:`clear` to release everything between syncs.
+
+    :keyword models: Names of the models to share instances of. Default value is ("Topic",).
+    :paramtype models: iterable[str]
+    :keyword string_fields: Names of the string attributes whose values are interned.
+     Default value is ("role", "language", "type").
+    :paramtype string_fields: iterable[str]
+    :keyword int max_size: Entries per table before it is cleared. Default value is 100000.
+    """
+
+    def __init__(
+        self,
+        *,
+        models: Iterable[str] = DEFAULT_MODELS,
+        string_fields: Iterable[str] = DEFAULT_STRING_FIELDS,
+        max_size: int = 100000,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("Parameter 'max_size' must be at least 1.")
+        self.models = frozenset(models)
+        self.string_fields = frozenset(string_fields)
+        self.max_size = max_size
+        self._strings: Dict[str, str] = {}
+        self._instances: Dict[Hashable, Any] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._strings) + len(self._instances)
+
+    def string(self, value: T) -> T:
+        """Returns the cached string equal to ``value``, caching it first if there is none.
+
+        :param value: The string. Values of other types are returned as is.
+        :return: The interned string.
+        """
+        if type(value) is not str:  # pylint: disable=unidiomatic-typecheck
+            return value
+        interned = self._strings.get(value)
+        if interned is not None:
+            self.hits += 1
+            return interned  # type: ignore
+        self.misses += 1
+        if len(self._strings) >= self.max_size:
+            self._strings.clear()
+        self._strings[value] = value
+        return value
+
+    def instance(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Returns the instance cached for ``key``, creating it with ``factory`` if there is none.
+
+        :param key: Hashable identity of the instance, e.g. its model type and JSON items.
+        :param factory: Creates the instance.
+        :return: The shared instance.
+        """
+        instance = self._instances.get(key)
+        if instance is not None:
+            self.hits += 1
+            return instance
+        self.misses += 1
+        instance = factory()
+        if len(self._instances) >= self.max_size:
+            self._instances.clear()
+        self._instances[key] = instance
+        return instance
+
+    def clear(self) -> None:
+        """Drops every cached string and instance."""
+        self._strings.clear()
+        self._instances.clear()
+
+    def __repr__(self) -> str:
+        return "<InternCache strings={} instances={} hits={} misses={}>".format(
+            len(self._strings), len(self._instances), self.hits, self.misses
+        )
+
+
+def get_intern_cache(intern_cache: Optional[Any]) -> Optional[InternCache]:
+    """Resolves a client's ``intern_cache`` keyword.
+
+    :param intern_cache: An InternCache, True for a new one with the default settings, or None or False.
+    :rtype: ~getcontext.interning.InternCache or None
+    """
+    if intern_cache is True:
+        return InternCache()
+    if intern_cache is None or intern_cache is False:
+        return None
+    return intern_cache
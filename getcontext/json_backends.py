@@ -0,0 +1,134 @@
+from abc import ABC, abstractmethod
+import codecs
+import json
+from typing import Any, Dict, Optional, Union
+
+from azure.core.serialization import AzureJSONEncoder
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+_BOM = codecs.BOM_UTF8.decode("utf-8")
+
+
+class JSONBackend(ABC):
+    """Encodes request bodies and decodes response bodies for a client.
+
+    Pass an instance, or the name of a built-in backend, to the client as ``json_backend``.
+    Subclasses implement :meth:`loads` and :meth:`dumps`.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def loads(self, data: JSONInput) -> Any:
+        """Decodes a JSON document, straight from the response bytes where possible.
+
+        :param data: UTF-8 encoded JSON, with or without a byte order mark, or a str.
+        :return: The decoded document.
+        :raises ValueError: If the document is not valid JSON.
+        """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes a serialized body as UTF-8 JSON.
+
+        :param obj: The body, as returned by the client's serializer.
+        :return: The encoded body.
+        :rtype: bytes
+        """
+
+    def __repr__(self) -> str:
+        return "<{}>".format(type(self).__name__)
+
+
+class StdlibJSONBackend(JSONBackend):
+    """Backend using the standard library :mod:`json` module and ``AzureJSONEncoder``."""
+
+    name = "json"
+
+    def loads(self, data: JSONInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        if isinstance(data, str):
+            data = data.lstrip(_BOM)
+        # json.loads() detects the encoding of bytes, including a UTF-8 byte order mark.
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, cls=AzureJSONEncoder).encode("utf-8")
+
+
+class OrjsonJSONBackend(JSONBackend):
+    """Backend using `orjson <https://pypi.org/project/orjson/>`_, which must be installed.
+
+    Documents orjson rejects but the standard library accepts, such as ``NaN``, are decoded
+    by the standard library instead. Depending on the orjson version, integers beyond 64 bits
+    in a response are decoded as floats; when encoding they always fall back to the standard
+    library, so request bodies match its output apart from whitespace. Datetimes and other values
+    orjson has no native encoding for are encoded as :class:`~azure.core.serialization.AzureJSONEncoder`
+    would. Output is compact, without the spaces the standard library adds after separators.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "The orjson JSON backend requires the 'orjson' package. Install it with 'pip install orjson'."
+            )
+        self._encoder = AzureJSONEncoder()
+        self._fallback = StdlibJSONBackend()
+
+    def loads(self, data: JSONInput) -> Any:
+        if isinstance(data, (bytes, bytearray)) and data[:3] == codecs.BOM_UTF8:
+            data = memoryview(data)[3:]
+        elif isinstance(data, str):
+            data = data.lstrip(_BOM)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return self._fallback.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(
+                obj,
+                default=self._encoder.default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            return self._fallback.dumps(obj)
+
+
+JSON_BACKENDS: Dict[str, type] = {
+    StdlibJSONBackend.name: StdlibJSONBackend,
+    OrjsonJSONBackend.name: OrjsonJSONBackend,
+}
+
+
+def get_json_backend(backend: Optional[Union[str, JSONBackend]] = None) -> JSONBackend:
+    """Resolves a client's ``json_backend`` keyword.
+
+    :param backend: A backend, the name of a built-in one (``"json"`` or ``"orjson"``), or ``"auto"``
+     for orjson when it is installed and the standard library otherwise. Default value is None,
+     which selects the standard library.
+    :type backend: str or ~getcontext.json_backends.JSONBackend
+    :rtype: ~getcontext.json_backends.JSONBackend
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend is None:
+        backend = StdlibJSONBackend.name
+    elif backend == "auto":
+        backend = OrjsonJSONBackend.name if orjson is not None else StdlibJSONBackend.name
+    try:
+        return JSON_BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(
+            "Unknown JSON backend '{}'. Use one of: {}, auto.".format(backend, ", ".join(JSON_BACKENDS))
+        ) from None
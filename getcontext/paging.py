@@ -0,0 +1,514 @@
+import asyncio
+import collections
+import concurrent.futures
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, Optional, Tuple, TYPE_CHECKING
+
+from .spool import is_retryable
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from .generated.models import ConversationResponse, Pagination
+
+_LOGGER = logging.getLogger(__name__)
+
+# A ``conversations`` response: the page's ``conversations`` and its ``pagination``.
+Page = Any
+
+
+def _next_page_number(pagination: Optional["Pagination"], count: int) -> Optional[int]:
+    """Number of the page after one with ``count`` conversations and ``pagination``, or None after the last.
+
+    An empty page ends the iteration, and a ``next_page`` not after the current page is ignored.
+    """
+    if not count or pagination is None or pagination.current_page >= pagination.page_count:
+        return None
+    return max(pagination.next_page, pagination.current_page + 1)
+
+
+class _ConversationPagerBase:
+    def __init__(self, *, prefetch: int, first_page: int) -> None:
+        if prefetch < 0:
+            raise ValueError("Parameter 'prefetch' must be at least 0.")
+        self.prefetch = prefetch
+        self._next_page: Optional[int] = first_page
+        self._page_count = first_page
+        self._closed = False
+        self.pagination: Optional["Pagination"] = None
+        self.pages = 0
+        self.count = 0
+
+    def _advance(self, page: Page) -> None:
+        """Records a fetched page and works out the number of the page after it, if any."""
+        self.pages += 1
+        self.count += len(page.conversations or ())
+        pagination = self.pagination = page.pagination
+        self._next_page = _next_page_number(pagination, len(page.conversations or ()))
+        if self._next_page is not None:
+            self._page_count = pagination.page_count
+
+    def _prefetch_numbers(self, highest: Optional[int], pending: int) -> Iterator[int]:
+        """Numbers of the pages to fetch ahead, after ``highest`` already fetched or pending."""
+        if self._next_page is None:
+            return
+        number = self._next_page - 1 if highest is None else highest
+        while pending < self.prefetch and number < self._page_count:
+            number += 1
+            pending += 1
+            yield number
+
+
+class ConversationPager(_ConversationPagerBase):
+    """Conversations of every ``conversations`` page, fetching the next pages while one is consumed.
+
+    Iterate to get each :class:`~getcontext.generated.models.ConversationResponse` across all
+    pages. Up to ``prefetch`` pages after the current one are fetched and deserialized on
+    background threads, following ``Pagination.next_page`` until ``Pagination.page_count``.
+    Breaking out of the iteration, or :meth:`close`, cancels the queued fetches; a fetch
+    already running finishes in the background and its page is discarded.
+
+    :param fetch: Fetches a page by number, e.g. a call to ``client.conversations``.
+    :type fetch: callable
+    :keyword int prefetch: Pages fetched ahead of the one being consumed. 0 fetches each page
+     when it is needed. Default value is 1.
+    :keyword int first_page: Number of the first page. Default value is 1.
+    :ivar pagination: Pagination of the last page fetched, or None before the first.
+    :vartype pagination: ~getcontext.generated.models.Pagination
+    :ivar int pages: Pages consumed so far.
+    :ivar int count: Conversations in the pages consumed so far.
+    """
+
+    def __init__(self, fetch: Callable[[int], Page], *, prefetch: int = 1, first_page: int = 1) -> None:
+        super().__init__(prefetch=prefetch, first_page=first_page)
+        self._fetch = fetch
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pending: Deque[Tuple[int, "concurrent.futures.Future[Page]"]] = collections.deque()
+
+    def __iter__(self) -> Iterator["ConversationResponse"]:
+        try:
+            while self._next_page is not None and not self._closed:
+                page = self._take(self._next_page)
+                self._advance(page)
+                self._schedule()
+                yield from page.conversations or ()
+        finally:
+            self.close()
+
+    def _take(self, number: int) -> Page:
+        if self._pending and self._pending[0][0] == number:
+            return self._pending.popleft()[1].result()
+        self._cancel()
+        return self._fetch(number)
+
+    def _schedule(self) -> None:
+        if self._next_page is None:
+            self._cancel()
+            return
+        highest = self._pending[-1][0] if self._pending else None
+        for number in self._prefetch_numbers(highest, len(self._pending)):
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.prefetch, thread_name_prefix="getcontext-pages"
+                )
+            self._pending.append((number, self._executor.submit(self._fetch, number)))
+
+    def _cancel(self) -> None:
+        while self._pending:
+            self._pending.popleft()[1].cancel()
+
+    def close(self) -> None:
+        """Stops the iteration and cancels the fetches that have not started."""
+        self._closed = True
+        self._cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "ConversationPager":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+
+class AsyncConversationPager(_ConversationPagerBase):
+    """Async counterpart of :class:`ConversationPager`, iterated with ``async for``.
+
+    Pages are fetched ahead as tasks on the running loop. :meth:`close` cancels them,
+    including requests in flight. Use ``async with`` to close the pager as soon as an
+    iteration is left early; otherwise it is closed when the loop finalizes the iteration.
+
+    :param fetch: Fetches a page by number, e.g. a call to ``client.conversations``.
+    :type fetch: callable
+    :keyword int prefetch: Pages fetched ahead of the one being consumed. 0 fetches each page
+     when it is needed. Default value is 1.
+    :keyword int first_page: Number of the first page. Default value is 1.
+    :ivar pagination: Pagination of the last page fetched, or None before the first.
+    :vartype pagination: ~getcontext.generated.models.Pagination
+    :ivar int pages: Pages consumed so far.
+    :ivar int count: Conversations in the pages consumed so far.
+    """
+
+    def __init__(self, fetch: Callable[[int], Awaitable[Page]], *, prefetch: int = 1, first_page: int = 1) -> None:
+        super().__init__(prefetch=prefetch, first_page=first_page)
+        self._fetch = fetch
+        self._pending: Deque[Tuple[int, "asyncio.Task[Page]"]] = collections.deque()
+
+    async def __aiter__(self) -> AsyncIterator["ConversationResponse"]:
+        try:
+            while self._next_page is not None and not self._closed:
+                page = await self._take(self._next_page)
+                self._advance(page)
+                self._schedule()
+                for conversation in page.conversations or ():
+                    yield conversation
+        finally:
+            await self.close()
+
+    async def _take(self, number: int) -> Page:
+        if self._pending and self._pending[0][0] == number:
+            return await self._pending.popleft()[1]
+        await self._cancel()
+        return await self._fetch(number)
+
+    def _schedule(self) -> None:
+        if self._next_page is None:
+            return
+        highest = self._pending[-1][0] if self._pending else None
+        for number in self._prefetch_numbers(highest, len(self._pending)):
+            self._pending.append((number, asyncio.ensure_future(self._fetch(number))))
+
+    async def _cancel(self) -> None:
+        tasks = [task for _, task in self._pending]
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        # Retrieve the outcomes, so that no "exception was never retrieved" warning is logged.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Stops the iteration and cancels the pending fetches."""
+        self._closed = True
+        await self._cancel()
+
+    async def __aenter__(self) -> "AsyncConversationPager":
+        return self
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self.close()
+
+
+class _PageRetries:
+    def __init__(self, *, concurrency: int, page_retries: int, retry_backoff: float) -> None:
+        if concurrency < 1:
+            raise ValueError("Parameter 'concurrency' must be at least 1.")
+        if page_retries < 0:
+            raise ValueError("Parameter 'page_retries' must be at least 0.")
+        self.concurrency = concurrency
+        self.page_retries = page_retries
+        self.retry_backoff = retry_backoff
+        self.retried = 0
+
+    def _retry_delay(self, page: Any, attempt: int, error: Exception) -> Optional[float]:
+        """Seconds to wait before fetching a failed page again, or None to give up."""
+        if attempt >= self.page_retries or not is_retryable(error):
+            return None
+        self.retried += 1
+        _LOGGER.warning("Retrying conversations page %s after error: %s", page, error)
+        return self.retry_backoff * 2**attempt
+
+
+class _ConversationFanOutBase(_PageRetries):
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        ordered: bool,
+        page_retries: int,
+        retry_backoff: float,
+        first_page: int,
+    ) -> None:
+        super().__init__(concurrency=concurrency, page_retries=page_retries, retry_backoff=retry_backoff)
+        self.ordered = ordered
+        self._first_page = first_page
+        # Pages pending, or completed and held back until the pages before them are yielded.
+        self._window = 2 * concurrency if ordered else concurrency
+        self.pagination: Optional["Pagination"] = None
+        self.pages = 0
+        self.count = 0
+
+    def _first(self, page: Page) -> range:
+        """Records the first page and returns the numbers of the remaining pages."""
+        self._yielded(page)
+        pagination = self.pagination = page.pagination
+        if not page.conversations or pagination is None:
+            return range(0)
+        return range(pagination.current_page + 1, pagination.page_count + 1)
+
+    def _yielded(self, page: Page) -> Page:
+        self.pages += 1
+        self.count += len(page.conversations or ())
+        return page
+
+
+class ConversationFanOut(_ConversationFanOutBase):
+    """Pages of a ``conversations`` query, fetched concurrently once the page count is known.
+
+    The first page is fetched to learn ``Pagination.page_count``. The remaining pages are
+    then fetched on up to ``concurrency`` threads, sharing the client's connection pool, and
+    yielded in page order or as they complete. A page failing with a retryable error is
+    fetched again up to ``page_retries`` times, on top of the pipeline's own retries,
+    without affecting the other pages. Iterate the fan-out for the conversations, or
+    :meth:`iter_pages` for the page responses. Leaving the iteration early, or :meth:`close`,
+    cancels the fetches that have not started.
+
+    :param fetch: Fetches a page by number, e.g. a call to ``client.conversations``.
+    :type fetch: callable
+    :keyword int concurrency: Pages fetched at the same time. Keep it at or below the
+     transport's connection pool size. Default value is 8.
+    :keyword bool ordered: Whether pages are yielded in page order. Otherwise they are yielded
+     as soon as they complete. Default value is True.
+    :keyword int page_retries: Times a page failing with a retryable error is fetched again.
+     Default value is 3.
+    :keyword float retry_backoff: Seconds before the first retry of a page, doubled for each
+     further retry. Default value is 1.0.
+    :keyword int first_page: Number of the first page. Default value is 1.
+    :ivar pagination: Pagination of the first page, or None before it is fetched.
+    :vartype pagination: ~getcontext.generated.models.Pagination
+    :ivar int pages: Pages yielded so far.
+    :ivar int count: Conversations in the pages yielded so far.
+    :ivar int retried: Page fetches retried so far.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Page],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        page_retries: int = 3,
+        retry_backoff: float = 1.0,
+        first_page: int = 1,
+    ) -> None:
+        super().__init__(
+            concurrency=concurrency,
+            ordered=ordered,
+            page_retries=page_retries,
+            retry_backoff=retry_backoff,
+            first_page=first_page,
+        )
+        self._fetch = fetch
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pending: Dict["concurrent.futures.Future[Page]", int] = {}
+
+    def __iter__(self) -> Iterator["ConversationResponse"]:
+        try:
+            for page in self.iter_pages():
+                yield from page.conversations or ()
+        finally:
+            self.close()
+
+    def iter_pages(self) -> Iterator[Page]:
+        """Iterates the page responses, each with its ``conversations`` and ``pagination``.
+
+        Use either this or iteration over the fan-out itself, not both.
+
+        :rtype: iterator
+        """
+        try:
+            first = self._fetch_page(self._first_page)
+            remaining = self._first(first)
+            yield first
+            numbers = iter(remaining)
+            expected = remaining.start
+            completed: Dict[int, Page] = {}
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="getcontext-pages"
+            )
+            self._submit(numbers, completed)
+            while self._pending or completed:
+                if expected in completed:
+                    page = completed.pop(expected)
+                    expected += 1
+                    self._submit(numbers, completed)
+                    yield self._yielded(page)
+                    continue
+                done, _ = concurrent.futures.wait(self._pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in sorted(done, key=self._pending.__getitem__):
+                    number = self._pending.pop(future)
+                    page = future.result()
+                    if self.ordered:
+                        completed[number] = page
+                    else:
+                        self._submit(numbers, completed)
+                        yield self._yielded(page)
+                self._submit(numbers, completed)
+        finally:
+            self.close()
+
+    def _fetch_page(self, number: int) -> Page:
+        attempt = 0
+        while True:
+            try:
+                return self._fetch(number)
+            except Exception as err:  # pylint: disable=broad-except
+                delay = self._retry_delay(number, attempt, err)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _submit(self, numbers: Iterator[int], completed: Dict[int, Page]) -> None:
+        while (
+            self._executor is not None
+            and len(self._pending) < self.concurrency
+            and len(self._pending) + len(completed) < self._window
+        ):
+            number = next(numbers, None)
+            if number is None:
+                return
+            self._pending[self._executor.submit(self._fetch_page, number)] = number
+
+    def close(self) -> None:
+        """Stops the iteration and cancels the fetches that have not started."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "ConversationFanOut":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+
+class AsyncConversationFanOut(_ConversationFanOutBase):
+    """Async counterpart of :class:`ConversationFanOut`, iterated with ``async for``.
+
+    The remaining pages are fetched as up to ``concurrency`` tasks on the running loop.
+    :meth:`close` cancels them, including requests in flight. Use ``async with`` to close the
+    fan-out as soon as an iteration is left early.
+
+    :param fetch: Fetches a page by number, e.g. a call to ``client.conversations``.
+    :type fetch: callable
+    :keyword int concurrency: Pages fetched at the same time. Keep it at or below the
+     transport's connection pool size. Default value is 8.
+    :keyword bool ordered: Whether pages are yielded in page order. Otherwise they are yielded
+     as soon as they complete. Default value is True.
+    :keyword int page_retries: Times a page failing with a retryable error is fetched again.
+     Default value is 3.
+    :keyword float retry_backoff: Seconds before the first retry of a page, doubled for each
+     further retry. Default value is 1.0.
+    :keyword int first_page: Number of the first page. Default value is 1.
+    :ivar pagination: Pagination of the first page, or None before it is fetched.
+    :vartype pagination: ~getcontext.generated.models.Pagination
+    :ivar int pages: Pages yielded so far.
+    :ivar int count: Conversations in the pages yielded so far.
+    :ivar int retried: Page fetches retried so far.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Awaitable[Page]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        page_retries: int = 3,
+        retry_backoff: float = 1.0,
+        first_page: int = 1,
+    ) -> None:
+        super().__init__(
+            concurrency=concurrency,
+            ordered=ordered,
+            page_retries=page_retries,
+            retry_backoff=retry_backoff,
+            first_page=first_page,
+        )
+        self._fetch = fetch
+        self._pending: Dict["asyncio.Future[Page]", int] = {}
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator["ConversationResponse"]:
+        try:
+            async for page in self.iter_pages():
+                for conversation in page.conversations or ():
+                    yield conversation
+        finally:
+            await self.close()
+
+    async def iter_pages(self) -> AsyncIterator[Page]:
+        """Iterates the page responses, each with its ``conversations`` and ``pagination``.
+
+        Use either this or iteration over the fan-out itself, not both.
+
+        :rtype: async iterator
+        """
+        try:
+            first = await self._fetch_page(self._first_page)
+            remaining = self._first(first)
+            yield first
+            numbers = iter(remaining)
+            expected = remaining.start
+            completed: Dict[int, Page] = {}
+            self._submit(numbers, completed)
+            while self._pending or completed:
+                if expected in completed:
+                    page = completed.pop(expected)
+                    expected += 1
+                    self._submit(numbers, completed)
+                    yield self._yielded(page)
+                    continue
+                done, _ = await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in sorted(done, key=self._pending.__getitem__):
+                    number = self._pending.pop(future)
+                    page = future.result()
+                    if self.ordered:
+                        completed[number] = page
+                    else:
+                        self._submit(numbers, completed)
+                        yield self._yielded(page)
+                self._submit(numbers, completed)
+        finally:
+            await self.close()
+
+    async def _fetch_page(self, number: int) -> Page:
+        attempt = 0
+        while True:
+            try:
+                return await self._fetch(number)
+            except Exception as err:  # pylint: disable=broad-except
+                delay = self._retry_delay(number, attempt, err)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _submit(self, numbers: Iterator[int], completed: Dict[int, Page]) -> None:
+        while (
+            not self._closed
+            and len(self._pending) < self.concurrency
+            and len(self._pending) + len(completed) < self._window
+        ):
+            number = next(numbers, None)
+            if number is None:
+                return
+            self._pending[asyncio.ensure_future(self._fetch_page(number))] = number
+
+    async def close(self) -> None:
+        """Stops the iteration and cancels the pending fetches."""
+        self._closed = True
+        tasks = list(self._pending)
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        # Retrieve the outcomes, so that no "exception was never retrieved" warning is logged.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> "AsyncConversationFanOut":
+        return self
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self.close()
@@ -0,0 +1,386 @@
+import asyncio
+import gzip
+import hashlib
+from io import IOBase
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import (
+    AsyncHTTPPolicy,
+    DistributedTracingPolicy,
+    HTTPPolicy,
+    RequestIdPolicy,
+    SansIOHTTPPolicy,
+    SensitiveHeaderCleanupPolicy,
+)
+
+from .bodies import RawBody
+
+# Paths of the operations that accept request bodies, keyed by "<operations group>.<method>".
+OPERATION_PATHS: Dict[str, str] = {
+    "evaluations.run": "/api/v1/evaluations/run",
+    "log.conversation": "/api/v1/log/conversation",
+    "log.conversation_upsert": "/api/v1/log/conversation/upsert",
+    "log.conversation_thread": "/api/v1/log/conversation/thread",
+    "log.test_sets": "/api/v1/test_sets",
+}
+
+DEFAULT_COMPRESSED_OPERATIONS = (
+    "log.conversation",
+    "log.conversation_upsert",
+    "log.conversation_thread",
+    "log.test_sets",
+)
+
+
+class RequestCompressionPolicy(SansIOHTTPPolicy):
+    """Gzips large request bodies and sets ``Content-Encoding: gzip``.
+
+    Pass an instance to the client as ``request_compression``. The policy runs once per
+    call, before the retry policy, so retries resend the already compressed body. Bodies
+    that are streamed, already encoded, or do not shrink are sent unchanged.
+
+    :keyword operations: Operations to compress, as "<operations group>.<method>" names, e.g.
+     ``"log.conversation"``. Default value is the ``log`` operations and ``log.test_sets``.
+    :paramtype operations: Iterable[str]
+    :keyword int threshold: Minimum body size in bytes to compress. Default value is 1024.
+    :keyword int level: gzip compression level, 1 to 9. Default value is 6.
+    """
+
+    def __init__(
+        self,
+        *,
+        operations: Iterable[str] = DEFAULT_COMPRESSED_OPERATIONS,
+        threshold: int = 1024,
+        level: int = 6,
+        **kwargs: Any  # pylint: disable=unused-argument
+    ) -> None:
+        unknown = [name for name in operations if name not in OPERATION_PATHS]
+        if unknown:
+            raise ValueError("Unknown operations for request compression: {}.".format(", ".join(unknown)))
+        self.operations = frozenset(operations)
+        self.threshold = threshold
+        self.level = level
+        self._paths = frozenset(OPERATION_PATHS[name] for name in self.operations)
+
+        self.requests_compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes not sent thanks to compression, over all compressed requests."""
+        return self.bytes_in - self.bytes_out
+
+    def on_request(self, request: PipelineRequest) -> None:
+        http_request = request.http_request
+        if "Content-Encoding" in http_request.headers or urlparse(http_request.url).path not in self._paths:
+            return
+        body = self._body(http_request)
+        if body is None or len(body) < self.threshold:
+            return
+        compressed = gzip.compress(body, compresslevel=self.level)
+        if len(compressed) >= len(body):
+            return
+        http_request.set_bytes_body(compressed)
+        http_request.headers["Content-Encoding"] = "gzip"
+        self.requests_compressed += 1
+        self.bytes_in += len(body)
+        self.bytes_out += len(compressed)
+
+    @staticmethod
+    def _body(http_request: Any) -> Optional[bytes]:
+        body = getattr(http_request, "content", None)
+        if isinstance(body, str):
+            return body.encode("utf-8")
+        if isinstance(body, (bytes, bytearray)):
+            return bytes(body)
+        if isinstance(body, RawBody):
+            return body.getbuffer()  # type: ignore[return-value]
+        return None
+
+
+# Path prefixes of the ``log`` operations, which rate limiting and sampling apply to by default.
+LOG_PATH_PREFIXES = ("/api/v1/log/", "/api/v1/test_sets")
+
+
+def _insert_policies(kwargs: Dict[str, Any], key: str, *policies: Any) -> None:
+    """Puts policies in front of any the caller passed as ``per_call_policies``/``per_retry_policies``."""
+    existing = kwargs.pop(key, None) or []
+    if not isinstance(existing, list):
+        existing = [existing]
+    kwargs[key] = [policy for policy in policies if policy is not None] + existing
+
+
+# Policies of the generated configurations that make up the default pipeline, by attribute name.
+_CONFIGURATION_POLICIES = (
+    "headers_policy",
+    "user_agent_policy",
+    "proxy_policy",
+    "redirect_policy",
+    "retry_policy",
+    "authentication_policy",
+    "custom_hook_policy",
+    "logging_policy",
+    "http_logging_policy",
+)
+
+
+def _policies_without_content_decoding(config: Any, kwargs: Dict[str, Any]) -> List[Any]:
+    """The generated clients' default pipeline without ``ContentDecodePolicy``, for a client whose
+    deserializer decodes response bodies itself.
+
+    The policies of ``config`` are also added to ``kwargs``, so that the configuration the client
+    creates from them holds the policies in the pipeline.
+    """
+    for name in _CONFIGURATION_POLICIES:
+        kwargs.setdefault(name, getattr(config, name))
+    return [
+        RequestIdPolicy(**kwargs),
+        config.headers_policy,
+        config.user_agent_policy,
+        config.proxy_policy,
+        config.redirect_policy,
+        config.retry_policy,
+        config.authentication_policy,
+        config.custom_hook_policy,
+        config.logging_policy,
+        DistributedTracingPolicy(**kwargs),
+        SensitiveHeaderCleanupPolicy(**kwargs) if config.redirect_policy else None,
+        config.http_logging_policy,
+    ]
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    try:
+        return max(float(response.http_response.headers["Retry-After"]), 0.0)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        if rate <= 0:
+            raise ValueError("Parameter 'rate' must be positive.")
+        if burst < 1:
+            raise ValueError("Parameter 'burst' must be at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class _RateLimitPolicyBase:
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: Optional[int] = None,
+        paths: Iterable[str] = LOG_PATH_PREFIXES,
+        **kwargs: Any  # pylint: disable=unused-argument
+    ) -> None:
+        self._bucket = _TokenBucket(rate, burst if burst is not None else max(int(rate), 1))
+        self.paths = tuple(paths)
+        self.waited = 0.0
+        self.throttled = 0
+
+    def _reserve(self, request: PipelineRequest) -> Optional[float]:
+        if not urlparse(request.http_request.url).path.startswith(self.paths):
+            return None
+        wait = self._bucket.reserve()
+        self.waited += wait
+        return wait
+
+    def _observe(self, response: PipelineResponse) -> None:
+        if response.http_response.status_code == 429:
+            self.throttled += 1
+            retry_after = _retry_after(response)
+            if retry_after:
+                self._bucket.pause(retry_after)
+
+
+class RateLimitPolicy(_RateLimitPolicyBase, HTTPPolicy):
+    """Token-bucket rate limit for the sync client's ``log`` calls.
+
+    Pass an instance to the client as ``rate_limit``. The policy runs after the retry
+    policy, so every attempt, including retries, takes a token, and waits for one when the
+    bucket is empty. A 429 response with ``Retry-After`` holds back all calls for that long.
+
+    :keyword float rate: Requests per second. Required.
+    :keyword int burst: Requests that may be sent at once after an idle period. Default value
+     is ``rate`` rounded down, and at least 1.
+    :keyword paths: URL path prefixes to limit. Default value is the ``log`` operations' paths.
+    :paramtype paths: Iterable[str]
+    """
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        wait = self._reserve(request)
+        if wait:
+            time.sleep(wait)
+        response = self.next.send(request)
+        if wait is not None:
+            self._observe(response)
+        return response
+
+
+class AsyncRateLimitPolicy(_RateLimitPolicyBase, AsyncHTTPPolicy):
+    """Token-bucket rate limit for the async client's ``log`` calls.
+
+    Behaves like :class:`RateLimitPolicy`, but waits without blocking the event loop.
+
+    :keyword float rate: Requests per second. Required.
+    :keyword int burst: Requests that may be sent at once after an idle period. Default value
+     is ``rate`` rounded down, and at least 1.
+    :keyword paths: URL path prefixes to limit. Default value is the ``log`` operations' paths.
+    :paramtype paths: Iterable[str]
+    """
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        wait = self._reserve(request)
+        if wait:
+            await asyncio.sleep(wait)
+        response = await self.next.send(request)
+        if wait is not None:
+            self._observe(response)
+        return response
+
+
+def _field(obj: Any, name: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+class AdaptiveSampler(SansIOHTTPPolicy):
+    """Deterministically samples ``log`` calls, adapting the sample rate to throttling and latency.
+
+    Pass an instance to the client as ``sampler``. Each conversation or thread is kept when
+    a hash of its identity falls below the current rate, so the same identity gets the same
+    decision at a given rate. Conversations with feedback or a rated message are always
+    kept. Pre-encoded bodies are always sent.
+
+    :class:`~getcontext.generated.models.Conversation` has no id, so pass your own
+    conversation id as the ``sample_key`` keyword of the ``log`` call to keep or drop every
+    call for that conversation together. Without it, identity is the thread id for threads,
+    else the text of the conversation's messages, which changes as messages are added.
+
+    The sampler also watches every ``log`` request attempt. A 429 response multiplies the
+    rate by ``decrease``, a response slower than ``latency_target`` by ``latency_decrease``,
+    and any other successful response adds ``increase``, within ``min_rate`` and ``max_rate``.
+
+    :keyword float rate: Initial fraction of calls kept. Default value is 1.0.
+    :keyword float min_rate: Lowest rate. Default value is 0.01.
+    :keyword float max_rate: Highest rate. Default value is 1.0.
+    :keyword float increase: Added to the rate after a successful response. Default value is 0.01.
+    :keyword float decrease: Rate multiplier after a 429 response. Default value is 0.5.
+    :keyword float latency_target: Seconds above which a response counts as slow. Default value
+     is None, which ignores latency.
+    :keyword float latency_decrease: Rate multiplier after a slow response. Default value is 0.9.
+    :keyword paths: URL path prefixes to observe. Default value is the ``log`` operations' paths.
+    :paramtype paths: Iterable[str]
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 1.0,
+        min_rate: float = 0.01,
+        max_rate: float = 1.0,
+        increase: float = 0.01,
+        decrease: float = 0.5,
+        latency_target: Optional[float] = None,
+        latency_decrease: float = 0.9,
+        paths: Iterable[str] = LOG_PATH_PREFIXES,
+        **kwargs: Any  # pylint: disable=unused-argument
+    ) -> None:
+        if not 0 < min_rate <= max_rate <= 1:
+            raise ValueError("Sample rates must satisfy 0 < min_rate <= max_rate <= 1.")
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.latency_decrease = latency_decrease
+        self.paths = tuple(paths)
+        self._rate = min(max(rate, min_rate), max_rate)
+        self._lock = threading.Lock()
+
+        self.sampled = 0
+        self.forced = 0
+        self.dropped = 0
+        self.throttled = 0
+
+    @property
+    def rate(self) -> float:
+        """The current fraction of calls kept."""
+        return self._rate
+
+    def keep(self, body: Any, *, sample_key: Optional[str] = None) -> bool:
+        """Decides whether a ``log`` call is sent, and counts the decision.
+
+        :param body: The body passed to the ``log`` operation.
+        :keyword str sample_key: Identity to sample on, such as your conversation id. Default
+         value is None, which samples on the thread id or the message text.
+        :return: False if the call should be dropped.
+        :rtype: bool
+        """
+        if body is None or isinstance(body, (bytes, IOBase)):
+            return True
+        conversation = _field(body, "conversation")
+        messages = _field(conversation, "messages") or []
+        if _field(conversation, "feedback") or any(_field(m, "rating") is not None for m in messages):
+            with self._lock:
+                self.forced += 1
+            return True
+        identity = sample_key if sample_key is not None else _field(conversation, "id")
+        if identity is None:
+            identity = "\x00".join(str(_field(m, "message")) for m in messages)
+        digest = hashlib.blake2b(str(identity).encode("utf-8"), digest_size=8).digest()
+        position = int.from_bytes(digest, "big") / 2.0**64
+        with self._lock:
+            if position < self._rate:
+                self.sampled += 1
+                return True
+            self.dropped += 1
+            return False
+
+    def on_request(self, request: PipelineRequest) -> None:
+        if urlparse(request.http_request.url).path.startswith(self.paths):
+            request.context["sampler_start"] = time.monotonic()
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        start = request.context.get("sampler_start")
+        if start is None:
+            return
+        latency = time.monotonic() - start
+        status = response.http_response.status_code
+        with self._lock:
+            if status == 429:
+                self.throttled += 1
+                self._rate *= self.decrease
+            elif status >= 400:
+                return
+            elif self.latency_target is not None and latency > self.latency_target:
+                self._rate *= self.latency_decrease
+            else:
+                self._rate += self.increase
+            self._rate = min(max(self._rate, self.min_rate), self.max_rate)
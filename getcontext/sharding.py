@@ -0,0 +1,443 @@
+import asyncio
+import collections
+import concurrent.futures
+import datetime
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TYPE_CHECKING,
+    Union,
+)
+
+from .generated._serialization import Deserializer, Serializer
+from .paging import Page, _PageRetries, _next_page_number
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from .generated.models import ConversationResponse
+
+DateTimeLike = Union[str, datetime.datetime]
+
+
+class TimeShard(NamedTuple):
+    """A ``start_time``/``end_time`` window of a sharded export.
+
+    :ivar start: Start of the window, timezone-aware.
+    :ivar end: End of the window, timezone-aware.
+    """
+
+    start: datetime.datetime
+    end: datetime.datetime
+
+    @property
+    def start_time(self) -> str:
+        """``start`` as the ISO 8601 string the API takes."""
+        return Serializer.serialize_iso(self.start)
+
+    @property
+    def end_time(self) -> str:
+        """``end`` as the ISO 8601 string the API takes."""
+        return Serializer.serialize_iso(self.end)
+
+    @property
+    def duration(self) -> datetime.timedelta:
+        return self.end - self.start
+
+    def split(self, parts: int = 2) -> List["TimeShard"]:
+        """Splits the window into consecutive windows of equal duration.
+
+        :param int parts: Number of windows. Default value is 2.
+        :rtype: list[~getcontext.sharding.TimeShard]
+        """
+        if parts < 1:
+            raise ValueError("Parameter 'parts' must be at least 1.")
+        step = self.duration / parts
+        bounds = [self.start + step * i for i in range(parts)] + [self.end]
+        return [TimeShard(start, end) for start, end in zip(bounds, bounds[1:])]
+
+    def __str__(self) -> str:
+        return "{}/{}".format(self.start_time, self.end_time)
+
+
+def _as_datetime(value: DateTimeLike) -> datetime.datetime:
+    if isinstance(value, str):
+        value = Deserializer.deserialize_iso(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+class _ShardedExportBase(_PageRetries):
+    def __init__(
+        self,
+        start_time: DateTimeLike,
+        end_time: Optional[DateTimeLike],
+        *,
+        shards: int,
+        concurrency: int,
+        max_shard_records: int,
+        min_shard_duration: datetime.timedelta,
+        page_retries: int,
+        retry_backoff: float,
+    ) -> None:
+        super().__init__(concurrency=concurrency, page_retries=page_retries, retry_backoff=retry_backoff)
+        if shards < 1:
+            raise ValueError("Parameter 'shards' must be at least 1.")
+        if max_shard_records < 1:
+            raise ValueError("Parameter 'max_shard_records' must be at least 1.")
+        start = _as_datetime(start_time)
+        end = datetime.datetime.now(datetime.timezone.utc) if end_time is None else _as_datetime(end_time)
+        if end <= start:
+            raise ValueError("Parameter 'end_time' must be after 'start_time'.")
+        self.max_shard_records = max_shard_records
+        self.min_shard_duration = min_shard_duration
+        # Shards not yet yielded, in time order, and shards not yet fetched, next first.
+        self._order: List[TimeShard] = TimeShard(start, end).split(shards)
+        self._queue: Deque[TimeShard] = collections.deque(self._order)
+        # Ids of the conversations yielded from the current shard and from the one before it.
+        self._seen: Set[str] = set()
+        self._seen_before: Set[str] = set()
+        self._closed = False
+        self.shards: List[TimeShard] = []
+        self.pages = 0
+        self.count = 0
+        self.duplicates = 0
+        self.splits = 0
+
+    def _too_dense(self, shard: TimeShard, page: Page) -> bool:
+        pagination = page.pagination
+        if pagination is None or pagination.total_records <= self.max_shard_records:
+            return False
+        return shard.duration / 2 >= self.min_shard_duration
+
+    def _split(self, shard: TimeShard) -> None:
+        halves = shard.split(2)
+        index = self._order.index(shard)
+        self._order[index : index + 1] = halves
+        # Fetch the halves next, so that the shards being yielded are not held up.
+        self._queue.extendleft(reversed(halves))
+        self.splits += 1
+
+    def _ready(self, completed: Dict[TimeShard, List[Page]]) -> Optional[List[Page]]:
+        """Pops the pages of the earliest shard, if it has completed."""
+        if not self._order or self._order[0] not in completed:
+            return None
+        shard = self._order.pop(0)
+        self.shards.append(shard)
+        return completed.pop(shard)
+
+    def _unique(self, pages: Iterable[Page]) -> Iterator["ConversationResponse"]:
+        """Conversations of a shard's pages not yielded before, e.g. by the shard on the other side of a boundary.
+
+        Only adjacent shards overlap, so the ids of older shards are dropped.
+        """
+        self._seen_before, self._seen = self._seen, set()
+        for page in pages:
+            self.pages += 1
+            for conversation in page.conversations or ():
+                if conversation.id in self._seen or conversation.id in self._seen_before:
+                    self.duplicates += 1
+                    continue
+                self._seen.add(conversation.id)
+                self.count += 1
+                yield conversation
+
+    def _next_shard(self, pending: int, completed: int) -> Optional[TimeShard]:
+        """Takes the next shard to fetch off the queue, or returns None if none should start yet."""
+        if not self._queue or pending >= self.concurrency:
+            return None
+        if pending + completed < 2 * self.concurrency:
+            return self._queue.popleft()
+        # The window is full of later shards waiting for the earliest one, e.g. after it was split.
+        if self._order[0] in self._queue:
+            self._queue.remove(self._order[0])
+            return self._order[0]
+        return None
+
+
+class ShardedConversationExport(_ShardedExportBase):
+    """Conversations of a time range, exported as concurrently paginated time shards.
+
+    The range is split into ``shards`` windows of equal duration, each paginated on its own
+    with up to ``concurrency`` shards fetched at a time, so no query pages deeply. A shard
+    whose first page reports more than ``max_shard_records`` records is split in two, down to
+    ``min_shard_duration``. Conversations are yielded shard by shard in time order, each
+    shard's in the order the API returns them. A conversation returned by more than one
+    shard, e.g. one on a shard boundary, is yielded once; the ids of the conversations of
+    the current and previous shards are kept for that. Failing pages are retried like in
+    :class:`~getcontext.paging.ConversationFanOut`.
+
+    Shards are held in memory whole until they are yielded. With shards completing while an
+    earlier one is still being fetched, that is up to ``2 * concurrency`` shards, each of at
+    most ``max_shard_records`` conversations unless it could not be split further.
+
+    :param fetch: Fetches a page of a shard, e.g. a call to ``client.conversations`` with
+     the shard's ``start_time`` and ``end_time``.
+    :type fetch: callable
+    :param start_time: Start of the range, as a datetime or ISO 8601 string.
+    :type start_time: str or ~datetime.datetime
+    :param end_time: End of the range. None for now.
+    :type end_time: str or ~datetime.datetime
+    :keyword int shards: Number of shards the range is split into initially. Default value is 8.
+    :keyword int concurrency: Shards fetched at the same time. Default value is 8.
+    :keyword int max_shard_records: Records above which a shard is split. Default value is 10000.
+    :keyword min_shard_duration: Duration below which shards are not split. Default value is
+     one second.
+    :paramtype min_shard_duration: ~datetime.timedelta
+    :keyword int page_retries: Times a page failing with a retryable error is fetched again.
+     Default value is 3.
+    :keyword float retry_backoff: Seconds before the first retry of a page, doubled for each
+     further retry. Default value is 1.0.
+    :ivar shards: Shards yielded so far, in time order.
+    :vartype shards: list[~getcontext.sharding.TimeShard]
+    :ivar int pages: Pages yielded so far.
+    :ivar int count: Conversations yielded so far.
+    :ivar int duplicates: Conversations skipped because they had already been yielded.
+    :ivar int splits: Shards split because they were too dense.
+    :ivar int retried: Page fetches retried so far.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[TimeShard, int], Page],
+        start_time: DateTimeLike,
+        end_time: Optional[DateTimeLike] = None,
+        *,
+        shards: int = 8,
+        concurrency: int = 8,
+        max_shard_records: int = 10000,
+        min_shard_duration: datetime.timedelta = datetime.timedelta(seconds=1),
+        page_retries: int = 3,
+        retry_backoff: float = 1.0,
+    ) -> None:
+        super().__init__(
+            start_time,
+            end_time,
+            shards=shards,
+            concurrency=concurrency,
+            max_shard_records=max_shard_records,
+            min_shard_duration=min_shard_duration,
+            page_retries=page_retries,
+            retry_backoff=retry_backoff,
+        )
+        self._fetch = fetch
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pending: Dict["concurrent.futures.Future[Optional[List[Page]]]", TimeShard] = {}
+
+    def __iter__(self) -> Iterator["ConversationResponse"]:
+        try:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="getcontext-shards"
+            )
+            completed: Dict[TimeShard, List[Page]] = {}
+            self._submit(completed)
+            while self._pending or completed:
+                pages = self._ready(completed)
+                if pages is not None:
+                    self._submit(completed)
+                    yield from self._unique(pages)
+                    continue
+                done, _ = concurrent.futures.wait(self._pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    shard = self._pending.pop(future)
+                    pages = future.result()
+                    if pages is None:
+                        self._split(shard)
+                    else:
+                        completed[shard] = pages
+                self._submit(completed)
+        finally:
+            self.close()
+
+    def _export_shard(self, shard: TimeShard) -> Optional[List[Page]]:
+        """Fetches every page of a shard, or returns None if it should be split instead."""
+        page = self._fetch_page(shard, 1)
+        if self._too_dense(shard, page):
+            return None
+        pages = [page]
+        number = _next_page_number(page.pagination, len(page.conversations or ()))
+        while number is not None and not self._closed:
+            page = self._fetch_page(shard, number)
+            pages.append(page)
+            number = _next_page_number(page.pagination, len(page.conversations or ()))
+        return pages
+
+    def _fetch_page(self, shard: TimeShard, number: int) -> Page:
+        attempt = 0
+        while True:
+            try:
+                return self._fetch(shard, number)
+            except Exception as err:  # pylint: disable=broad-except
+                delay = self._retry_delay("{} of {}".format(number, shard), attempt, err)
+                if delay is None or self._closed:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _submit(self, completed: Dict[TimeShard, List[Page]]) -> None:
+        while self._executor is not None:
+            shard = self._next_shard(len(self._pending), len(completed))
+            if shard is None:
+                return
+            self._pending[self._executor.submit(self._export_shard, shard)] = shard
+
+    def close(self) -> None:
+        """Stops the export and cancels the shards that have not started.
+
+        A shard being fetched stops after its current page.
+        """
+        self._closed = True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "ShardedConversationExport":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+
+class AsyncShardedConversationExport(_ShardedExportBase):
+    """Async counterpart of :class:`ShardedConversationExport`, iterated with ``async for``.
+
+    Shards are fetched as up to ``concurrency`` tasks on the running loop. :meth:`close`
+    cancels them, including requests in flight. Use ``async with`` to close the export as
+    soon as an iteration is left early.
+
+    :param fetch: Fetches a page of a shard, e.g. a call to ``client.conversations`` with
+     the shard's ``start_time`` and ``end_time``.
+    :type fetch: callable
+    :param start_time: Start of the range, as a datetime or ISO 8601 string.
+    :type start_time: str or ~datetime.datetime
+    :param end_time: End of the range. None for now.
+    :type end_time: str or ~datetime.datetime
+    :keyword int shards: Number of shards the range is split into initially. Default value is 8.
+    :keyword int concurrency: Shards fetched at the same time. Default value is 8.
+    :keyword int max_shard_records: Records above which a shard is split. Default value is 10000.
+    :keyword min_shard_duration: Duration below which shards are not split. Default value is
+     one second.
+    :paramtype min_shard_duration: ~datetime.timedelta
+    :keyword int page_retries: Times a page failing with a retryable error is fetched again.
+     Default value is 3.
+    :keyword float retry_backoff: Seconds before the first retry of a page, doubled for each
+     further retry. Default value is 1.0.
+    :ivar shards: Shards yielded so far, in time order.
+    :vartype shards: list[~getcontext.sharding.TimeShard]
+    :ivar int pages: Pages yielded so far.
+    :ivar int count: Conversations yielded so far.
+    :ivar int duplicates: Conversations skipped because they had already been yielded.
+    :ivar int splits: Shards split because they were too dense.
+    :ivar int retried: Page fetches retried so far.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[TimeShard, int], Awaitable[Page]],
+        start_time: DateTimeLike,
+        end_time: Optional[DateTimeLike] = None,
+        *,
+        shards: int = 8,
+        concurrency: int = 8,
+        max_shard_records: int = 10000,
+        min_shard_duration: datetime.timedelta = datetime.timedelta(seconds=1),
+        page_retries: int = 3,
+        retry_backoff: float = 1.0,
+    ) -> None:
+        super().__init__(
+            start_time,
+            end_time,
+            shards=shards,
+            concurrency=concurrency,
+            max_shard_records=max_shard_records,
+            min_shard_duration=min_shard_duration,
+            page_retries=page_retries,
+            retry_backoff=retry_backoff,
+        )
+        self._fetch = fetch
+        self._pending: Dict["asyncio.Future[Optional[List[Page]]]", TimeShard] = {}
+
+    async def __aiter__(self) -> AsyncIterator["ConversationResponse"]:
+        try:
+            completed: Dict[TimeShard, List[Page]] = {}
+            self._submit(completed)
+            while self._pending or completed:
+                pages = self._ready(completed)
+                if pages is not None:
+                    self._submit(completed)
+                    for conversation in self._unique(pages):
+                        yield conversation
+                    continue
+                done, _ = await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    shard = self._pending.pop(future)
+                    pages = future.result()
+                    if pages is None:
+                        self._split(shard)
+                    else:
+                        completed[shard] = pages
+                self._submit(completed)
+        finally:
+            await self.close()
+
+    async def _export_shard(self, shard: TimeShard) -> Optional[List[Page]]:
+        """Fetches every page of a shard, or returns None if it should be split instead."""
+        page = await self._fetch_page(shard, 1)
+        if self._too_dense(shard, page):
+            return None
+        pages = [page]
+        number = _next_page_number(page.pagination, len(page.conversations or ()))
+        while number is not None and not self._closed:
+            page = await self._fetch_page(shard, number)
+            pages.append(page)
+            number = _next_page_number(page.pagination, len(page.conversations or ()))
+        return pages
+
+    async def _fetch_page(self, shard: TimeShard, number: int) -> Page:
+        attempt = 0
+        while True:
+            try:
+                return await self._fetch(shard, number)
+            except Exception as err:  # pylint: disable=broad-except
+                delay = self._retry_delay("{} of {}".format(number, shard), attempt, err)
+                if delay is None or self._closed:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _submit(self, completed: Dict[TimeShard, List[Page]]) -> None:
+        while not self._closed:
+            shard = self._next_shard(len(self._pending), len(completed))
+            if shard is None:
+                return
+            self._pending[asyncio.ensure_future(self._export_shard(shard))] = shard
+
+    async def close(self) -> None:
+        """Stops the export and cancels the pending shards."""
+        self._closed = True
+        tasks = list(self._pending)
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        # Retrieve the outcomes, so that no "exception was never retrieved" warning is logged.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> "AsyncShardedConversationExport":
+        return self
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self.close()
@@ -0,0 +1,352 @@
+"""Share one client between the worker processes of a pre-fork server.
+
+Workers log through a :class:`SidecarClient`, which serializes each call and writes it
+to a local Unix socket. A single :class:`SidecarServer` process owns the
+:class:`~getcontext.ContextAPI` client, so connections and buffers scale with sidecars
+rather than workers. Start a sidecar with::
+
+    GETCONTEXT_TOKEN=... python -m getcontext.sidecar --socket /run/getcontext.sock
+"""
+import argparse
+import errno
+from io import IOBase
+import logging
+import os
+import socket
+import stat
+import threading
+import zlib
+from typing import Any, List, Optional, Union
+
+from .background import BackgroundLogger
+from .generated import ContextAPI, models as _models
+from .generated._serialization import Serializer
+from .generated.operations._patch import _BODY_TYPES
+from .json_backends import JSONBackend, get_json_backend
+from .spool import _RECORD_HEADER, decode_record, encode_record
+from .token import Credential
+
+_LOGGER = logging.getLogger(__name__)
+
+# Operations a sidecar forwards, with the body type their calls are serialized as.
+SIDECAR_OPERATIONS = _BODY_TYPES
+
+
+def _require_unix_sockets() -> None:
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The log sidecar requires Unix domain sockets, which this platform does not support.")
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Removes the socket file a sidecar that is no longer running left at ``path``.
+
+    :raises OSError: If ``path`` is not a socket, or a process still accepts connections on it.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, "Not a socket, so the sidecar will not replace it", path)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.remove(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, "Another process is listening on the sidecar socket", path)
+
+
+class SidecarClient:
+    """Sends ``log`` calls to a sidecar over a Unix socket, without waiting for the service.
+
+    Calls are fire-and-forget. If the sidecar cannot be reached, or does not read within
+    ``timeout`` seconds, the call is dropped and counted in ``dropped``. The connection is
+    reopened after a failure and in every forked child, so an instance created before
+    the server forks is safe to use from each worker.
+
+    :param str path: Path of the sidecar's socket.
+    :keyword float timeout: Seconds to wait for connecting and writing. Default value is 1.0.
+    :keyword json_backend: Encodes model and dict bodies, as the client's ``json_backend``
+     does. Default value is None, which selects the standard library.
+    :paramtype json_backend: str or ~getcontext.json_backends.JSONBackend
+    """
+
+    def __init__(
+        self, path: str, *, timeout: float = 1.0, json_backend: Optional[Union[str, JSONBackend]] = None
+    ) -> None:
+        _require_unix_sockets()
+        self.path = path
+        self.timeout = timeout
+        self._json = get_json_backend(json_backend)
+        self._serialize = Serializer({k: v for k, v in _models.__dict__.items() if isinstance(v, type)})
+        self._serialize.client_side_validation = False
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._pid = os.getpid()
+
+        self.sent = 0
+        self.dropped = 0
+
+    def conversation(self, body: Any, *, tenant_id: Optional[str] = None) -> bool:
+        """Forwards a ``log.conversation`` call.
+
+        :param body: The request body, as accepted by ``log.conversation``.
+        :keyword tenant_id: Default value is None.
+        :paramtype tenant_id: str
+        :return: False if the call was dropped.
+        :rtype: bool
+        """
+        return self.submit("conversation", body, tenant_id=tenant_id)
+
+    def conversation_upsert(self, body: Any, *, tenant_id: Optional[str] = None) -> bool:
+        """Forwards a ``log.conversation_upsert`` call.
+
+        :param body: The request body, as accepted by ``log.conversation_upsert``.
+        :keyword tenant_id: Default value is None.
+        :paramtype tenant_id: str
+        :return: False if the call was dropped.
+        :rtype: bool
+        """
+        return self.submit("conversation_upsert", body, tenant_id=tenant_id)
+
+    def conversation_thread(self, body: Any, *, tenant_id: Optional[str] = None) -> bool:
+        """Forwards a ``log.conversation_thread`` call. The response is not returned.
+
+        :param body: The request body, as accepted by ``log.conversation_thread``.
+        :keyword tenant_id: Default value is None.
+        :paramtype tenant_id: str
+        :return: False if the call was dropped.
+        :rtype: bool
+        """
+        return self.submit("conversation_thread", body, tenant_id=tenant_id)
+
+    def submit(self, operation: str, body: Any, **params: Any) -> bool:
+        """Forwards a call to one of the sidecar's ``log`` operations.
+
+        :param str operation: One of ``SIDECAR_OPERATIONS``.
+        :param body: The request body: a model, a dict, or already serialized JSON bytes.
+        :return: False if the call was dropped.
+        :rtype: bool
+        """
+        if operation not in SIDECAR_OPERATIONS:
+            raise ValueError("Unknown sidecar operation '{}'.".format(operation))
+        record = encode_record(
+            operation, self._encode_body(operation, body), **{k: v for k, v in params.items() if v is not None}
+        )
+        with self._lock:
+            try:
+                self._connect().sendall(record)
+            except OSError as err:
+                # A partial write leaves the stream unusable, so always start over.
+                self._disconnect()
+                self.dropped += 1
+                _LOGGER.warning("Dropping %s call, log sidecar at %s is unavailable: %s", operation, self.path, err)
+                return False
+            self.sent += 1
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def __enter__(self) -> "SidecarClient":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+    def _encode_body(self, operation: str, body: Any) -> bytes:
+        if isinstance(body, bytes):
+            return body
+        if isinstance(body, IOBase):
+            return body.read()
+        return self._json.dumps(self._serialize.body(body, SIDECAR_OPERATIONS[operation]))
+
+    def _connect(self) -> socket.socket:
+        if self._sock is not None and self._pid != os.getpid():
+            # Inherited from the parent process; leave it to the parent and open our own.
+            self._sock = None
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.path)
+            except OSError:
+                sock.close()
+                raise
+            self._sock, self._pid = sock, os.getpid()
+        return self._sock
+
+    def _disconnect(self) -> None:
+        if self._sock is not None and self._pid == os.getpid():
+            self._sock.close()
+        self._sock = None
+
+
+class SidecarServer:
+    """Receives ``log`` calls from :class:`SidecarClient` workers and sends them with one client.
+
+    Each accepted connection is read by its own thread, and every call is queued on the
+    client's :class:`~getcontext.background.BackgroundLogger`, which sends it through the
+    client's pooled connections. Keyword arguments are passed to ``client.background_logger``.
+
+    :param client: The client that sends the calls.
+    :type client: ~getcontext.ContextAPI
+    :param str path: Path of the socket to listen on. A socket file nothing listens on any more
+     is replaced.
+    :raises OSError: If ``path`` exists and is not a socket, or another process listens on it.
+    :keyword int mode: Permission bits of the socket file. The socket is created under a
+     matching umask, so it is never reachable with wider permissions. Default value is 0o600.
+    :keyword int max_record_size: Largest accepted call in bytes; a connection sending a
+     larger one is closed. Default value is 64 MiB.
+    """
+
+    def __init__(
+        self,
+        client: ContextAPI,
+        path: str,
+        *,
+        mode: int = 0o600,
+        max_record_size: int = 64 * 1024 * 1024,
+        **kwargs: Any
+    ) -> None:
+        _require_unix_sockets()
+        _remove_stale_socket(path)
+        self.client = client
+        self.path = path
+        self.max_record_size = max_record_size
+        self.logger: BackgroundLogger = client.background_logger(**kwargs)
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o777 & ~mode)
+        try:
+            self._sock.bind(path)
+        except OSError:
+            self._sock.close()
+            raise
+        finally:
+            os.umask(umask)
+        self._sock.listen(128)
+        self._closed = threading.Event()
+        self._connections: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._acceptor: Optional[threading.Thread] = None
+
+        self.received = 0
+        self.rejected = 0
+
+    def serve_forever(self) -> None:
+        """Accepts connections until :meth:`close` is called."""
+        while not self._closed.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                if self._closed.is_set():
+                    return
+                raise
+            with self._lock:
+                self._connections.append(conn)
+            threading.Thread(target=self._read, args=(conn,), name="getcontext-sidecar-reader", daemon=True).start()
+
+    def start(self) -> None:
+        """Accepts connections on a background thread."""
+        if self._acceptor is None:
+            self._acceptor = threading.Thread(target=self.serve_forever, name="getcontext-sidecar", daemon=True)
+            self._acceptor.start()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stops accepting calls, then sends everything already received.
+
+        :param float timeout: Seconds to wait for queued calls to be sent. Waits indefinitely by default.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        if self._acceptor is not None:
+            self._acceptor.join(timeout)
+        self.logger.flush(timeout)
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "SidecarServer":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+    def _read(self, conn: socket.socket) -> None:
+        reader = conn.makefile("rb")
+        try:
+            while True:
+                header = reader.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size:
+                    return
+                length, crc = _RECORD_HEADER.unpack(header)
+                if length > self.max_record_size:
+                    _LOGGER.warning("Closing sidecar connection that sent a %s byte record.", length)
+                    return
+                payload = reader.read(length)
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    _LOGGER.warning("Closing sidecar connection after a truncated or corrupt record.")
+                    return
+                try:
+                    record = decode_record(payload)
+                except (KeyError, TypeError, ValueError) as err:
+                    self.rejected += 1
+                    _LOGGER.warning("Closing sidecar connection after an undecodable record: %r", err)
+                    return
+                if record.operation not in SIDECAR_OPERATIONS:
+                    self.rejected += 1
+                    _LOGGER.warning("Ignoring unknown sidecar operation '%s'.", record.operation)
+                    continue
+                self.received += 1
+                self.logger.submit(record.operation, record.body, content_type="application/json", **record.params)
+        except OSError:
+            pass
+        finally:
+            reader.close()
+            conn.close()
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Forward log calls from local workers to the Context API.")
+    parser.add_argument("--socket", required=True, help="Path of the Unix socket to listen on.")
+    parser.add_argument("--endpoint", default="https://api.context.ai", help="Service URL.")
+    parser.add_argument("--max-queue-size", type=int, default=10000, help="Calls held before new ones are dropped.")
+    args = parser.parse_args(argv)
+
+    token = os.environ.get("GETCONTEXT_TOKEN")
+    if not token:
+        parser.error("GETCONTEXT_TOKEN must be set.")
+    logging.basicConfig(level=logging.INFO)
+    with ContextAPI(credential=Credential(token), endpoint=args.endpoint) as client:
+        server = SidecarServer(client, args.socket, max_queue_size=args.max_queue_size)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from .generated.operations import LogOperations
+
+_LOGGER = logging.getLogger(__name__)
+
+# Each record is <length><crc32><payload>; the payload is a JSON header line followed by the body.
+_RECORD_HEADER = struct.Struct("<II")
+_SEGMENT_SUFFIX = ".seg"
+_CURSOR_FILE = "cursor"
+
+
+class SpoolRecord(NamedTuple):
+    operation: str
+    params: Dict[str, Any]
+    body: bytes
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed log call is worth spooling and retrying later.
+
+    Connection failures, timeouts, throttling and server errors are retryable. Other
+    HTTP errors mean the request itself was rejected and resending it will not help.
+
+    :param error: The exception raised by the operation.
+    :rtype: bool
+    """
+    if isinstance(error, (ServiceRequestError, ServiceResponseError)):
+        return True
+    if isinstance(error, HttpResponseError):
+        status = error.status_code
+        return status is None or status in (408, 429) or status >= 500
+    return False
+
+
+def encode_record(operation: str, body: bytes, **params: Any) -> bytes:
+    header = json.dumps({"op": operation, "params": params}, separators=(",", ":")).encode("utf-8")
+    payload = header + b"\n" + body
+    return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_record(payload: bytes) -> SpoolRecord:
+    header, _, body = payload.partition(b"\n")
+    meta = json.loads(header)
+    return SpoolRecord(meta["op"], meta["params"], body)
+
+
+class Spool:
+    """Append-only, segmented on-disk queue of serialized log requests.
+
+    Records are appended to the newest segment file and read back through memory-mapped
+    segments, so spooled payloads do not count towards the process's memory. Fully
+    replayed segments are deleted, and the oldest segments are dropped when the spool
+    would otherwise grow past ``max_bytes``.
+
+    :param str directory: Directory holding the segment files. Created if missing.
+    :keyword int segment_size: Size in bytes at which a new segment is started. Default value is 16 MiB.
+    :keyword int max_bytes: Disk budget for all segments. Default value is 1 GiB.
+    :keyword bool fsync: Whether to fsync after every append. Default value is False.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        segment_size: int = 16 * 1024 * 1024,
+        max_bytes: int = 1024 * 1024 * 1024,
+        fsync: bool = False,
+    ) -> None:
+        if segment_size > max_bytes:
+            raise ValueError("Parameter 'segment_size' must not exceed 'max_bytes'.")
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_bytes = max_bytes
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._replay_lock = threading.Lock()
+        self._segments: List[int] = sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)]) for name in os.listdir(directory) if name.endswith(_SEGMENT_SUFFIX)
+        )
+        self._sizes: Dict[int, int] = {seq: os.path.getsize(self._path(seq)) for seq in self._segments}
+        self._cursor = self._read_cursor()
+        self._active: Optional[Any] = None
+        # Records not replayed yet, by segment.
+        self._counts: Dict[int, int] = {seq: self._recover(seq) for seq in self._segments}
+
+        self.appended = 0
+        self.replayed = 0
+        self.dropped_bytes = 0
+
+    @property
+    def size(self) -> int:
+        """Bytes currently held on disk."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
+
+    def append(self, operation: str, body: bytes, **params: Any) -> bool:
+        """Appends a serialized request.
+
+        :param str operation: Name of the ``LogOperations`` method to replay it with.
+        :param bytes body: The serialized request body.
+        :return: False if the record does not fit in the disk budget and was dropped.
+        :rtype: bool
+        """
+        record = encode_record(operation, body, **params)
+        if len(record) > self.segment_size:
+            _LOGGER.warning("Dropping %s byte %s record larger than the spool segment size.", len(record), operation)
+            self.dropped_bytes += len(record)
+            return False
+        with self._lock:
+            if not self._segments or self._sizes[self._segments[-1]] + len(record) > self.segment_size:
+                self._roll()
+            self._enforce_budget(len(record))
+            active = self._open_active()
+            active.write(record)
+            active.flush()
+            if self.fsync:
+                os.fsync(active.fileno())
+            self._sizes[self._segments[-1]] += len(record)
+            self._counts[self._segments[-1]] += 1
+            self.appended += 1
+        return True
+
+    def replay(self, send: Callable[[SpoolRecord], Any], *, limit: Optional[int] = None) -> int:
+        """Resends spooled records in order, oldest first.
+
+        Replay stops at the first retryable failure, leaving that record at the head of
+        the spool. Records rejected with a non-retryable error are dropped.
+
+        :param send: Callable invoked with each :class:`SpoolRecord`.
+        :keyword int limit: Maximum number of records to resend. Default value is None.
+        :return: The number of records consumed.
+        :rtype: int
+        """
+        consumed = 0
+        # Appends only take the segment lock briefly, so ingest continues while records are resent.
+        with self._replay_lock:
+            pending = self._iter_pending()
+            for seq, end, record in pending:
+                if limit is not None and consumed >= limit:
+                    break
+                try:
+                    send(record)
+                except Exception as err:  # pylint: disable=broad-except
+                    if is_retryable(err):
+                        _LOGGER.info("Spool replay paused: %s", err)
+                        break
+                    _LOGGER.warning("Dropping spooled %s record rejected by the service: %s", record.operation, err)
+                else:
+                    self.replayed += 1
+                consumed += 1
+                with self._lock:
+                    self._advance(seq, end)
+            pending.close()
+            self._compact()
+        return consumed
+
+    def compact(self) -> None:
+        """Deletes fully replayed segments and rewrites a partially replayed head segment."""
+        with self._replay_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        with self._lock:
+            seq, offset = self._cursor
+            while self._segments and self._segments[0] < seq:
+                self._delete(self._segments[0])
+            if not self._segments or self._segments[0] != seq or offset == 0:
+                return
+            if offset >= self._sizes[seq]:
+                if seq == self._segments[-1]:
+                    self._close_active()
+                self._delete(seq)
+                self._write_cursor(seq + 1, 0)
+                return
+            if seq == self._segments[-1]:
+                # Start a new segment so the head can be rewritten without touching the open file.
+                self._roll()
+            path = self._path(seq)
+            with open(path, "rb") as source, open(path + ".tmp", "wb") as target:
+                source.seek(offset)
+                for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                    target.write(chunk)
+            os.replace(path + ".tmp", path)
+            self._sizes[seq] -= offset
+            self._write_cursor(seq, 0)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_active()
+
+    def _iter_pending(self) -> Iterator[Tuple[int, int, SpoolRecord]]:
+        cursor_seq, cursor_offset = self._cursor
+        for seq in list(self._segments):
+            if seq < cursor_seq:
+                continue
+            start = cursor_offset if seq == cursor_seq else 0
+            for end, payload in self._read_segment(seq, start):
+                yield seq, end, decode_record(payload)
+
+    def _read_segment(self, seq: int, offset: int) -> Iterator[Tuple[int, bytes]]:
+        with self._lock:
+            size = self._sizes.get(seq, 0)
+            if size <= offset:
+                return
+            f = open(self._path(seq), "rb")  # pylint: disable=consider-using-with
+        # Map only what had been written when the segment was opened; appends may continue meanwhile.
+        with f, mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as view:
+            while offset + _RECORD_HEADER.size <= size:
+                length, crc = _RECORD_HEADER.unpack_from(view, offset)
+                start, end = offset + _RECORD_HEADER.size, offset + _RECORD_HEADER.size + length
+                if end > size or zlib.crc32(view[start:end]) != crc:
+                    _LOGGER.warning("Spool segment %s is truncated or corrupt at offset %s.", seq, offset)
+                    return
+                yield end, view[start:end]
+                offset = end
+
+    def _advance(self, seq: int, offset: int) -> None:
+        if seq not in self._sizes or (seq, offset) <= self._cursor:
+            return  # The segment was dropped to stay within the disk budget.
+        self._counts[seq] -= 1
+        # Consumed segments are deleted by compact(), once they are no longer mapped.
+        if offset >= self._sizes[seq] and seq != self._segments[-1]:
+            self._write_cursor(seq + 1, 0)
+        else:
+            self._write_cursor(seq, offset)
+
+    def _enforce_budget(self, incoming: int) -> None:
+        while len(self._segments) > 1 and self.size + incoming > self.max_bytes:
+            oldest = self._segments[0]
+            _LOGGER.warning("Spool is over its %s byte budget, dropping segment %s.", self.max_bytes, oldest)
+            self.dropped_bytes += self._sizes[oldest]
+            self._delete(oldest)
+            if self._cursor[0] <= oldest:
+                self._write_cursor(oldest + 1, 0)
+
+    def _roll(self) -> None:
+        self._close_active()
+        seq = self._segments[-1] + 1 if self._segments else max(self._cursor[0], 1)
+        open(self._path(seq), "ab").close()
+        self._segments.append(seq)
+        self._sizes[seq] = 0
+        self._counts[seq] = 0
+
+    def _open_active(self) -> Any:
+        if self._active is None:
+            self._active = open(self._path(self._segments[-1]), "ab")
+        return self._active
+
+    def _close_active(self) -> None:
+        if self._active is not None:
+            self._active.close()
+            self._active = None
+
+    def _delete(self, seq: int) -> None:
+        self._segments.remove(seq)
+        del self._sizes[seq]
+        self._counts.pop(seq, None)
+        try:
+            os.remove(self._path(seq))
+        except FileNotFoundError:
+            pass
+
+    def _recover(self, seq: int) -> int:
+        """Counts the pending records of a segment found on disk.
+
+        A record cut short at the end of the newest segment, e.g. by a crash during an append,
+        is truncated away so that the records appended after it can be read back.
+        """
+        cursor_seq, cursor_offset = self._cursor
+        if seq < cursor_seq:
+            return 0
+        count = 0
+        end = cursor_offset if seq == cursor_seq else 0
+        for end, _ in self._read_segment(seq, end):
+            count += 1
+        if seq == self._segments[-1] and end < self._sizes[seq]:
+            _LOGGER.warning("Truncating spool segment %s to its last complete record at offset %s.", seq, end)
+            os.truncate(self._path(seq), end)
+            self._sizes[seq] = end
+        return count
+
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.directory, "{:012d}{}".format(seq, _SEGMENT_SUFFIX))
+
+    def _read_cursor(self) -> Tuple[int, int]:
+        try:
+            with open(os.path.join(self.directory, _CURSOR_FILE), "r", encoding="ascii") as f:
+                seq, offset = f.read().split()
+                return int(seq), int(offset)
+        except (FileNotFoundError, ValueError):
+            return (self._segments[0] if self._segments else 1), 0
+
+    def _write_cursor(self, seq: int, offset: int) -> None:
+        path = os.path.join(self.directory, _CURSOR_FILE)
+        with open(path + ".tmp", "w", encoding="ascii") as f:
+            f.write("{} {}".format(seq, offset))
+        os.replace(path + ".tmp", path)
+        self._cursor = (seq, offset)
+
+
+class SpoolReplayer:
+    """Periodically resends spooled log requests through the client's ``log`` operations.
+
+    :param spool: The spool to drain.
+    :type spool: ~getcontext.spool.Spool
+    :param log_operations: The operations group used to send, usually ``client.log``.
+    :type log_operations: ~getcontext.generated.operations.LogOperations
+    :keyword float interval: Seconds between replay attempts. Default value is 30.0.
+    """
+
+    def __init__(self, spool: Spool, log_operations: "LogOperations", *, interval: float = 30.0) -> None:
+        self.spool = spool
+        self._log = log_operations
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def replay(self, *, limit: Optional[int] = None) -> int:
+        """Resends spooled records now.
+
+        :keyword int limit: Maximum number of records to resend. Default value is None.
+        :return: The number of records consumed.
+        :rtype: int
+        """
+        return self.spool.replay(self._send, limit=limit)
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="getcontext-spool-replayer", daemon=True)
+            self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopped.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def _send(self, record: SpoolRecord) -> None:
+        operation = getattr(self._log, record.operation)
+        # Bypass the operations' own spooling so a failed replay is not appended a second time.
+        operation(record.body, content_type="application/json", spool=False, **record.params)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.replay()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.warning("Spool replay failed.", exc_info=True)
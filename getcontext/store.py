@@ -0,0 +1,297 @@
+import datetime
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union, TYPE_CHECKING
+
+from .generated import models as _models
+from .generated._serialization import Deserializer, Serializer
+from .json_backends import JSONBackend, get_json_backend
+from .paging import _next_page_number
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from .generated import ContextAPI
+    from .generated.aio import ContextAPI as AsyncContextAPI
+    from .generated.models import ConversationResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    tenant TEXT NOT NULL,
+    id TEXT NOT NULL,
+    body BLOB NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (tenant, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS watermarks (
+    tenant TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+_UPSERT = "INSERT OR REPLACE INTO conversations (tenant, id, body, synced_at) VALUES (?, ?, ?, ?)"
+
+
+class SyncResult(NamedTuple):
+    """Outcome of a :meth:`ConversationStore.sync`.
+
+    :ivar tenant_id: The tenant synced, or None for all conversations the credential can read.
+    :ivar start_time: Start of the window fetched, or None if it was the full history.
+    :ivar end_time: End of the window fetched, now the tenant's watermark.
+    :ivar pages: Pages fetched.
+    :ivar conversations: Conversations written.
+    """
+
+    tenant_id: Optional[int]
+    start_time: Optional[str]
+    end_time: str
+    pages: int
+    conversations: int
+
+
+def _tenant_key(tenant_id: Optional[int]) -> str:
+    return "" if tenant_id is None else str(tenant_id)
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class ConversationStore:
+    """Local SQLite store of conversations, kept up to date by incremental syncs.
+
+    :meth:`sync` fetches the conversations after a tenant's watermark, the end of its last
+    successful sync, and writes each page in one transaction. The watermark only moves once
+    every page of the window has been written, so a failed sync is repeated by the next one.
+    Conversations are stored as the JSON the API returned, and deserialized into
+    :class:`~getcontext.generated.models.ConversationResponse` when read.
+
+    Each sync starts ``overlap`` before the watermark, to pick up conversations the server
+    recorded late; they replace their stored copy. Conversations changed after the window
+    they were synced in are only refreshed by a ``full`` sync.
+
+    :param str path: The SQLite database file, created if it doesn't exist. ``":memory:"``
+     keeps the store in memory.
+    :keyword overlap: How far before the watermark each sync starts. Default value is five minutes.
+    :paramtype overlap: ~datetime.timedelta
+    :keyword json_backend: Decodes and encodes the stored JSON: a
+     :class:`~getcontext.json_backends.JSONBackend`, ``"json"``, ``"orjson"`` or ``"auto"``.
+     Default value is "json".
+    :paramtype json_backend: str or ~getcontext.json_backends.JSONBackend
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        overlap: datetime.timedelta = datetime.timedelta(minutes=5),
+        json_backend: Optional[Union[str, JSONBackend]] = None,
+    ) -> None:
+        self.path = path
+        self.overlap = overlap
+        self._json = get_json_backend(json_backend)
+        self._deserialize = Deserializer({k: v for k, v in _models.__dict__.items() if isinstance(v, type)})
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def watermark(self, tenant_id: Optional[int] = None) -> Optional[datetime.datetime]:
+        """End of the tenant's last successful sync.
+
+        :param int tenant_id: The tenant. Default value is None, for the sync without a tenant filter.
+        :return: The watermark, or None if the tenant was never synced.
+        :rtype: ~datetime.datetime or None
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT watermark FROM watermarks WHERE tenant = ?", (_tenant_key(tenant_id),)
+            ).fetchone()
+        return None if row is None else Deserializer.deserialize_iso(row[0])
+
+    def sync(
+        self,
+        client: "ContextAPI",
+        *,
+        tenant_id: Optional[int] = None,
+        start_time: Optional[Union[str, datetime.datetime]] = None,
+        per_page: int = 500,
+        full: bool = False,
+        **kwargs: Any,
+    ) -> SyncResult:
+        """Fetches the tenant's conversations since its watermark and stores them.
+
+        :param client: The client to fetch with.
+        :type client: ~getcontext.generated.ContextAPI
+        :keyword int tenant_id: The tenant. Default value is None, for no tenant filter.
+        :keyword start_time: Where the first sync of the tenant starts. Default value is None,
+         for the full history.
+        :paramtype start_time: str or ~datetime.datetime
+        :keyword int per_page: Number of conversations per page. Default value is 500.
+        :keyword bool full: Whether to ignore the watermark and sync from ``start_time``, e.g.
+         to refresh conversations changed since they were stored. Default value is False.
+        :return: What was fetched.
+        :rtype: ~getcontext.store.SyncResult
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        window = self._window(tenant_id, start_time, full)
+        pages = written = 0
+        page: Optional[int] = 1
+        while page is not None:
+            stream = client.stream_conversations(
+                start_time=window[0], end_time=window[1], page=page, per_page=per_page, tenant_id=tenant_id, **kwargs
+            )
+            written += self._write(tenant_id, stream.read_json())
+            pages += 1
+            page = _next_page_number(stream.pagination, stream.count)
+        return self._advance(tenant_id, window, pages, written)
+
+    async def sync_async(
+        self,
+        client: "AsyncContextAPI",
+        *,
+        tenant_id: Optional[int] = None,
+        start_time: Optional[Union[str, datetime.datetime]] = None,
+        per_page: int = 500,
+        full: bool = False,
+        **kwargs: Any,
+    ) -> SyncResult:
+        """Async counterpart of :meth:`sync`, fetching with the async client.
+
+        Writes happen on the event loop, one short transaction per page.
+
+        :param client: The client to fetch with.
+        :type client: ~getcontext.generated.aio.ContextAPI
+        :keyword int tenant_id: The tenant. Default value is None, for no tenant filter.
+        :keyword start_time: Where the first sync of the tenant starts. Default value is None,
+         for the full history.
+        :paramtype start_time: str or ~datetime.datetime
+        :keyword int per_page: Number of conversations per page. Default value is 500.
+        :keyword bool full: Whether to ignore the watermark and sync from ``start_time``.
+         Default value is False.
+        :return: What was fetched.
+        :rtype: ~getcontext.store.SyncResult
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        window = self._window(tenant_id, start_time, full)
+        pages = written = 0
+        page: Optional[int] = 1
+        while page is not None:
+            stream = await client.stream_conversations(
+                start_time=window[0], end_time=window[1], page=page, per_page=per_page, tenant_id=tenant_id, **kwargs
+            )
+            written += self._write(tenant_id, await stream.read_json())
+            pages += 1
+            page = _next_page_number(stream.pagination, stream.count)
+        return self._advance(tenant_id, window, pages, written)
+
+    def _window(
+        self, tenant_id: Optional[int], start_time: Optional[Union[str, datetime.datetime]], full: bool
+    ) -> Tuple[Optional[str], str]:
+        watermark = None if full else self.watermark(tenant_id)
+        if watermark is not None:
+            start: Optional[str] = Serializer.serialize_iso(watermark - self.overlap)
+        elif isinstance(start_time, datetime.datetime):
+            start = Serializer.serialize_iso(start_time)
+        else:
+            start = start_time
+        # Fixed before the first page, so that pages are consistent and the watermark leaves no gap.
+        return start, Serializer.serialize_iso(_now())
+
+    def _write(self, tenant_id: Optional[int], conversations: List[Dict[str, Any]]) -> int:
+        tenant = _tenant_key(tenant_id)
+        synced_at = Serializer.serialize_iso(_now())
+        dumps = self._json.dumps
+        rows = [(tenant, conversation["id"], dumps(conversation), synced_at) for conversation in conversations]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(_UPSERT, rows)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return len(rows)
+
+    def _advance(
+        self, tenant_id: Optional[int], window: Tuple[Optional[str], str], pages: int, written: int
+    ) -> SyncResult:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO watermarks (tenant, watermark, synced_at) VALUES (?, ?, ?)",
+                (_tenant_key(tenant_id), window[1], Serializer.serialize_iso(_now())),
+            )
+        _LOGGER.debug("Synced %s conversations in %s pages for tenant %s.", written, pages, tenant_id)
+        return SyncResult(tenant_id, window[0], window[1], pages, written)
+
+    def get(self, id: str, tenant_id: Optional[int] = None) -> Optional["ConversationResponse"]:
+        """Returns a stored conversation.
+
+        :param str id: The conversation id.
+        :param int tenant_id: The tenant it was synced for. Default value is None.
+        :rtype: ~getcontext.generated.models.ConversationResponse or None
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body FROM conversations WHERE tenant = ? AND id = ?", (_tenant_key(tenant_id), id)
+            ).fetchone()
+        return None if row is None else self._deserialize("ConversationResponse", self._json.loads(row[0]))
+
+    def iter_json(self, tenant_id: Optional[int] = None, *, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Iterates the stored conversations of a tenant as decoded from JSON, in id order.
+
+        :param int tenant_id: The tenant. Default value is None.
+        :keyword int batch_size: Rows read from the database at a time. Default value is 1000.
+        :rtype: iterator[dict]
+        """
+        loads = self._json.loads
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT id, body FROM conversations WHERE tenant = ? AND id > ? ORDER BY id LIMIT ?",
+                    (_tenant_key(tenant_id), last, batch_size),
+                ).fetchall()
+            for _, body in rows:
+                yield loads(body)
+            if len(rows) < batch_size:
+                return
+            last = rows[-1][0]
+
+    def conversations(self, tenant_id: Optional[int] = None) -> Iterator["ConversationResponse"]:
+        """Iterates the stored conversations of a tenant, in id order.
+
+        :param int tenant_id: The tenant. Default value is None.
+        :rtype: iterator[~getcontext.generated.models.ConversationResponse]
+        """
+        for data in self.iter_json(tenant_id):
+            yield self._deserialize("ConversationResponse", data)
+
+    def count(self, tenant_id: Optional[int] = None) -> int:
+        """Number of stored conversations of a tenant.
+
+        :param int tenant_id: The tenant. Default value is None.
+        :rtype: int
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM conversations WHERE tenant = ?", (_tenant_key(tenant_id),)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "ConversationStore":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return "<ConversationStore path={!r}>".format(self.path)
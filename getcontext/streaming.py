@@ -0,0 +1,377 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, TYPE_CHECKING
+
+from azure.core.exceptions import DeserializationError
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from azure.core.rest import AsyncHttpResponse, HttpResponse
+
+    from .generated._serialization import Deserializer
+    from .generated.models import ConversationResponse, Pagination
+
+# Bytes that change the nesting of a JSON value, or start a string. JSON's structural characters
+# are ASCII, so UTF-8 input can be scanned byte by byte.
+_NESTING_TOKENS = re.compile(rb'["\[\]{}]')
+_SCALAR_END = re.compile(rb"[ \t\n\r,\]}]")
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+
+_START, _KEY, _COLON, _VALUE, _ITEM, _AFTER_ITEM, _AFTER_VALUE, _DONE = range(8)
+
+
+class JSONArraySplitter:
+    """Incrementally splits a JSON object into the items of one array member and its other members.
+
+    Bytes are fed as they arrive. :meth:`feed` returns the raw JSON of each array item as soon
+    as the item is complete, so only the item being received is buffered. Other members are
+    kept raw in ``fields`` until they are decoded by the caller.
+
+    :param str array_key: Name of the top-level member whose items are split out.
+    """
+
+    def __init__(self, array_key: str) -> None:
+        self.array_key = array_key
+        self.fields: Dict[str, bytes] = {}
+        self._buf = bytearray()
+        self._pos = 0
+        self._state = _START
+        self._first = True
+        self._key: Optional[str] = None
+        self._started = False
+        # State of the value being scanned, if any.
+        self._scan_start: Optional[int] = None
+        self._scalar = False
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Consumes the next bytes of the document.
+
+        :param bytes data: The next bytes.
+        :return: The raw JSON of every array item completed by these bytes.
+        :rtype: list[bytes]
+        :raises ~azure.core.exceptions.DeserializationError: If the document is not the expected JSON object.
+        """
+        self._buf += data
+        items: List[bytes] = []
+        while self._step(items, final=False):
+            pass
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """Checks that the document is complete.
+
+        :raises ~azure.core.exceptions.DeserializationError: If the document ended early.
+        """
+        items: List[bytes] = []
+        while self._step(items, final=True):
+            pass
+        if self._state != _DONE or items:
+            raise DeserializationError("JSON is invalid: the document ended before the top-level object was closed.")
+
+    def _step(self, items: List[bytes], final: bool) -> bool:
+        """Advances by one token or value. Returns False when more bytes are needed."""
+        buf = self._buf
+        if self._scan_start is not None:
+            end = self._scan(final)
+            if end is None:
+                return False
+            self._finish_value(end, items)
+            return True
+
+        if not self._started:
+            if len(buf) < len(codecs.BOM_UTF8) and codecs.BOM_UTF8.startswith(bytes(buf)) and not final:
+                return False
+            if buf.startswith(codecs.BOM_UTF8):
+                self._pos = len(codecs.BOM_UTF8)
+            self._started = True
+        pos = _WHITESPACE.match(buf, self._pos).end()  # type: ignore
+        self._pos = pos
+        if pos >= len(buf):
+            return False
+        char = buf[pos : pos + 1]
+        state = self._state
+
+        if state == _START and char == b"{":
+            self._state, self._first = _KEY, True
+        elif state == _KEY and char == b"}" and self._first:
+            self._state = _DONE
+        elif state == _KEY and char == b'"':
+            return self._start_value(pos)
+        elif state == _COLON and char == b":":
+            self._state = _VALUE
+        elif state == _VALUE:
+            if self._key == self.array_key and char == b"[":
+                self._state, self._first = _ITEM, True
+            else:
+                return self._start_value(pos)
+        elif state == _ITEM and char == b"]" and self._first:
+            self._state = _AFTER_VALUE
+        elif state == _ITEM:
+            return self._start_value(pos)
+        elif state == _AFTER_ITEM and char in (b",", b"]"):
+            self._state, self._first = (_ITEM, False) if char == b"," else (_AFTER_VALUE, False)
+        elif state == _AFTER_VALUE and char in (b",", b"}"):
+            self._state, self._first = (_KEY, False) if char == b"," else (_DONE, False)
+        else:
+            raise DeserializationError(
+                "JSON is invalid: unexpected {!r} in the response body.".format(char.decode("utf-8", "replace"))
+            )
+        self._pos = pos + 1
+        return True
+
+    def _start_value(self, pos: int) -> bool:
+        char = self._buf[pos : pos + 1]
+        self._scan_start = pos
+        self._scalar = char not in (b'"', b"[", b"{")
+        self._in_string = char == b'"'
+        self._depth = 1 if char in (b"[", b"{") else 0
+        self._pos = pos if self._scalar else pos + 1
+        return True
+
+    def _scan(self, final: bool) -> Optional[int]:
+        """Advances over the value being scanned. Returns its end, or None when more bytes are needed."""
+        buf = self._buf
+        pos = self._pos
+        if self._scalar:
+            match = _SCALAR_END.search(buf, pos)
+            if match is None:
+                self._pos = len(buf)
+                return len(buf) if final else None
+            return match.start()
+        while True:
+            if self._in_string:
+                end = self._string_end(pos)
+                if end is None:
+                    return None
+                pos = end
+                self._in_string = False
+                if self._depth == 0:
+                    return pos
+            match = _NESTING_TOKENS.search(buf, pos)
+            if match is None:
+                self._pos = len(buf)
+                return None
+            token = match.group()
+            pos = match.end()
+            if token == b'"':
+                self._in_string = True
+            elif token in (b"[", b"{"):
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return pos
+
+    def _string_end(self, pos: int) -> Optional[int]:
+        """Finds the end of the string being scanned, or records where to resume."""
+        buf = self._buf
+        while True:
+            quote = buf.find(b'"', pos)
+            if quote < 0:
+                self._pos = len(buf)
+                return None
+            # The quote is escaped if an odd number of backslashes precede it. The string's opening
+            # quote is still buffered, so counting never runs past the start of the string.
+            backslash = quote
+            while buf[backslash - 1] == 0x5C:  # '\\'
+                backslash -= 1
+            if (quote - backslash) % 2 == 0:
+                return quote + 1
+            pos = quote + 1
+
+    def _finish_value(self, end: int, items: List[bytes]) -> None:
+        raw = bytes(self._buf[self._scan_start : end])
+        self._scan_start = None
+        self._pos = end
+        if self._state == _KEY:
+            self._key = json.loads(raw)
+            self._state = _COLON
+        elif self._state == _ITEM:
+            items.append(raw)
+            self._state = _AFTER_ITEM
+        else:
+            self.fields[self._key] = raw  # type: ignore
+            self._state = _AFTER_VALUE
+
+    def _compact(self) -> None:
+        consumed = self._pos if self._scan_start is None else self._scan_start
+        if consumed:
+            del self._buf[:consumed]
+            self._pos -= consumed
+            if self._scan_start is not None:
+                self._scan_start -= consumed
+
+
+class _ConversationStreamBase:
+    def __init__(self, response: Any, deserializer: "Deserializer", json_loads: Optional[Callable[[bytes], Any]]):
+        self._response = response
+        self._deserialize = deserializer
+        self._loads = json_loads or json.loads
+        self._splitter = JSONArraySplitter("conversations")
+        self.pagination: Optional["Pagination"] = None
+        self.count = 0
+
+    def _items(self, chunk: bytes) -> Iterator["ConversationResponse"]:
+        for data in self._json_items(chunk):
+            yield self._deserialize._deserialize("ConversationResponse", data)  # pylint: disable=protected-access
+
+    def _json_items(self, chunk: bytes) -> Iterator[Dict[str, Any]]:
+        for raw in self._splitter.feed(chunk):
+            self.count += 1
+            yield self._loads(raw)
+
+    def _finish(self) -> None:
+        self._splitter.close()
+        raw = self._splitter.fields.get("pagination")
+        if raw is not None:
+            self.pagination = self._deserialize._deserialize(  # pylint: disable=protected-access
+                "Pagination", self._loads(raw)
+            )
+
+    def _page(self, body: bytes) -> List[Dict[str, Any]]:
+        try:
+            data = self._loads(body)
+        except ValueError as err:
+            raise DeserializationError("JSON is invalid: {}".format(err), err) from err
+        if not isinstance(data, dict):
+            raise DeserializationError("JSON is invalid: the response body is not an object.")
+        conversations = data.get("conversations") or []
+        self.count = len(conversations)
+        if data.get("pagination") is not None:
+            self.pagination = self._deserialize._deserialize(  # pylint: disable=protected-access
+                "Pagination", data["pagination"]
+            )
+        return conversations
+
+
+class ConversationStream(_ConversationStreamBase):
+    """Conversations of one ``conversations`` page, deserialized as the response body arrives.
+
+    Iterate to get each :class:`~getcontext.generated.models.ConversationResponse` as soon
+    as it has been received. Memory stays bounded by one conversation rather than the page.
+    ``pagination`` is set once the iteration is complete. The response is closed when the
+    iteration ends, or by :meth:`close`.
+
+    :ivar pagination: The page's pagination, or None until the iteration is complete.
+    :vartype pagination: ~getcontext.generated.models.Pagination
+    :ivar int count: Conversations yielded so far.
+    """
+
+    def __init__(
+        self,
+        response: "HttpResponse",
+        deserializer: "Deserializer",
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+    ) -> None:
+        super().__init__(response, deserializer, json_loads)
+
+    def __iter__(self) -> Iterator["ConversationResponse"]:
+        try:
+            for chunk in self._response.iter_bytes():
+                yield from self._items(chunk)
+            self._finish()
+        finally:
+            self.close()
+
+    def iter_json(self) -> Iterator[Dict[str, Any]]:
+        """Iterates the conversations as decoded from JSON, without deserializing them into models.
+
+        Use either this or iteration over the stream itself, not both.
+
+        :rtype: iterator[dict]
+        """
+        try:
+            for chunk in self._response.iter_bytes():
+                yield from self._json_items(chunk)
+            self._finish()
+        finally:
+            self.close()
+
+    def read_json(self) -> List[Dict[str, Any]]:
+        """Reads the whole page and returns its conversations as decoded from JSON.
+
+        No model is created for them. This decodes the page in one call, which is faster than
+        iterating when the page fits in memory. Use it instead of iterating the stream.
+
+        :rtype: list[dict]
+        """
+        try:
+            return self._page(self._response.read())
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __enter__(self) -> "ConversationStream":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+
+class AsyncConversationStream(_ConversationStreamBase):
+    """Async counterpart of :class:`ConversationStream`, iterated with ``async for``.
+
+    :ivar pagination: The page's pagination, or None until the iteration is complete.
+    :vartype pagination: ~getcontext.generated.models.Pagination
+    :ivar int count: Conversations yielded so far.
+    """
+
+    def __init__(
+        self,
+        response: "AsyncHttpResponse",
+        deserializer: "Deserializer",
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+    ) -> None:
+        super().__init__(response, deserializer, json_loads)
+
+    async def __aiter__(self) -> AsyncIterator["ConversationResponse"]:
+        try:
+            async for chunk in self._response.iter_bytes():
+                for conversation in self._items(chunk):
+                    yield conversation
+            self._finish()
+        finally:
+            await self.close()
+
+    async def iter_json(self) -> AsyncIterator[Dict[str, Any]]:
+        """Iterates the conversations as decoded from JSON, without deserializing them into models.
+
+        Use either this or iteration over the stream itself, not both.
+
+        :rtype: async iterator[dict]
+        """
+        try:
+            async for chunk in self._response.iter_bytes():
+                for data in self._json_items(chunk):
+                    yield data
+            self._finish()
+        finally:
+            await self.close()
+
+    async def read_json(self) -> List[Dict[str, Any]]:
+        """Reads the whole page and returns its conversations as decoded from JSON.
+
+        No model is created for them. This decodes the page in one call, which is faster than
+        iterating when the page fits in memory. Use it instead of iterating the stream.
+
+        :rtype: list[dict]
+        """
+        try:
+            return self._page(await self._response.read())
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        await self._response.close()
+
+    async def __aenter__(self) -> "AsyncConversationStream":
+        return self
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self.close()
@@ -0,0 +1,207 @@
+import collections
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from .generated.models import ThreadMessage
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from .generated.models import (
+        Thread,
+        PathsDo7Pm8ApiV1LogConversationThreadPostResponses201ContentApplicationJsonSchema as ThreadResponse,
+    )
+    from .generated.operations import LogOperations
+    from .generated.aio.operations import LogOperations as AsyncLogOperations
+
+
+# Keywords of the wrapped log calls that the generated ``update_conversation_thread`` does not take.
+_LOG_CALL_KEYWORDS = ("sample_key", "spool")
+
+
+class _Snapshot(NamedTuple):
+    header: str
+    messages: Tuple[str, ...]
+    ratings: Tuple[Optional[int], ...]
+
+
+class _Tracked(NamedTuple):
+    snapshot: _Snapshot
+    response: Any
+
+
+def _digest(data: Any) -> str:
+    return hashlib.blake2b(json.dumps(data, sort_keys=True, default=str).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _ThreadTrackerBase:
+    def __init__(self, log_operations: Any, *, max_threads: int = 1000) -> None:
+        if max_threads < 1:
+            raise ValueError("Parameter 'max_threads' must be at least 1.")
+        self._log = log_operations
+        self.max_threads = max_threads
+        self._threads: "collections.OrderedDict[str, _Tracked]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        self.sent = 0
+        self.patched = 0
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._threads)
+
+    def forget(self, thread_id: str) -> None:
+        """Stops tracking a thread, so the next call for it sends the whole thread.
+
+        :param str thread_id: The thread id.
+        """
+        with self._lock:
+            self._threads.pop(thread_id, None)
+
+    def _snapshot(self, thread: "Thread") -> _Snapshot:
+        data = self._log._serialize.body(thread, "Thread")  # pylint: disable=protected-access
+        messages = data.get("messages") or []
+        header = _digest({key: value for key, value in data.items() if key not in ("id", "messages")})
+        return _Snapshot(
+            header,
+            tuple(_digest({key: value for key, value in m.items() if key != "rating"}) for m in messages),
+            tuple(m.get("rating") for m in messages),
+        )
+
+    def _lookup(self, thread_id: Optional[str], snapshot: _Snapshot) -> Optional[_Tracked]:
+        """Returns what was acknowledged for the thread, if only ratings can have changed since."""
+        if thread_id is None:
+            return None
+        with self._lock:
+            tracked = self._threads.get(thread_id)
+            if tracked is None:
+                return None
+            self._threads.move_to_end(thread_id)
+        previous = tracked.snapshot
+        if previous.header != snapshot.header or previous.messages != snapshot.messages:
+            return None
+        return tracked
+
+    def _record(self, thread_id: Optional[str], snapshot: _Snapshot, response: Any) -> None:
+        if thread_id is None:
+            thread_id = getattr(getattr(response, "data", None), "id", None)
+        if thread_id is None or response is None:
+            return
+        with self._lock:
+            self._threads[thread_id] = _Tracked(snapshot, response)
+            self._threads.move_to_end(thread_id)
+            while len(self._threads) > self.max_threads:
+                self._threads.popitem(last=False)
+
+    @staticmethod
+    def _ratings_body(snapshot: _Snapshot) -> List[ThreadMessage]:
+        return [ThreadMessage(rating=rating) for rating in snapshot.ratings]
+
+    @staticmethod
+    def _patch_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in kwargs.items() if key not in _LOG_CALL_KEYWORDS}
+
+
+class ThreadTracker(_ThreadTrackerBase):
+    """Logs a growing thread repeatedly without resending what the service already has.
+
+    The tracker remembers, per thread id, the messages and ratings last acknowledged by
+    ``log.conversation_thread``. Logging the same thread again is skipped when nothing
+    changed, and sent as a ``log.update_conversation_thread`` ratings PATCH when only
+    ratings changed. The service has no call for appending messages to a thread, so new or
+    edited messages are sent as a full ``log.conversation_thread`` call, as are threads the
+    tracker has evicted or the PATCH reports as not found. The payload therefore still grows
+    with the whole thread every time a message is added; only unchanged threads and rating
+    changes are cheaper.
+
+    Keyword arguments are passed to both calls, except ``tenant_id``, ``sample_key`` and
+    ``spool``, which only ``log.conversation_thread`` takes.
+
+    :param log_operations: The operations group used to send, usually ``client.log``.
+    :type log_operations: ~getcontext.generated.operations.LogOperations
+    :keyword int max_threads: Threads remembered before the least recently logged one is
+     evicted. Default value is 1000.
+    """
+
+    def __init__(self, log_operations: "LogOperations", *, max_threads: int = 1000) -> None:
+        super().__init__(log_operations, max_threads=max_threads)
+
+    def log(self, thread: "Thread", *, tenant_id: Optional[str] = None, **kwargs: Any) -> "ThreadResponse":
+        """Logs the current state of a thread.
+
+        :param thread: The thread, including every message so far.
+        :type thread: ~getcontext.generated.models.Thread
+        :keyword tenant_id: The tenant ID to log the conversation against. Default value is None.
+        :paramtype tenant_id: str
+        :return: The response of the last full ``log.conversation_thread`` call for the thread.
+        :rtype: ~getcontext.generated.models.PathsDo7Pm8ApiV1LogConversationThreadPostResponses201ContentApplicationJsonSchema
+        """
+        snapshot = self._snapshot(thread)
+        tracked = self._lookup(thread.id, snapshot)
+        if tracked is not None:
+            if tracked.snapshot.ratings == snapshot.ratings:
+                self.skipped += 1
+                return tracked.response
+            try:
+                self._log.update_conversation_thread(
+                    id=thread.id, body=self._ratings_body(snapshot), **self._patch_kwargs(kwargs)
+                )
+            except ResourceNotFoundError:
+                self.forget(thread.id)
+            else:
+                self.patched += 1
+                self._record(thread.id, snapshot, tracked.response)
+                return tracked.response
+
+        response = self._log.conversation_thread({"conversation": thread}, tenant_id=tenant_id, **kwargs)
+        self.sent += 1
+        self._record(thread.id, snapshot, response)
+        return response
+
+
+class AsyncThreadTracker(_ThreadTrackerBase):
+    """Async counterpart of :class:`ThreadTracker` for the aio client.
+
+    :param log_operations: The operations group used to send, usually ``client.log``.
+    :type log_operations: ~getcontext.generated.aio.operations.LogOperations
+    :keyword int max_threads: Threads remembered before the least recently logged one is
+     evicted. Default value is 1000.
+    """
+
+    def __init__(self, log_operations: "AsyncLogOperations", *, max_threads: int = 1000) -> None:
+        super().__init__(log_operations, max_threads=max_threads)
+
+    async def log(self, thread: "Thread", *, tenant_id: Optional[str] = None, **kwargs: Any) -> "ThreadResponse":
+        """Logs the current state of a thread.
+
+        :param thread: The thread, including every message so far.
+        :type thread: ~getcontext.generated.models.Thread
+        :keyword tenant_id: The tenant ID to log the conversation against. Default value is None.
+        :paramtype tenant_id: str
+        :return: The response of the last full ``log.conversation_thread`` call for the thread.
+        :rtype: ~getcontext.generated.models.PathsDo7Pm8ApiV1LogConversationThreadPostResponses201ContentApplicationJsonSchema
+        """
+        snapshot = self._snapshot(thread)
+        tracked = self._lookup(thread.id, snapshot)
+        if tracked is not None:
+            if tracked.snapshot.ratings == snapshot.ratings:
+                self.skipped += 1
+                return tracked.response
+            try:
+                await self._log.update_conversation_thread(
+                    id=thread.id, body=self._ratings_body(snapshot), **self._patch_kwargs(kwargs)
+                )
+            except ResourceNotFoundError:
+                self.forget(thread.id)
+            else:
+                self.patched += 1
+                self._record(thread.id, snapshot, tracked.response)
+                return tracked.response
+
+        response = await self._log.conversation_thread({"conversation": thread}, tenant_id=tenant_id, **kwargs)
+        self.sent += 1
+        self._record(thread.id, snapshot, response)
+        return response
@@ -0,0 +1,208 @@
+"""Stub transports for exercising the clients without a network."""
+
+import collections
+import io
+import json
+import threading
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from azure.core.pipeline.transport import AsyncHttpTransport, HttpTransport
+from azure.core.rest import HttpRequest
+from azure.core.rest._http_response_impl import HttpResponseImpl
+from azure.core.rest._http_response_impl_async import AsyncHttpResponseImpl
+
+from getcontext.token import AsyncCredential, Credential
+
+# A response as (status code, body, headers). A dict or list body is sent as JSON.
+Reply = Tuple[int, Any, Dict[str, str]]
+Handler = Callable[[HttpRequest], Union[Reply, Exception]]
+
+
+def reply(status_code: int = 200, body: Any = None, headers: Optional[Dict[str, str]] = None) -> Reply:
+    return status_code, body, dict(headers or {})
+
+
+def _encode(body: Any, headers: Dict[str, str]) -> bytes:
+    if body is None:
+        return b""
+    if isinstance(body, bytes):
+        return body
+    headers.setdefault("Content-Type", "application/json")
+    return json.dumps(body).encode("utf-8")
+
+
+class StubResponse(HttpResponseImpl):
+    def __init__(
+        self, request: HttpRequest, status_code: int, content: bytes, headers: Dict[str, str], block_size: int
+    ) -> None:
+        def download(response: Any, pipeline: Any, decompress: bool) -> Any:
+            for i in range(0, len(content), block_size):
+                yield content[i : i + block_size]
+
+        super().__init__(
+            request=request,
+            internal_response=io.BytesIO(content),
+            block_size=block_size,
+            status_code=status_code,
+            reason="OK" if status_code < 400 else "Error",
+            content_type=headers.get("Content-Type"),
+            headers=headers,
+            stream_download_generator=download,
+        )
+
+
+class _AsyncBody:
+    async def close(self) -> None:
+        pass
+
+
+class AsyncStubResponse(AsyncHttpResponseImpl):
+    def __init__(
+        self, request: HttpRequest, status_code: int, content: bytes, headers: Dict[str, str], block_size: int
+    ) -> None:
+        async def download(response: Any, pipeline: Any, decompress: bool) -> Any:
+            for i in range(0, len(content), block_size):
+                yield content[i : i + block_size]
+
+        super().__init__(
+            request=request,
+            internal_response=_AsyncBody(),
+            block_size=block_size,
+            status_code=status_code,
+            reason="OK" if status_code < 400 else "Error",
+            content_type=headers.get("Content-Type"),
+            headers=headers,
+            stream_download_generator=download,
+        )
+
+
+class _StubTransportBase:
+    """Answers requests from queued replies, then a handler, and records them.
+
+    Without either, GET requests get 200 and others 201, with an empty body.
+
+    :param handler: Called with each request. Returns a reply, or an exception to raise.
+    :param int block_size: Size of the chunks a streamed body is delivered in.
+    """
+
+    def __init__(self, handler: Optional[Handler] = None, *, block_size: int = 4096) -> None:
+        self.handler = handler
+        self.block_size = block_size
+        self.requests: List[HttpRequest] = []
+        self.replies: Deque[Union[Reply, Exception]] = collections.deque()
+        self._lock = threading.Lock()
+
+    def _reply(self, request: HttpRequest, stream: bool) -> Tuple[int, bytes, Dict[str, str]]:
+        with self._lock:
+            self.requests.append(request)
+            if self.replies:
+                result = self.replies.popleft()
+            else:
+                result = None
+        if result is None:
+            if self.handler is not None:
+                result = self.handler(request)
+            else:
+                result = reply(200 if request.method == "GET" else 201)
+        if isinstance(result, Exception):
+            raise result
+        status_code, body, headers = result
+        headers = dict(headers)
+        return status_code, _encode(body, headers), headers
+
+    def bodies(self) -> List[Any]:
+        """The JSON bodies of the requests sent so far."""
+        return [json.loads(request.content) for request in self.requests]
+
+
+class StubTransport(_StubTransportBase, HttpTransport):
+    def send(self, request: HttpRequest, **kwargs: Any) -> StubResponse:  # type: ignore[override]
+        status_code, content, headers = self._reply(request, kwargs.get("stream", False))
+        response = StubResponse(request, status_code, content, headers, self.block_size)
+        if not kwargs.get("stream", False):
+            response.read()
+        return response
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+class AsyncStubTransport(_StubTransportBase, AsyncHttpTransport):
+    async def send(self, request: HttpRequest, **kwargs: Any) -> AsyncStubResponse:  # type: ignore[override]
+        status_code, content, headers = self._reply(request, kwargs.get("stream", False))
+        response = AsyncStubResponse(request, status_code, content, headers, self.block_size)
+        if not kwargs.get("stream", False):
+            await response.read()
+        return response
+
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+def client(transport: Optional[StubTransport] = None, **kwargs: Any) -> Any:
+    """A client sending through a stub transport, without retries."""
+    from getcontext import ContextAPI
+
+    kwargs.setdefault("retry_total", 0)
+    return ContextAPI(Credential("token"), transport=transport or StubTransport(), **kwargs)
+
+
+def async_client(transport: Optional[AsyncStubTransport] = None, **kwargs: Any) -> Any:
+    """An async client sending through a stub transport, without retries."""
+    from getcontext.generated.aio import ContextAPI
+
+    kwargs.setdefault("retry_total", 0)
+    return ContextAPI(AsyncCredential("token"), transport=transport or AsyncStubTransport(), **kwargs)
+
+
+def conversation_json(index: int, **fields: Any) -> Dict[str, Any]:
+    """A ConversationResponse as the API returns it."""
+    timestamp = "2024-01-01T00:{:02d}:{:02d}.000Z".format(index // 60 % 60, index % 60)
+    data = {
+        "id": "conversation-{}".format(index),
+        "metadata": {"index": str(index)},
+        "sentiment_trend": "flat",
+        "topics": [{"id": "topic-1", "name": "greeting"}],
+        "suggested_topics": [],
+        "messages": [
+            {
+                "type": "message",
+                "event_timestamp": timestamp,
+                "role": "user",
+                "message": "Hello {}".format(index),
+                "rating": 0,
+                "language": "en",
+                "sentiment": 0.5,
+                "topics": [{"id": "topic-1", "name": "greeting"}],
+                "metadata": {"source": "test"},
+            },
+        ],
+    }
+    data.update(fields)
+    return data
+
+
+def page_json(conversations: List[Dict[str, Any]], page: int, pages: int, **pagination: Any) -> Dict[str, Any]:
+    """A conversations page as the API returns it."""
+    info = {
+        "total_records": len(conversations) * pages,
+        "per_page": len(conversations),
+        "current_page": page,
+        "previous_page": max(page - 1, 1),
+        "next_page": min(page + 1, pages),
+        "page_count": pages,
+    }
+    info.update(pagination)
+    return {"conversations": conversations, "pagination": info}
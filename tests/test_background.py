@@ -0,0 +1,169 @@
+import asyncio
+import threading
+import unittest
+
+from azure.core.exceptions import ServiceRequestError
+
+from getcontext.background import AsyncBackgroundLogger, BackgroundLogger
+from getcontext.generated.models import Conversation, Message
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client, reply
+
+
+def _conversation(text):
+    return Conversation(messages=[Message(role="user", message=text)])
+
+
+class BackgroundLoggerTest(unittest.TestCase):
+    def test_flush_sends_queued_calls(self):
+        transport = StubTransport()
+        with client(transport) as c:
+            logger = BackgroundLogger(c.log, flush_interval=60)
+            for i in range(3):
+                self.assertTrue(logger.conversation(_conversation(str(i))))
+            self.assertTrue(logger.flush(timeout=5))
+            logger.close()
+
+        messages = [body["conversation"]["messages"][0]["message"] for body in transport.bodies()]
+        self.assertEqual(messages, ["0", "1", "2"])
+        self.assertEqual(logger.sent, 3)
+
+    def test_batch_size_triggers_flush(self):
+        sent = threading.Event()
+
+        def handler(request):
+            if len(transport.requests) == 2:
+                sent.set()
+            return reply(201)
+
+        transport = StubTransport(handler)
+        with client(transport) as c:
+            logger = BackgroundLogger(c.log, batch_size=2, flush_interval=60)
+            logger.conversation(_conversation("a"))
+            logger.conversation(_conversation("b"))
+            self.assertTrue(sent.wait(timeout=5))
+            logger.close()
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_close_drains_queue(self):
+        transport = StubTransport()
+        with client(transport) as c:
+            logger = BackgroundLogger(c.log, flush_interval=60)
+            logger.conversation(_conversation("a"), tenant_id="tenant")
+            logger.close()
+            self.assertEqual(logger.sent, 1)
+            self.assertIn("tenant_id=tenant", transport.requests[0].url)
+            with self.assertRaises(RuntimeError):
+                logger.conversation(_conversation("b"))
+
+    def test_full_queue_drops(self):
+        release = threading.Event()
+        transport = StubTransport(lambda request: release.wait(5) and (201, None, {}))
+        with client(transport) as c:
+            logger = BackgroundLogger(c.log, max_queue_size=1, batch_size=1)
+            logger.conversation(_conversation("in flight"))
+            # Wait for the worker to take the first call, leaving the queue empty.
+            while not transport.requests:
+                threading.Event().wait(0.01)
+            self.assertTrue(logger.conversation(_conversation("queued")))
+            with self.assertLogs("getcontext.background", "WARNING"):
+                self.assertFalse(logger.conversation(_conversation("dropped")))
+            release.set()
+            logger.close()
+        self.assertEqual((logger.sent, logger.dropped), (2, 1))
+
+    def test_failures_are_counted(self):
+        transport = StubTransport(lambda request: ServiceRequestError("offline"))
+        with client(transport) as c:
+            logger = BackgroundLogger(c.log)
+            logger.conversation(_conversation("a"))
+            with self.assertLogs("getcontext.background", "WARNING"):
+                logger.close()
+        self.assertEqual((logger.sent, logger.failed), (0, 1))
+
+    def test_unknown_operation(self):
+        with client() as c:
+            logger = BackgroundLogger(c.log)
+            with self.assertRaises(ValueError):
+                logger.submit("no_such_operation", {})
+            logger.close()
+
+
+class ClientBackgroundLoggerTest(unittest.TestCase):
+    def test_logger_is_shared_and_drained_on_close(self):
+        transport = StubTransport()
+        with client(transport) as c:
+            logger = c.background_logger(flush_interval=60)
+            self.assertIs(c.background_logger(), logger)
+            self.assertIs(c.background_logger(flush_interval=60), logger)
+            logger.conversation(_conversation("a"))
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_other_kwargs_raise(self):
+        with client() as c:
+            c.background_logger(batch_size=10)
+            with self.assertRaises(ValueError):
+                c.background_logger(batch_size=20)
+
+
+class AsyncBackgroundLoggerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_flush_sends_queued_calls(self):
+        transport = AsyncStubTransport()
+        async with async_client(transport) as c:
+            logger = AsyncBackgroundLogger(c.log, concurrency=2)
+            for i in range(5):
+                await logger.conversation(_conversation(str(i)))
+            self.assertTrue(await logger.flush(timeout=5))
+            await logger.aclose()
+
+        messages = sorted(body["conversation"]["messages"][0]["message"] for body in transport.bodies())
+        self.assertEqual(messages, ["0", "1", "2", "3", "4"])
+        self.assertEqual(logger.sent, 5)
+
+    async def test_submit_waits_while_queue_is_full(self):
+        release = asyncio.Event()
+
+        class HeldTransport(AsyncStubTransport):
+            async def send(self, request, **kwargs):
+                await release.wait()
+                return await super().send(request, **kwargs)
+
+        async with async_client(HeldTransport()) as c:
+            logger = AsyncBackgroundLogger(c.log, max_queue_size=1, concurrency=1)
+            await logger.conversation(_conversation("in flight"))
+            await asyncio.sleep(0)
+            await logger.conversation(_conversation("queued"))
+            waiting = asyncio.ensure_future(logger.conversation(_conversation("waiting")))
+            await asyncio.sleep(0.01)
+            self.assertFalse(waiting.done())
+            release.set()
+            await asyncio.wait_for(waiting, 5)
+            await logger.aclose()
+        self.assertEqual(logger.sent, 3)
+
+    async def test_aclose_timeout_drops_remaining(self):
+        class HangingTransport(AsyncStubTransport):
+            async def send(self, request, **kwargs):
+                await asyncio.sleep(60)
+
+        async with async_client(HangingTransport()) as c:
+            logger = AsyncBackgroundLogger(c.log, concurrency=1)
+            await logger.conversation(_conversation("in flight"))
+            await logger.conversation(_conversation("queued"))
+            with self.assertLogs("getcontext.background", "WARNING"):
+                await logger.aclose(timeout=0.01)
+        self.assertEqual((logger.sent, logger.dropped), (0, 1))
+
+    async def test_client_logger_is_drained_on_close(self):
+        transport = AsyncStubTransport()
+        async with async_client(transport) as c:
+            logger = c.background_logger(concurrency=2)
+            self.assertIs(c.background_logger(), logger)
+            with self.assertRaises(ValueError):
+                c.background_logger(concurrency=4)
+            await logger.conversation(_conversation("a"))
+        self.assertEqual(len(transport.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from azure.core.exceptions import ServiceRequestError
+from azure.core.rest import HttpRequest
+
+from getcontext.bodies import RawBody, copy_request, iter_ndjson
+from getcontext.spool import Spool
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client
+
+_BODY = json.dumps({"conversation": {"messages": [{"role": "user", "message": "Hello"}]}}).encode("utf-8")
+
+
+def _content(request):
+    body = request.content
+    return bytes(body.getbuffer()) if isinstance(body, RawBody) else body
+
+
+class RawBodyTest(unittest.TestCase):
+    def test_reads_views_of_the_buffer(self):
+        content = bytearray(b"0123456789")
+        body = RawBody(content)
+        self.assertEqual(len(body), 10)
+        first = body.read(4)
+        self.assertIsInstance(first, memoryview)
+        self.assertTrue(first.readonly)
+        self.assertEqual((bytes(first), body.tell()), (b"0123", 4))
+        content[0:1] = b"x"
+        self.assertEqual(bytes(first), b"x123")
+        self.assertEqual(bytes(body.read()), b"456789")
+        self.assertEqual(bytes(body.read(3)), b"")
+
+    def test_seek_and_readinto(self):
+        body = RawBody(b"0123456789")
+        self.assertEqual(body.seek(-3, io.SEEK_END), 7)
+        self.assertEqual(body.seek(-2, io.SEEK_CUR), 5)
+        buffer = bytearray(3)
+        self.assertEqual(body.readinto(buffer), 3)
+        self.assertEqual(buffer, b"567")
+        body.seek(20)
+        self.assertEqual(body.readinto(buffer), 0)
+        with self.assertRaises(ValueError):
+            body.seek(-1)
+
+    def test_iteration_and_getbuffer(self):
+        body = RawBody(memoryview(b"abcdef")[1:4])
+        self.assertEqual([bytes(chunk) for chunk in body], [b"bcd"])
+        self.assertEqual(list(body), [])
+        self.assertEqual(bytes(body.getbuffer()), b"bcd")
+        self.assertEqual(list(RawBody(b"")), [])
+        self.assertEqual(repr(body), "<RawBody 3 bytes>")
+
+    def test_buffers_of_other_formats_are_cast_to_bytes(self):
+        body = RawBody(memoryview(b"abcd").cast("H"))
+        self.assertEqual((len(body), bytes(body.read())), (4, b"abcd"))
+
+    def test_close_releases_the_view(self):
+        content = bytearray(b"abc")
+        body = RawBody(content)
+        body.close()
+        self.assertTrue(body.closed)
+        content.extend(b"d")  # resizing fails while a view is exported
+        body.close()
+
+
+class RawBodyFromFileTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        self.addCleanup(os.remove, self.path)
+        with os.fdopen(handle, "wb") as file:
+            file.write(b"header" + _BODY + b"trailer")
+
+    def test_regions(self):
+        with RawBody.from_file(self.path, 6, len(_BODY)) as body:
+            self.assertEqual(bytes(body.read()), _BODY)
+        with RawBody.from_file(self.path, 6) as body:
+            self.assertEqual(bytes(body.read()), _BODY + b"trailer")
+        with RawBody.from_file(self.path) as body:
+            self.assertEqual(len(body), len(_BODY) + 13)
+
+    def test_regions_outside_the_file(self):
+        size = os.path.getsize(self.path)
+        for offset, length in ((-1, 2), (0, size + 1), (size + 1, None), (4, -2)):
+            with self.subTest(offset=offset, length=length):
+                with self.assertRaises(ValueError):
+                    RawBody.from_file(self.path, offset, length)
+
+
+class IterNdjsonTest(unittest.TestCase):
+    def test_lines(self):
+        content = b'{"a": 1}\n\n  \t\r\n{"b": 2}\r\n{"c": 3}'
+        self.assertEqual([bytes(body.read()) for body in iter_ndjson(content)], [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}'])
+
+    def test_trailing_newline_and_blank_content(self):
+        self.assertEqual([bytes(body.read()) for body in iter_ndjson(b"1\n2\n")], [b"1", b"2"])
+        self.assertEqual(list(iter_ndjson(b"")), [])
+        self.assertEqual(list(iter_ndjson(b"\n \r\n")), [])
+
+    def test_lines_share_the_buffer(self):
+        content = bytearray(b"11\n22\n")
+        bodies = list(iter_ndjson(content))
+        content[3:5] = b"33"
+        self.assertEqual([bytes(body.getbuffer()) for body in bodies], [b"11", b"33"])
+
+
+class CopyRequestTest(unittest.TestCase):
+    def test_headers_are_copied_and_the_body_is_shared(self):
+        body = RawBody(_BODY)
+        request = HttpRequest("POST", "https://example.com/path", headers={"A": "1"}, content=body)
+        request_copy = copy_request(request)
+        request_copy.headers["B"] = "2"
+        request_copy.url = "https://example.com/other"
+        self.assertNotIn("B", request.headers)
+        self.assertEqual(request.url, "https://example.com/path")
+        self.assertEqual(request_copy.headers["a"], "1")
+        self.assertIs(request_copy.content, body)
+
+
+class ClientRawBodyTest(unittest.TestCase):
+    def test_raw_bodies_are_sent_unchanged(self):
+        transport = StubTransport()
+        body = RawBody(_BODY)
+        body.read(5)
+        with client(transport) as c:
+            c.log.conversation(body)
+            c.log.conversation_upsert(RawBody(_BODY), headers={"X-Test": "1"})
+        for request in transport.requests:
+            self.assertEqual(_content(request), _BODY)
+            self.assertEqual(request.headers["Content-Length"], str(len(_BODY)))
+        self.assertIs(transport.requests[0].content, body)
+        self.assertEqual(transport.requests[1].headers["X-Test"], "1")
+
+    def test_raw_bodies_are_spooled_on_failure(self):
+        with tempfile.TemporaryDirectory() as directory:
+            spool = Spool(directory)
+            transport = StubTransport()
+            transport.replies.append(ServiceRequestError("offline"))
+            with client(transport, spool=spool) as c:
+                self.assertIsNone(c.log.conversation(RawBody(_BODY)))
+            records = []
+            spool.replay(records.append)
+            spool.close()
+        self.assertEqual([(record.operation, record.body) for record in records], [("conversation", _BODY)])
+
+
+class AsyncClientRawBodyTest(unittest.IsolatedAsyncioTestCase):
+    async def test_raw_bodies_are_sent_unchanged(self):
+        transport = AsyncStubTransport()
+        async with async_client(transport) as c:
+            for body in iter_ndjson(_BODY + b"\n" + _BODY):
+                await c.log.conversation(body)
+        self.assertEqual([_content(request) for request in transport.requests], [_BODY, _BODY])
+        self.assertEqual(transport.requests[0].headers["Content-Length"], str(len(_BODY)))
+
+
+if __name__ == "__main__":
+    unittest.main()
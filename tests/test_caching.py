@@ -0,0 +1,153 @@
+import unittest
+
+from getcontext.caching import ConversationCache, get_conversation_cache
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client, conversation_json, reply
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ConversationCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.cache = ConversationCache(ttl=10, max_entries=3, max_bytes=100, clock=self.clock)
+
+    def test_entries_are_fresh_for_the_ttl(self):
+        self.assertEqual(self.cache.lookup("a"), (None, False))
+        self.cache.store("a", "value", {"ETag": '"1"'}, 10)
+        entry, fresh = self.cache.lookup("a")
+        self.assertEqual((entry.value, entry.etag, fresh), ("value", '"1"', True))
+        self.clock.now = 10
+        self.assertEqual(self.cache.lookup("a"), (entry, False))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_stale_entries_without_validators_are_dropped(self):
+        self.cache.store("a", "value", {}, 10)
+        self.clock.now = 10
+        self.assertEqual(self.cache.lookup("a"), (None, False))
+        self.assertEqual((len(self.cache), self.cache.size), (0, 0))
+
+    def test_revalidated_entries_are_fresh_again(self):
+        self.cache.store("a", "value", {"last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, 10)
+        self.clock.now = 15
+        entry, fresh = self.cache.lookup("a")
+        self.assertFalse(fresh)
+        self.assertEqual(self.cache.revalidated("a", entry), "value")
+        self.clock.now = 24
+        self.assertEqual(self.cache.lookup("a"), (entry, True))
+        self.assertEqual(self.cache.revalidations, 1)
+
+    def test_conditional_headers(self):
+        self.cache.store("a", "value", {"ETag": '"1"', "Last-Modified": "yesterday"}, 10)
+        entry, _ = self.cache.lookup("a")
+        headers = ConversationCache.conditional_headers(entry, {"X-Test": "1"})
+        self.assertEqual(
+            dict(headers), {"X-Test": "1", "If-None-Match": '"1"', "If-Modified-Since": "yesterday"}
+        )
+        self.assertEqual(dict(ConversationCache.conditional_headers(None, None)), {})
+
+    def test_least_recently_used_entries_are_evicted(self):
+        for key in "abc":
+            self.cache.store(key, key, {}, 10)
+        self.cache.lookup("a")
+        self.cache.store("d", "d", {}, 10)
+        self.assertEqual([self.cache.lookup(key)[0] is not None for key in "abcd"], [True, False, True, True])
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_size_limit(self):
+        self.cache.store("a", "a", {}, 60)
+        self.cache.store("b", "b", {}, 50)
+        self.assertEqual((len(self.cache), self.cache.size, self.cache.evictions), (1, 50, 1))
+        self.cache.store("c", "c", {}, 101)
+        self.assertEqual(self.cache.lookup("c"), (None, False))
+        self.cache.store("b", "b2", {}, 30)
+        self.assertEqual((len(self.cache), self.cache.size), (1, 30))
+
+    def test_no_store_responses_are_not_cached(self):
+        self.cache.store("a", "value", {}, 10)
+        self.cache.store("a", "new", {"Cache-Control": "private, No-Store"}, 10)
+        self.assertEqual((self.cache.lookup("a"), self.cache.size), ((None, False), 0))
+
+    def test_invalidate_and_clear(self):
+        for key in "ab":
+            self.cache.store(key, key, {}, 10)
+        self.cache.invalidate("a")
+        self.cache.invalidate("missing")
+        self.assertEqual((len(self.cache), self.cache.size), (1, 10))
+        self.cache.clear()
+        self.assertEqual((len(self.cache), self.cache.size), (0, 0))
+        self.assertIn("entries=0", repr(self.cache))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ConversationCache(max_entries=0)
+
+    def test_get_conversation_cache(self):
+        self.assertIs(get_conversation_cache(self.cache), self.cache)
+        self.assertIsInstance(get_conversation_cache(True), ConversationCache)
+        self.assertIsNone(get_conversation_cache(False))
+        self.assertIsNone(get_conversation_cache(None))
+
+
+class ClientConversationCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.cache = ConversationCache(ttl=10, clock=self.clock)
+
+    def test_fresh_responses_are_served_from_the_cache(self):
+        transport = StubTransport(lambda request: reply(200, conversation_json(0)))
+        with client(transport, conversation_cache=self.cache) as c:
+            first = c.conversation("conversation-0")
+            self.assertIs(c.conversation("conversation-0"), first)
+            self.assertIsNot(c.conversation("conversation-0", authorization="other"), first)
+            self.assertIsNot(c.conversation("conversation-0", cls=lambda *args: args[1]), first)
+        self.assertEqual(first.id, "conversation-0")
+        self.assertEqual(len(transport.requests), 3)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_stale_responses_are_revalidated(self):
+        transport = StubTransport()
+        transport.replies.extend(
+            [reply(200, conversation_json(0), {"ETag": '"1"'}), reply(304), reply(200, conversation_json(1))]
+        )
+        with client(transport, conversation_cache=self.cache) as c:
+            first = c.conversation("conversation-0")
+            self.clock.now = 10
+            self.assertIs(c.conversation("conversation-0", headers={"X-Test": "1"}), first)
+            self.clock.now = 20
+            second = c.conversation("conversation-0")
+        self.assertNotIn("If-None-Match", transport.requests[0].headers)
+        self.assertEqual(transport.requests[1].headers["If-None-Match"], '"1"')
+        self.assertEqual(transport.requests[1].headers["X-Test"], "1")
+        self.assertEqual((second.id, self.cache.revalidations), ("conversation-1", 1))
+
+    def test_without_a_cache(self):
+        transport = StubTransport(lambda request: reply(200, conversation_json(0)))
+        with client(transport) as c:
+            self.assertIsNot(c.conversation("conversation-0"), c.conversation("conversation-0"))
+        self.assertEqual(len(transport.requests), 2)
+
+
+class AsyncClientConversationCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_stale_responses_are_revalidated(self):
+        clock = _Clock()
+        cache = ConversationCache(ttl=10, clock=clock)
+        transport = AsyncStubTransport()
+        transport.replies.extend([reply(200, conversation_json(0), {"ETag": '"1"'}), reply(304)])
+        async with async_client(transport, conversation_cache=cache) as c:
+            first = await c.conversation("conversation-0")
+            self.assertIs(await c.conversation("conversation-0"), first)
+            clock.now = 10
+            self.assertIs(await c.conversation("conversation-0"), first)
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(transport.requests[1].headers["If-None-Match"], '"1"')
+
+
+if __name__ == "__main__":
+    unittest.main()
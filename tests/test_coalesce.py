@@ -0,0 +1,104 @@
+import unittest
+
+from getcontext.coalesce import AsyncUpsertCoalescer, UpsertCoalescer
+from getcontext.generated.models import Conversation, Message
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client
+
+
+def _conversation(text):
+    return Conversation(messages=[Message(role="user", message=text)])
+
+
+def _messages(transport):
+    return [body["conversation"]["messages"][0]["message"] for body in transport.bodies()]
+
+
+class UpsertCoalescerTest(unittest.TestCase):
+    def test_only_latest_version_is_sent(self):
+        transport = StubTransport()
+        with client(transport) as c:
+            coalescer = UpsertCoalescer(c.log, window=60, max_delay=60)
+            for i in range(5):
+                coalescer.upsert("conversation-1", _conversation("version {}".format(i)))
+            coalescer.upsert("conversation-2", _conversation("other"))
+            self.assertEqual(len(coalescer), 2)
+            self.assertTrue(coalescer.flush(timeout=5))
+            coalescer.close()
+
+        self.assertEqual(_messages(transport), ["version 4", "other"])
+        self.assertEqual((coalescer.submitted, coalescer.collapsed, coalescer.sent), (6, 4, 2))
+        self.assertTrue(all(request.url.endswith("/log/conversation/upsert") for request in transport.requests))
+
+    def test_keys_are_per_tenant(self):
+        transport = StubTransport()
+        with client(transport) as c:
+            coalescer = UpsertCoalescer(c.log, window=60, max_delay=60)
+            coalescer.upsert("conversation-1", _conversation("a"), tenant_id="1")
+            coalescer.upsert("conversation-1", _conversation("b"), tenant_id="2")
+            coalescer.close()
+
+        self.assertEqual(_messages(transport), ["a", "b"])
+        self.assertIn("tenant_id=1", transport.requests[0].url)
+        self.assertIn("tenant_id=2", transport.requests[1].url)
+
+    def test_window_expiry_sends_without_flush(self):
+        transport = StubTransport()
+        with client(transport) as c:
+            coalescer = UpsertCoalescer(c.log, window=0.01, max_delay=1)
+            coalescer.upsert("conversation-1", _conversation("a"))
+            # flush() would send immediately; wait for the worker to send on its own instead.
+            for _ in range(500):
+                if coalescer.sent:
+                    break
+                coalescer._worker.join(0.01)  # pylint: disable=protected-access
+            self.assertEqual(coalescer.sent, 1)
+            coalescer.close()
+
+    def test_closed_coalescer_rejects_upserts(self):
+        with client() as c:
+            coalescer = UpsertCoalescer(c.log)
+            coalescer.close()
+            with self.assertRaises(RuntimeError):
+                coalescer.upsert("conversation-1", _conversation("a"))
+
+    def test_invalid_windows(self):
+        with client() as c:
+            with self.assertRaises(ValueError):
+                UpsertCoalescer(c.log, window=2, max_delay=1)
+
+    def test_client_coalescer_is_drained_on_close(self):
+        transport = StubTransport()
+        with client(transport) as c:
+            coalescer = c.upsert_coalescer(window=60, max_delay=60)
+            self.assertIs(c.upsert_coalescer(), coalescer)
+            with self.assertRaises(ValueError):
+                c.upsert_coalescer(window=1)
+            coalescer.upsert("conversation-1", _conversation("a"))
+        self.assertEqual(_messages(transport), ["a"])
+
+
+class AsyncUpsertCoalescerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_only_latest_version_is_sent(self):
+        transport = AsyncStubTransport()
+        async with async_client(transport) as c:
+            coalescer = AsyncUpsertCoalescer(c.log, window=60, max_delay=60)
+            for i in range(3):
+                await coalescer.upsert("conversation-1", _conversation("version {}".format(i)))
+            await coalescer.flush()
+            self.assertEqual(_messages(transport), ["version 2"])
+            await coalescer.aclose()
+        self.assertEqual((coalescer.collapsed, coalescer.sent), (2, 1))
+
+    async def test_client_coalescer_is_drained_on_close(self):
+        transport = AsyncStubTransport()
+        async with async_client(transport) as c:
+            coalescer = c.upsert_coalescer(window=60, max_delay=60)
+            with self.assertRaises(ValueError):
+                c.upsert_coalescer(window=1)
+            await coalescer.upsert("conversation-1", _conversation("a"))
+        self.assertEqual(_messages(transport), ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
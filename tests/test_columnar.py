@@ -0,0 +1,113 @@
+import datetime
+import math
+import unittest
+from unittest import mock
+
+from azure.core.exceptions import DeserializationError
+
+from getcontext.columnar import MessageTableBuilder, numpy
+
+from tests.stubs import StubTransport, client, conversation_json, page_json, reply
+
+
+def _message(role="user", language="en", sentiment=0.5, rating=1, event_timestamp="2024-01-02T03:04:05Z"):
+    return {
+        "role": role,
+        "language": language,
+        "sentiment": sentiment,
+        "rating": rating,
+        "event_timestamp": event_timestamp,
+    }
+
+
+def _conversations():
+    return [
+        {"id": "a", "messages": [_message(), _message(role="assistant", language=None, sentiment=None)]},
+        {"id": "b", "messages": []},
+        {"id": "c", "messages": [_message(rating=None, event_timestamp="2024-01-02T05:04:05+02:00")]},
+    ]
+
+
+def _values(column):
+    return [None if isinstance(value, float) and math.isnan(value) else value for value in column]
+
+
+class MessageTableBuilderTest(unittest.TestCase):
+    def test_columns(self):
+        builder = MessageTableBuilder()
+        builder.extend(_conversations())
+        table = builder.build(use_numpy=False)
+
+        timestamp = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc).timestamp()
+        self.assertEqual((len(builder), len(table)), (3, 3))
+        self.assertEqual(table.conversation_ids, ["a", "b", "c"])
+        self.assertEqual(list(table.offsets), [0, 2, 2, 3])
+        self.assertEqual(_values(table.sentiment), [0.5, None, 0.5])
+        self.assertEqual(_values(table.rating), [1.0, 1.0, None])
+        self.assertEqual(list(table.event_timestamp), [timestamp] * 3)
+        self.assertEqual(table.role.categories, ["user", "assistant"])
+        self.assertEqual([table.role.decode(row) for row in range(3)], ["user", "assistant", "user"])
+        self.assertEqual([table.language.decode(row) for row in range(3)], ["en", None, "en"])
+        self.assertEqual(list(table.conversation_index()), [0, 0, 2])
+        self.assertEqual(set(table.columns), {"sentiment", "rating", "event_timestamp", "role", "language"})
+
+    def test_naive_timestamps_are_utc(self):
+        builder = MessageTableBuilder()
+        builder.add({"id": "a", "messages": [_message(event_timestamp="2024-01-02T03:04:05")]})
+        expected = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc).timestamp()
+        self.assertEqual(list(builder.build(use_numpy=False).event_timestamp), [expected])
+
+    def test_tables_are_snapshots(self):
+        builder = MessageTableBuilder()
+        builder.add(_conversations()[0])
+        table = builder.build(use_numpy=False)
+        builder.add(_conversations()[2])
+        self.assertEqual((len(table), len(table.conversation_ids), len(table.role.categories)), (2, 1, 2))
+
+    def test_invalid_values_leave_the_table_aligned(self):
+        builder = MessageTableBuilder()
+        builder.add(_conversations()[0])
+        invalid = {"id": "x", "messages": [_message(), _message(sentiment="high")]}
+        with self.assertRaises(DeserializationError):
+            builder.add(invalid)
+        with self.assertRaises(DeserializationError):
+            builder.add({"id": "y", "messages": [_message(event_timestamp="not a date")]})
+        table = builder.build(use_numpy=False)
+        self.assertEqual((table.conversation_ids, list(table.offsets)), (["a"], [0, 2]))
+        self.assertEqual(
+            [len(column) for column in (table.sentiment, table.rating, table.event_timestamp)], [2, 2, 2]
+        )
+        self.assertEqual((len(table.role.codes), len(table.language.codes)), (2, 2))
+
+    def test_numpy_is_optional(self):
+        builder = MessageTableBuilder()
+        builder.extend(_conversations())
+        with mock.patch("getcontext.columnar.numpy", None):
+            with self.assertRaises(ImportError):
+                builder.build(use_numpy=True)
+            self.assertEqual(list(builder.build().offsets), [0, 2, 2, 3])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_numpy_columns(self):
+        builder = MessageTableBuilder()
+        builder.extend(_conversations())
+        table = builder.build(use_numpy=True)
+        self.assertIsInstance(table.sentiment, numpy.ndarray)
+        self.assertEqual(list(table.conversation_index()), [0, 0, 2])
+        self.assertEqual(numpy.nanmean(table.sentiment), 0.5)
+
+
+class ClientTableTest(unittest.TestCase):
+    def test_conversations_table(self):
+        page = page_json([conversation_json(i) for i in range(4)], page=1, pages=1)
+        transport = StubTransport(lambda request: reply(200, page))
+        with client(transport) as c:
+            table = c.conversations_table(per_page=4)
+        self.assertEqual(table.conversation_ids, ["conversation-{}".format(i) for i in range(4)])
+        self.assertEqual(list(table.offsets), [0, 1, 2, 3, 4])
+        self.assertEqual(table.role.categories, ["user"])
+        self.assertIn("per_page=4", transport.requests[0].url)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import concurrent.futures
+import threading
+import unittest
+
+from azure.core.exceptions import HttpResponseError
+
+from getcontext.futures import FutureLogOperations
+from getcontext.generated.models import Conversation, Message
+
+from tests.stubs import StubTransport, client, reply
+
+
+def _body(text):
+    return {"conversation": Conversation(messages=[Message(role="user", message=text)])}
+
+
+class FutureLogOperationsTest(unittest.TestCase):
+    def test_calls_return_futures(self):
+        transport = StubTransport(lambda request: reply(201, {"status": "created"}))
+        with client(transport) as c:
+            with FutureLogOperations(c.log, max_workers=4) as futures:
+                results = [futures.conversation(_body(str(i))) for i in range(10)]
+                self.assertTrue(futures.wait_all(timeout=5))
+                self.assertTrue(all(future.done() for future in results))
+                self.assertIsNone(results[0].result())
+
+        messages = sorted(body["conversation"]["messages"][0]["message"] for body in transport.bodies())
+        self.assertEqual(messages, sorted(str(i) for i in range(10)))
+
+    def test_errors_are_raised_from_result(self):
+        transport = StubTransport(lambda request: reply(400))
+        with client(transport) as c:
+            with FutureLogOperations(c.log) as futures:
+                future = futures.conversation(_body("hello"))
+                with self.assertRaises(HttpResponseError):
+                    future.result(timeout=5)
+
+    def test_max_in_flight_blocks_submission(self):
+        release = threading.Event()
+
+        def handler(request):
+            release.wait(5)
+            return reply(201)
+
+        with client(StubTransport(handler)) as c:
+            with FutureLogOperations(c.log, max_workers=1, max_in_flight=1) as futures:
+                first = futures.conversation(_body("first"))
+                submitted = threading.Event()
+
+                def submit_second():
+                    futures.conversation(_body("second"))
+                    submitted.set()
+
+                threading.Thread(target=submit_second).start()
+                self.assertFalse(submitted.wait(0.1))
+                release.set()
+                self.assertTrue(submitted.wait(5))
+                first.result(timeout=5)
+
+    def test_unknown_and_private_names(self):
+        with client() as c:
+            with FutureLogOperations(c.log) as futures:
+                with self.assertRaises(AttributeError):
+                    futures.nothing  # pylint: disable=pointless-statement
+                with self.assertRaises(AttributeError):
+                    futures._send  # pylint: disable=pointless-statement,protected-access
+
+    def test_closed_operations_reject_calls(self):
+        with client() as c:
+            futures = FutureLogOperations(c.log)
+            futures.close()
+            with self.assertRaises(RuntimeError):
+                futures.conversation(_body("hello"))
+
+    def test_external_executor_is_not_shut_down(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            with client() as c:
+                with FutureLogOperations(c.log, executor=executor) as futures:
+                    futures.conversation(_body("hello"))
+            self.assertEqual(executor.submit(lambda: 1).result(timeout=5), 1)
+
+    def test_client_log_futures(self):
+        transport = StubTransport()
+        with client(transport) as c:
+            futures = c.log_futures(max_workers=2)
+            self.assertIs(c.log_futures(), futures)
+            with self.assertRaises(ValueError):
+                c.log_futures(max_workers=4)
+            futures.conversation(_body("hello"))
+        self.assertEqual(len(transport.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
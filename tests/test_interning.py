@@ -0,0 +1,84 @@
+import unittest
+
+from getcontext.interning import InternCache, get_intern_cache
+
+from tests.stubs import StubTransport, client, conversation_json, page_json, reply
+
+
+def _page_handler(request):
+    conversations = [conversation_json(i, metadata={"source": "web"}) for i in range(3)]
+    return reply(200, page_json(conversations, page=1, pages=1))
+
+
+class InternCacheTest(unittest.TestCase):
+    def test_strings(self):
+        cache = InternCache()
+        first = "".join(["us", "er"])
+        second = "".join(["u", "ser"])
+        self.assertIsNot(first, second)
+        self.assertIs(cache.string(first), first)
+        self.assertIs(cache.string(second), first)
+        self.assertEqual(cache.string(5), 5)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+
+    def test_instances(self):
+        cache = InternCache()
+        created = []
+
+        def factory():
+            created.append(object())
+            return created[-1]
+
+        self.assertIs(cache.instance(("Topic", 1), factory), cache.instance(("Topic", 1), factory))
+        self.assertIsNot(cache.instance(("Topic", 2), factory), created[0])
+        self.assertEqual(len(created), 2)
+
+    def test_tables_are_cleared_when_full(self):
+        cache = InternCache(max_size=2)
+        for value in ("a", "b", "c"):
+            cache.string(value)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            InternCache(max_size=0)
+
+    def test_get_intern_cache(self):
+        cache = InternCache()
+        self.assertIs(get_intern_cache(cache), cache)
+        self.assertIsInstance(get_intern_cache(True), InternCache)
+        self.assertIsNone(get_intern_cache(False))
+        self.assertIsNone(get_intern_cache(None))
+
+
+class ClientInterningTest(unittest.TestCase):
+    def test_responses_share_topics_and_strings(self):
+        cache = InternCache()
+        with client(StubTransport(_page_handler), intern_cache=cache) as c:
+            interned = c.conversations().conversations
+        with client(StubTransport(_page_handler)) as c:
+            plain = c.conversations().conversations
+
+        self.assertEqual([x.as_dict() for x in interned], [x.as_dict() for x in plain])
+        topics = [topic for conversation in interned for topic in conversation.topics]
+        topics += [topic for conversation in interned for m in conversation.messages for topic in m.topics]
+        self.assertTrue(all(topic is topics[0] for topic in topics))
+        roles = [m.role for conversation in interned for m in conversation.messages]
+        self.assertTrue(all(role is roles[0] for role in roles))
+        keys = [next(iter(conversation.metadata)) for conversation in interned]
+        self.assertTrue(all(key is keys[0] for key in keys))
+        self.assertGreater(cache.hits, 0)
+
+    def test_shared_across_pages(self):
+        cache = InternCache()
+        with client(StubTransport(_page_handler), intern_cache=cache) as c:
+            first = c.conversations().conversations[0]
+            second = c.conversations().conversations[0]
+        self.assertIs(first.topics[0], second.topics[0])
+        self.assertIsNot(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
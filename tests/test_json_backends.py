@@ -0,0 +1,170 @@
+import codecs
+import datetime
+import json
+import unittest
+from unittest import mock
+
+from getcontext.generated.models import Conversation, Message, MessageRole
+from getcontext.json_backends import JSONBackend, OrjsonJSONBackend, StdlibJSONBackend, get_json_backend, orjson
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client, conversation_json, page_json, reply
+
+_DOCUMENTS = [
+    {"text": "héllo ☃ \U0001f600", "escaped": "quote \" backslash \\ newline \n"},
+    {"numbers": [0, -1, 2**63 - 1, 1.5, -2.25e-10], "flags": [True, False, None]},
+    {"nested": {"list": [{"deep": [[], {}]}], "empty": ""}},
+]
+
+
+def _body():
+    return {
+        "conversation": Conversation(
+            messages=[
+                Message(
+                    role=MessageRole.USER,
+                    message="héllo ☃",
+                    event_timestamp=datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+                    metadata={"key": "value"},
+                    input={"nested": [1, 2.5, None, {"deep": True}]},
+                )
+            ],
+            metadata={"user": "1234"},
+        )
+    }
+
+
+class JSONBackendTest(unittest.TestCase):
+    def test_backend_is_abstract(self):
+        with self.assertRaises(TypeError):
+            JSONBackend()  # pylint: disable=abstract-class-instantiated
+
+        class LoadsOnly(JSONBackend):
+            def loads(self, data):
+                return None
+
+        with self.assertRaises(TypeError):
+            LoadsOnly()  # pylint: disable=abstract-class-instantiated
+
+    def test_stdlib_loads(self):
+        backend = StdlibJSONBackend()
+        for document in _DOCUMENTS:
+            encoded = backend.dumps(document)
+            for data in (encoded, codecs.BOM_UTF8 + encoded, memoryview(encoded), "\ufeff" + encoded.decode("utf-8")):
+                with self.subTest(data=data):
+                    self.assertEqual(backend.loads(data), document)
+
+    def test_invalid_documents(self):
+        with self.assertRaises(ValueError):
+            StdlibJSONBackend().loads(b"{not json")
+
+
+class GetJSONBackendTest(unittest.TestCase):
+    def test_default_is_stdlib(self):
+        self.assertIsInstance(get_json_backend(), StdlibJSONBackend)
+        self.assertIsInstance(get_json_backend("json"), StdlibJSONBackend)
+
+    def test_instances_are_used_as_is(self):
+        backend = StdlibJSONBackend()
+        self.assertIs(get_json_backend(backend), backend)
+
+    @unittest.skipIf(orjson is None, "requires orjson")
+    def test_auto_with_orjson(self):
+        self.assertIsInstance(get_json_backend("auto"), OrjsonJSONBackend)
+        self.assertIsInstance(get_json_backend("orjson"), OrjsonJSONBackend)
+
+    def test_auto_without_orjson(self):
+        with mock.patch("getcontext.json_backends.orjson", None):
+            self.assertIsInstance(get_json_backend("auto"), StdlibJSONBackend)
+            with self.assertRaises(ImportError):
+                get_json_backend("orjson")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_json_backend("simplejson")
+
+
+class _DecoderBackend(JSONBackend):
+    """Decodes with a JSONDecoder rather than json.loads, and counts the documents decoded."""
+
+    def __init__(self):
+        self.decoded = 0
+        self._stdlib = StdlibJSONBackend()
+
+    def dumps(self, obj):
+        return self._stdlib.dumps(obj)
+
+    def loads(self, data):
+        self.decoded += 1
+        return json.JSONDecoder().decode(bytes(data).decode("utf-8"))
+
+
+def _responses_handler(request):
+    if "/conversations/" in request.url:
+        return reply(200, conversation_json(0))
+    return reply(200, page_json([conversation_json(i) for i in range(2)], page=1, pages=1))
+
+
+class ClientResponseDecodingTest(unittest.TestCase):
+    def test_responses_are_only_decoded_by_the_backend(self):
+        backend = _DecoderBackend()
+        with client(StubTransport(_responses_handler), json_backend=backend) as c:
+            with mock.patch("json.loads", side_effect=AssertionError("decoded with json.loads")):
+                page = c.conversations()
+                conversation = c.conversation("conversation-0")
+        self.assertEqual((len(page.conversations), conversation.id, backend.decoded), (2, "conversation-0", 2))
+
+    def test_stdlib_backend_keeps_the_default_pipeline(self):
+        with client(StubTransport(_responses_handler)) as c:
+            with mock.patch("json.loads", side_effect=json.loads) as loads:
+                c.conversation("conversation-0")
+        self.assertEqual(loads.call_count, 2)
+
+    def test_pipeline_policies_are_the_configured_ones(self):
+        with client(StubTransport(_responses_handler), json_backend=_DecoderBackend()) as c:
+            policies = [policy for policy in c._client._pipeline._impl_policies]  # pylint: disable=protected-access
+            runners = [getattr(policy, "_policy", policy) for policy in policies]
+            self.assertIn(c._config.retry_policy, runners)  # pylint: disable=protected-access
+            self.assertIn(c._config.authentication_policy, runners)  # pylint: disable=protected-access
+
+
+class AsyncClientResponseDecodingTest(unittest.IsolatedAsyncioTestCase):
+    async def test_responses_are_only_decoded_by_the_backend(self):
+        backend = _DecoderBackend()
+        async with async_client(AsyncStubTransport(_responses_handler), json_backend=backend) as c:
+            with mock.patch("json.loads", side_effect=AssertionError("decoded with json.loads")):
+                page = await c.conversations()
+        self.assertEqual((len(page.conversations), backend.decoded), (2, 1))
+
+
+@unittest.skipIf(orjson is None, "requires orjson")
+class OrjsonJSONBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.orjson = OrjsonJSONBackend()
+        self.stdlib = StdlibJSONBackend()
+
+    def test_documents_match_stdlib(self):
+        values = _DOCUMENTS + [{"when": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)}]
+        for document in values:
+            with self.subTest(document=document):
+                encoded = self.orjson.dumps(document)
+                self.assertEqual(self.stdlib.loads(encoded), self.stdlib.loads(self.stdlib.dumps(document)))
+                self.assertEqual(self.orjson.loads(encoded), self.stdlib.loads(encoded))
+
+    def test_stdlib_fallbacks(self):
+        for data in (b"[NaN]", b"[Infinity]", codecs.BOM_UTF8 + b"[1]", "\ufeff[1]"):
+            with self.subTest(data=data):
+                self.assertEqual(repr(self.orjson.loads(data)), repr(self.stdlib.loads(data)))
+        self.assertEqual(self.stdlib.loads(self.orjson.dumps({"big": 2**70})), {"big": 2**70})
+
+    def test_client_bodies_match_stdlib(self):
+        bodies = []
+        for json_backend in ("json", "orjson"):
+            transport = StubTransport()
+            with client(transport, json_backend=json_backend) as c:
+                c.log.conversation(_body())
+            bodies.append(transport.bodies()[0])
+        self.assertEqual(bodies[0], bodies[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import datetime
+import pickle
+import unittest
+
+from getcontext.generated import models
+from getcontext.generated._serialization import Deserializer, Model, Serializer
+from getcontext.generated.models import (
+    COMPACT_MODELS,
+    CompactMessage,
+    CompactMessageResponse,
+    CompactModel,
+    CompactTopic,
+    Message,
+    MessageResponse,
+    Topic,
+)
+
+from tests.stubs import StubTransport, client, conversation_json, page_json, reply
+
+CLIENT_MODELS = {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+
+_TIMESTAMP = datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc)
+
+# Constructor keywords of each compact model's original, with every attribute set.
+_KWARGS = {
+    "Message": dict(
+        role="user",
+        message="Hello",
+        type="message",
+        event_timestamp=_TIMESTAMP,
+        metadata={"key": "value"},
+        rating=1,
+        name="name",
+        thought="thought",
+        input={"nested": [1, None]},
+        observation="observation",
+    ),
+    "MessageResponse": dict(
+        type="message",
+        event_timestamp=_TIMESTAMP,
+        role="assistant",
+        message="Hi",
+        rating=0,
+        language="en",
+        translation="",
+        sentiment=0.5,
+        topics=[],
+        suggested_topics=[],
+        metadata={},
+    ),
+    "Topic": dict(id="topic-1", name="greeting"),
+}
+
+
+def _pairs():
+    """(original, compact) instances built from the same keywords."""
+    for name, compact_type in COMPACT_MODELS.items():
+        yield CLIENT_MODELS[name](**_KWARGS[name]), compact_type(**_KWARGS[name])
+
+
+class CompactModelTest(unittest.TestCase):
+    def test_compact_models_are_not_instances_of_the_originals(self):
+        for name, compact_type in COMPACT_MODELS.items():
+            with self.subTest(model=name):
+                compact = compact_type(**_KWARGS[name])
+                self.assertNotIsInstance(compact, CLIENT_MODELS[name])
+                self.assertIsInstance(compact, CompactModel)
+                self.assertIsInstance(compact, Model)
+                self.assertFalse(hasattr(compact, "__dict__"))
+                self.assertNotEqual(compact, CLIENT_MODELS[name](**_KWARGS[name]))
+        self.assertEqual(
+            (CompactMessage, CompactMessageResponse, CompactTopic),
+            (COMPACT_MODELS["Message"], COMPACT_MODELS["MessageResponse"], COMPACT_MODELS["Topic"]),
+        )
+
+    def test_serialization_matches(self):
+        for original, compact in _pairs():
+            with self.subTest(model=type(original).__name__):
+                self.assertEqual(compact.serialize(), original.serialize())
+                self.assertEqual(compact.serialize(keep_readonly=True), original.serialize(keep_readonly=True))
+                self.assertEqual(compact.as_dict(), original.as_dict())
+                self.assertEqual(str(compact), str(original))
+
+    def test_deserialization_matches(self):
+        compact_deserializer = Deserializer(dict(CLIENT_MODELS, **COMPACT_MODELS))
+        for original, compact in _pairs():
+            name = type(original).__name__
+            with self.subTest(model=name):
+                data = original.serialize(keep_readonly=True)
+                data["unknown"] = 1
+                decoded = compact_deserializer(name, data)
+                self.assertIs(type(decoded), type(compact))
+                self.assertEqual(decoded.as_dict(), Deserializer(CLIENT_MODELS)(name, data).as_dict())
+                self.assertEqual(decoded.additional_properties, {"unknown": 1})
+
+    def test_equality(self):
+        for original, compact in _pairs():
+            with self.subTest(model=type(original).__name__):
+                other = type(compact)(**_KWARGS[type(original).__name__])
+                self.assertEqual(compact, other)
+                other.additional_properties["extra"] = True
+                self.assertNotEqual(compact, other)
+
+    def test_missing_required_keywords(self):
+        with self.assertRaises(TypeError):
+            Topic(id="topic-1")  # pylint: disable=missing-kwoa
+        with self.assertRaises(TypeError):
+            CompactTopic(id="topic-1")
+
+    def test_additional_properties_are_allocated_on_use(self):
+        topic = CompactTopic(id="topic-1", name="greeting")
+        self.assertIsNone(topic._additional_properties)  # pylint: disable=protected-access
+        self.assertEqual(topic.additional_properties, {})
+        topic.additional_properties = {"extra": 1}
+        original = Topic(id="topic-1", name="greeting")
+        original.additional_properties = {"extra": 1}
+        self.assertEqual(topic.as_dict(), original.as_dict())
+        self.assertEqual(str(topic), str(original))
+
+    def test_pickling(self):
+        for _, compact in _pairs():
+            with self.subTest(model=type(compact).__name__):
+                self.assertEqual(pickle.loads(pickle.dumps(compact)), compact)
+
+    def test_request_bodies_match(self):
+        body_type = "PathsLi5TynApiV1LogConversationPostRequestbodyContentApplicationJsonSchema"
+        bodies = [
+            Serializer(CLIENT_MODELS).body({"conversation": {"messages": [message]}}, body_type)
+            for message in (Message(**_KWARGS["Message"]), CompactMessage(**_KWARGS["Message"]))
+        ]
+        self.assertEqual(bodies[0], bodies[1])
+
+    def test_client_compact_models(self):
+        page = page_json([conversation_json(i) for i in range(2)], page=1, pages=1)
+        results = []
+        for compact_models in (False, True):
+            with client(StubTransport(lambda request: reply(200, page)), compact_models=compact_models) as c:
+                results.append(c.conversations())
+        eager, compact = results
+        self.assertIsInstance(eager.conversations[0].messages[0], MessageResponse)
+        self.assertIsInstance(compact.conversations[0].messages[0], CompactMessageResponse)
+        self.assertIsInstance(compact.conversations[0].topics[0], CompactTopic)
+        self.assertEqual([c.as_dict() for c in compact.conversations], [c.as_dict() for c in eager.conversations])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,318 @@
+import threading
+import time
+import types
+import unittest
+import urllib.parse
+
+from azure.core.exceptions import ResourceNotFoundError, ServiceRequestError
+
+from getcontext.paging import (
+    AsyncConversationFanOut,
+    AsyncConversationPager,
+    ConversationFanOut,
+    ConversationPager,
+)
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client, conversation_json, page_json, reply
+
+_TIMEOUT = 5
+
+
+def _page(number, pages, per_page=2, **pagination):
+    """A page as the client returns it, with conversations named after their page."""
+    info = dict(current_page=number, next_page=min(number + 1, pages), page_count=pages)
+    info.update(pagination)
+    conversations = ["{}.{}".format(number, i) for i in range(per_page)]
+    return types.SimpleNamespace(conversations=conversations, pagination=types.SimpleNamespace(**info))
+
+
+class _Pages:
+    """Fetches pages by number and records the numbers, optionally holding pages back until released."""
+
+    def __init__(self, pages, **pagination):
+        self.pages = pages
+        self.pagination = pagination
+        self.fetched = []
+        self.held = {}
+        self._condition = threading.Condition()
+
+    def hold(self, number):
+        self.held[number] = threading.Event()
+        return self.held[number]
+
+    def __call__(self, number):
+        with self._condition:
+            self.fetched.append(number)
+            self._condition.notify_all()
+        if number in self.held:
+            self.held[number].wait(_TIMEOUT)
+        return _page(number, self.pages, **self.pagination)
+
+    def wait_for(self, *numbers):
+        with self._condition:
+            return self._condition.wait_for(lambda: set(numbers) <= set(self.fetched), _TIMEOUT)
+
+
+class _AsyncPages(_Pages):
+    async def __call__(self, number):  # pylint: disable=invalid-overridden-method
+        self.fetched.append(number)
+        return _page(number, self.pages, **self.pagination)
+
+
+def _pages_handler(pages):
+    def handler(request):
+        number = int(urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)["page"][0])
+        conversations = [conversation_json(10 * number + i) for i in range(2)]
+        return reply(200, page_json(conversations, page=number, pages=pages))
+
+    return handler
+
+
+class ConversationPagerTest(unittest.TestCase):
+    def test_iterates_every_page(self):
+        for prefetch in (0, 1, 3):
+            with self.subTest(prefetch=prefetch):
+                fetch = _Pages(3)
+                pager = ConversationPager(fetch, prefetch=prefetch)
+                self.assertIsNone(pager.pagination)
+                self.assertEqual(list(pager), ["1.0", "1.1", "2.0", "2.1", "3.0", "3.1"])
+                self.assertEqual(sorted(fetch.fetched), [1, 2, 3])
+                self.assertEqual((pager.pages, pager.count, pager.pagination.current_page), (3, 6, 3))
+
+    def test_without_prefetch_pages_are_fetched_when_needed(self):
+        fetch = _Pages(3)
+        iterator = iter(ConversationPager(fetch, prefetch=0))
+        self.assertEqual([next(iterator), next(iterator)], ["1.0", "1.1"])
+        self.assertEqual(fetch.fetched, [1])
+        self.assertEqual(next(iterator), "2.0")
+        self.assertEqual(fetch.fetched, [1, 2])
+        iterator.close()
+
+    def test_pages_are_fetched_ahead(self):
+        fetch = _Pages(5)
+        with ConversationPager(fetch, prefetch=2) as pager:
+            iterator = iter(pager)
+            self.assertEqual(next(iterator), "1.0")
+            self.assertTrue(fetch.wait_for(2, 3))
+            self.assertNotIn(4, fetch.fetched)
+            self.assertEqual(list(iterator)[-1], "5.1")
+        self.assertEqual(sorted(fetch.fetched), [1, 2, 3, 4, 5])
+
+    def test_leaving_early_stops_the_pager(self):
+        fetch = _Pages(5)
+        release = fetch.hold(2)
+        with ConversationPager(fetch, prefetch=1) as pager:
+            for _ in pager:
+                break
+        release.set()
+        self.assertTrue(fetch.wait_for(2))
+        self.assertEqual(fetch.fetched, [1, 2])
+        self.assertEqual(list(pager), [])
+
+    def test_stops_at_the_last_or_an_empty_page(self):
+        fetch = _Pages(1)
+        self.assertEqual(len(list(ConversationPager(fetch))), 2)
+        self.assertEqual(fetch.fetched, [1])
+
+        fetch = _Pages(3, per_page=0)
+        pager = ConversationPager(fetch)
+        self.assertEqual(list(pager), [])
+        self.assertEqual((fetch.fetched[0], pager.pages), (1, 1))
+
+    def test_next_page_never_goes_back(self):
+        # A next_page at or before the current page is taken as the page after it.
+        fetch = _Pages(3, next_page=1)
+        self.assertEqual(len(list(ConversationPager(fetch, prefetch=0))), 6)
+        self.assertEqual(fetch.fetched, [1, 2, 3])
+
+    def test_first_page(self):
+        fetch = _Pages(3)
+        self.assertEqual(list(ConversationPager(fetch, first_page=3)), ["3.0", "3.1"])
+
+    def test_fetch_errors_are_raised(self):
+        def fetch(number):
+            if number == 2:
+                raise ResourceNotFoundError("gone")
+            return _page(number, 3)
+
+        iterator = iter(ConversationPager(fetch))
+        self.assertEqual([next(iterator), next(iterator)], ["1.0", "1.1"])
+        with self.assertRaises(ResourceNotFoundError):
+            next(iterator)
+
+    def test_invalid_prefetch(self):
+        with self.assertRaises(ValueError):
+            ConversationPager(_Pages(1), prefetch=-1)
+
+    def test_client_iter_conversations(self):
+        transport = StubTransport(_pages_handler(3))
+        with client(transport) as c:
+            pager = c.iter_conversations(per_page=2, prefetch=2)
+            ids = [conversation.id for conversation in pager]
+        self.assertEqual(ids, ["conversation-{}".format(n) for n in (10, 11, 20, 21, 30, 31)])
+        queries = [urllib.parse.parse_qs(urllib.parse.urlparse(r.url).query) for r in transport.requests]
+        self.assertEqual(sorted(query["page"][0] for query in queries), ["1", "2", "3"])
+        self.assertTrue(all(query["per_page"] == ["2"] for query in queries))
+
+
+class AsyncConversationPagerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_iterates_every_page(self):
+        for prefetch in (0, 2):
+            with self.subTest(prefetch=prefetch):
+                fetch = _AsyncPages(3)
+                pager = AsyncConversationPager(fetch, prefetch=prefetch)
+                self.assertEqual([c async for c in pager], ["1.0", "1.1", "2.0", "2.1", "3.0", "3.1"])
+                self.assertEqual((sorted(fetch.fetched), pager.pages, pager.count), ([1, 2, 3], 3, 6))
+
+    async def test_close_cancels_pending_fetches(self):
+        fetch = _AsyncPages(5)
+        async with AsyncConversationPager(fetch, prefetch=2) as pager:
+            async for _ in pager:
+                break
+        self.assertEqual(fetch.fetched, [1])
+        self.assertEqual([c async for c in pager], [])
+
+    async def test_client_iter_conversations(self):
+        async with async_client(AsyncStubTransport(_pages_handler(2))) as c:
+            ids = [conversation.id async for conversation in c.iter_conversations()]
+        self.assertEqual(ids, ["conversation-{}".format(n) for n in (10, 11, 20, 21)])
+
+
+class ConversationFanOutTest(unittest.TestCase):
+    def test_pages_are_yielded_in_order(self):
+        fetch = _Pages(6)
+        delays = {2: 0.05, 3: 0.02}
+
+        def slow_fetch(number):
+            time.sleep(delays.get(number, 0))
+            return fetch(number)
+
+        fan_out = ConversationFanOut(slow_fetch, concurrency=3)
+        conversations = list(fan_out)
+        self.assertEqual(conversations, ["{}.{}".format(n, i) for n in range(1, 7) for i in range(2)])
+        self.assertEqual((fan_out.pages, fan_out.count, fan_out.pagination.current_page), (6, 12, 1))
+
+    def test_unordered_pages_are_yielded_as_they_complete(self):
+        fetch = _Pages(3)
+        release = fetch.hold(2)
+        numbers = []
+        for page in ConversationFanOut(fetch, concurrency=2, ordered=False).iter_pages():
+            numbers.append(page.pagination.current_page)
+            if numbers[-1] == 3:
+                release.set()
+        self.assertEqual(numbers, [1, 3, 2])
+
+    def test_concurrency_is_limited(self):
+        lock = threading.Lock()
+        running = [0, 0]  # current, highest
+
+        def fetch(number):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return _page(number, 12)
+
+        self.assertEqual(len(list(ConversationFanOut(fetch, concurrency=3))), 24)
+        self.assertLessEqual(running[1], 3)
+
+    def test_failed_pages_are_retried(self):
+        failures = {2: 2, 3: 1}
+
+        def fetch(number):
+            if failures.get(number):
+                failures[number] -= 1
+                raise ServiceRequestError("offline")
+            return _page(number, 4)
+
+        fan_out = ConversationFanOut(fetch, page_retries=2, retry_backoff=0)
+        with self.assertLogs("getcontext.paging", "WARNING"):
+            self.assertEqual(len(list(fan_out)), 8)
+        self.assertEqual(fan_out.retried, 3)
+
+    def test_errors_are_raised_once_retries_are_exhausted(self):
+        for error, page_retries in ((ServiceRequestError("offline"), 1), (ResourceNotFoundError("gone"), 3)):
+            with self.subTest(error=type(error).__name__):
+                attempts = []
+
+                def fetch(number, error=error, attempts=attempts):
+                    if number == 2:
+                        attempts.append(number)
+                        raise error
+                    return _page(number, 3)
+
+                fan_out = ConversationFanOut(fetch, page_retries=page_retries, retry_backoff=0)
+                with self.assertRaises(type(error)):
+                    list(fan_out)
+                self.assertEqual(len(attempts), fan_out.retried + 1)
+
+    def test_single_and_empty_first_pages(self):
+        for pages, per_page, expected in ((1, 2, 2), (3, 0, 0)):
+            with self.subTest(pages=pages, per_page=per_page):
+                fetch = _Pages(pages, per_page=per_page)
+                self.assertEqual(len(list(ConversationFanOut(fetch))), expected)
+                self.assertEqual(fetch.fetched, [1])
+
+    def test_leaving_early_stops_fetching(self):
+        fetch = _Pages(20)
+        with ConversationFanOut(fetch, concurrency=2) as fan_out:
+            for conversation in fan_out:
+                if conversation == "2.0":
+                    break
+        fetched = len(fetch.fetched)
+        time.sleep(0.05)
+        self.assertEqual(len(fetch.fetched), fetched)
+        self.assertLessEqual(max(fetch.fetched), 6)
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"concurrency": 0}, {"page_retries": -1}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    ConversationFanOut(_Pages(1), **kwargs)
+
+    def test_client_fetch_all_conversations(self):
+        transport = StubTransport(_pages_handler(4))
+        with client(transport) as c:
+            fan_out = c.fetch_all_conversations(per_page=2, concurrency=2)
+            ids = [conversation.id for conversation in fan_out]
+        self.assertEqual(ids, ["conversation-{}".format(10 * n + i) for n in range(1, 5) for i in range(2)])
+        self.assertEqual(fan_out.pagination.page_count, 4)
+        self.assertEqual(len(transport.requests), 4)
+
+
+class AsyncConversationFanOutTest(unittest.IsolatedAsyncioTestCase):
+    async def test_pages_are_yielded_in_order(self):
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered):
+                fetch = _AsyncPages(5)
+                fan_out = AsyncConversationFanOut(fetch, concurrency=2, ordered=ordered)
+                conversations = [conversation async for conversation in fan_out]
+                self.assertEqual(sorted(conversations), ["{}.{}".format(n, i) for n in range(1, 6) for i in range(2)])
+                if ordered:
+                    self.assertEqual(conversations, sorted(conversations))
+                self.assertEqual((fan_out.pages, fan_out.count), (5, 10))
+
+    async def test_failed_pages_are_retried(self):
+        failures = {3: 1}
+
+        async def fetch(number):
+            if failures.get(number):
+                failures[number] -= 1
+                raise ServiceRequestError("offline")
+            return _page(number, 3)
+
+        fan_out = AsyncConversationFanOut(fetch, retry_backoff=0)
+        with self.assertLogs("getcontext.paging", "WARNING"):
+            self.assertEqual(len([conversation async for conversation in fan_out]), 6)
+        self.assertEqual(fan_out.retried, 1)
+
+    async def test_client_fetch_all_conversations(self):
+        async with async_client(AsyncStubTransport(_pages_handler(3))) as c:
+            ids = [conversation.id async for conversation in c.fetch_all_conversations()]
+        self.assertEqual(ids, ["conversation-{}".format(10 * n + i) for n in range(1, 4) for i in range(2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
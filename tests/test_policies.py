@@ -0,0 +1,178 @@
+import gzip
+import json
+import os
+import threading
+import unittest
+from unittest import mock
+
+from azure.core.exceptions import HttpResponseError
+
+from getcontext.generated.models import Conversation, Message, Thread
+from getcontext.policies import AdaptiveSampler, RateLimitPolicy, RequestCompressionPolicy
+
+from tests.stubs import StubTransport, client, reply
+
+
+def _body(text):
+    return {"conversation": Conversation(messages=[Message(role="user", message=text)])}
+
+
+class RequestCompressionPolicyTest(unittest.TestCase):
+    def test_large_bodies_are_gzipped(self):
+        transport = StubTransport()
+        policy = RequestCompressionPolicy(threshold=100)
+        with client(transport, request_compression=policy) as c:
+            c.log.conversation(_body("hello " * 100))
+
+        request = transport.requests[0]
+        self.assertEqual(request.headers["Content-Encoding"], "gzip")
+        data = json.loads(gzip.decompress(request.content))
+        self.assertEqual(data["conversation"]["messages"][0]["message"], "hello " * 100)
+        self.assertEqual(policy.requests_compressed, 1)
+        self.assertEqual(policy.bytes_in, len(gzip.decompress(request.content)))
+        self.assertEqual(policy.bytes_out, len(request.content))
+        self.assertGreater(policy.bytes_saved, 0)
+
+    def test_small_bodies_are_sent_unchanged(self):
+        transport = StubTransport()
+        policy = RequestCompressionPolicy(threshold=10000)
+        with client(transport, request_compression=policy) as c:
+            c.log.conversation(_body("hello"))
+
+        self.assertNotIn("Content-Encoding", transport.requests[0].headers)
+        self.assertEqual(transport.bodies()[0]["conversation"]["messages"][0]["message"], "hello")
+        self.assertEqual(policy.requests_compressed, 0)
+
+    def test_only_selected_operations_are_compressed(self):
+        transport = StubTransport()
+        policy = RequestCompressionPolicy(operations=["log.conversation_upsert"], threshold=1)
+        with client(transport, request_compression=policy) as c:
+            c.log.conversation(_body("hello " * 100))
+            c.log.conversation_upsert(_body("hello " * 100))
+
+        self.assertNotIn("Content-Encoding", transport.requests[0].headers)
+        self.assertEqual(transport.requests[1].headers["Content-Encoding"], "gzip")
+
+    def test_incompressible_bodies_are_sent_unchanged(self):
+        transport = StubTransport()
+        policy = RequestCompressionPolicy(threshold=1)
+        with client(transport, request_compression=policy) as c:
+            c.log.conversation(os.urandom(512))
+
+        self.assertNotIn("Content-Encoding", transport.requests[0].headers)
+
+    def test_unknown_operation(self):
+        with self.assertRaises(ValueError):
+            RequestCompressionPolicy(operations=["log.nothing"])
+
+
+class RateLimitPolicyTest(unittest.TestCase):
+    def test_calls_past_the_burst_wait(self):
+        policy = RateLimitPolicy(rate=10, burst=2)
+        with mock.patch("getcontext.policies.time.sleep") as sleep:
+            with client(rate_limit=policy) as c:
+                for _ in range(4):
+                    c.log.conversation(_body("hello"))
+        waits = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(len(waits), 2)
+        self.assertAlmostEqual(waits[0], 0.1, delta=0.05)
+        self.assertAlmostEqual(waits[1], 0.2, delta=0.05)
+        self.assertAlmostEqual(policy.waited, sum(waits))
+
+    def test_retry_after_pauses_all_calls(self):
+        transport = StubTransport()
+        transport.replies.append(reply(429, headers={"Retry-After": "5"}))
+        policy = RateLimitPolicy(rate=1000)
+        with mock.patch("getcontext.policies.time.sleep") as sleep:
+            with client(transport, rate_limit=policy) as c:
+                with self.assertRaises(HttpResponseError):
+                    c.log.conversation(_body("hello"))
+                c.log.conversation(_body("hello"))
+        self.assertEqual(policy.throttled, 1)
+        self.assertGreater(sleep.call_args.args[0], 4.9)
+
+    def test_other_paths_are_not_limited(self):
+        policy = RateLimitPolicy(rate=1, burst=1, paths=["/api/v1/other/"])
+        with mock.patch("getcontext.policies.time.sleep") as sleep:
+            with client(rate_limit=policy) as c:
+                for _ in range(3):
+                    c.log.conversation(_body("hello"))
+        sleep.assert_not_called()
+
+
+def _dropped_key(sampler):
+    """A sample key that ``sampler`` drops at its current rate."""
+    probe = AdaptiveSampler(rate=sampler.rate, min_rate=sampler.min_rate, max_rate=sampler.max_rate)
+    return next(key for key in map(str, range(1000)) if not probe.keep(_body("hello"), sample_key=key))
+
+
+class AdaptiveSamplerTest(unittest.TestCase):
+    def test_decisions_are_deterministic_per_key(self):
+        sampler = AdaptiveSampler(rate=0.5)
+        decisions = [sampler.keep(_body("hello"), sample_key=str(i)) for i in range(1000)]
+        self.assertEqual(decisions, [sampler.keep(_body("other"), sample_key=str(i)) for i in range(1000)])
+        self.assertAlmostEqual(decisions.count(True) / 1000, 0.5, delta=0.1)
+        self.assertEqual((sampler.sampled + sampler.dropped, sampler.forced), (2000, 0))
+
+    def test_thread_id_is_the_default_identity(self):
+        sampler = AdaptiveSampler(rate=0.5)
+        for i in range(100):
+            thread = {"conversation": Thread(id=str(i), messages=[Message(role="user", message="hello")])}
+            self.assertEqual(sampler.keep(thread), sampler.keep(_body("hello"), sample_key=str(i)))
+
+    def test_rated_and_preencoded_bodies_are_kept(self):
+        sampler = AdaptiveSampler(rate=0.01, min_rate=0.01, max_rate=0.01)
+        key = _dropped_key(sampler)
+        rated = {"conversation": Conversation(messages=[Message(role="user", message="hello", rating=1)])}
+        feedback = {"conversation": Conversation(messages=[Message(role="user", message="hello")], feedback="ok")}
+        self.assertTrue(sampler.keep(rated, sample_key=key))
+        self.assertTrue(sampler.keep(feedback, sample_key=key))
+        self.assertTrue(sampler.keep(b"{}", sample_key=key))
+        self.assertFalse(sampler.keep(_body("hello"), sample_key=key))
+        self.assertEqual((sampler.forced, sampler.sampled, sampler.dropped), (2, 0, 1))
+
+    def test_counters_are_consistent_across_threads(self):
+        sampler = AdaptiveSampler(rate=0.5)
+        body = _body("hello")
+
+        def run():
+            for i in range(2000):
+                sampler.keep(body, sample_key=str(i))
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sampler.sampled + sampler.dropped, 16000)
+
+    def test_rate_adapts_to_responses(self):
+        transport = StubTransport()
+        sampler = AdaptiveSampler(rate=0.8, increase=0.1, decrease=0.5, min_rate=0.1)
+        with client(transport, sampler=sampler) as c:
+            c.log.conversation(_body("hello"), sample_key="kept")
+            self.assertAlmostEqual(sampler.rate, 0.9)
+            transport.replies.append(reply(429))
+            with self.assertRaises(HttpResponseError):
+                c.log.conversation(_body("hello"), sample_key="kept")
+            self.assertAlmostEqual(sampler.rate, 0.45)
+            self.assertEqual(sampler.throttled, 1)
+            transport.replies.append(reply(500))
+            with self.assertRaises(HttpResponseError):
+                c.log.conversation(_body("hello"), sample_key="kept")
+            self.assertAlmostEqual(sampler.rate, 0.45)
+
+    def test_dropped_calls_are_not_sent(self):
+        transport = StubTransport()
+        sampler = AdaptiveSampler(rate=0.01, min_rate=0.01, max_rate=0.01)
+        with client(transport, sampler=sampler) as c:
+            self.assertIsNone(c.log.conversation_upsert(_body("hello"), sample_key=_dropped_key(sampler)))
+        self.assertEqual((transport.requests, sampler.dropped), ([], 1))
+
+    def test_invalid_rates(self):
+        with self.assertRaises(ValueError):
+            AdaptiveSampler(min_rate=0.5, max_rate=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
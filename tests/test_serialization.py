@@ -0,0 +1,500 @@
+import copy
+import datetime
+import pickle
+import re
+import unittest
+from unittest import mock
+
+from azure.core.exceptions import DeserializationError, SerializationError
+import isodate
+
+from getcontext.generated import _serialization, models
+from getcontext.generated._serialization import Deserializer, Model, Serializer, _LazyAttribute
+from getcontext.generated.models import Conversation, ConversationResponse, Message, MessageRole, Rating, Thread
+
+from tests.stubs import StubTransport, client, conversation_json, page_json, reply
+
+CLIENT_MODELS = {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+GENERATED_MODELS = [
+    v for v in CLIENT_MODELS.values() if issubclass(v, Model) and v._attribute_map  # pylint: disable=protected-access
+]
+
+CONVERSATION_BODY = "PathsLi5TynApiV1LogConversationPostRequestbodyContentApplicationJsonSchema"
+THREAD_BODY = "Paths1S2Rf6XApiV1LogConversationThreadPostRequestbodyContentApplicationJsonSchema"
+
+_LOGGER_NAME = "getcontext.generated._serialization"
+
+
+def _generic_serializer():
+    """Disables direct body encoding and compiled model encoders, leaving the generic path."""
+    unsupported = _serialization._DirectEncodingUnsupported("disabled")
+    return mock.patch.multiple(
+        Serializer, _encode_direct=mock.Mock(side_effect=unsupported), _model_encoder=mock.Mock(return_value=None)
+    )
+
+
+def _generic_body(data, data_type, classes=CLIENT_MODELS):
+    """Serializer.body() output when models are built from the data first."""
+    with _generic_serializer():
+        return Serializer(classes).body(data, data_type)
+
+
+def _message(**kwargs):
+    fields = dict(
+        role=MessageRole.USER,
+        message="Hello",
+        event_timestamp=datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+        metadata={"key": "value"},
+        rating=Rating.POSITIVE,
+        input={"nested": [1, 2.5, None, {"deep": True}]},
+    )
+    fields.update(kwargs)
+    return Message(**fields)
+
+
+class BodyTest(unittest.TestCase):
+    def assertSameBody(self, data, data_type=CONVERSATION_BODY):
+        self.assertEqual(Serializer(CLIENT_MODELS).body(data, data_type), _generic_body(data, data_type))
+
+    def test_models_are_encoded_directly(self):
+        data = {"conversation": Conversation(messages=[_message(), _message(role="assistant")], feedback="Great")}
+        with self.assertNoLogs(_LOGGER_NAME, "DEBUG"):
+            Serializer(CLIENT_MODELS).body(data, CONVERSATION_BODY)
+        self.assertSameBody(data)
+
+    def test_plain_dicts_are_encoded_directly(self):
+        data = {
+            "conversation": {
+                "messages": [{"role": "user", "message": "Hello", "metadata": {"key": "value"}, "rating": 1}],
+                "metadata": {"user": "1234"},
+            }
+        }
+        with self.assertNoLogs(_LOGGER_NAME, "DEBUG"):
+            Serializer(CLIENT_MODELS).body(data, CONVERSATION_BODY)
+        self.assertSameBody(data)
+
+    def test_thread_body(self):
+        self.assertSameBody({"conversation": Thread(id="thread-1", messages=[_message()])}, THREAD_BODY)
+
+    def test_body_model(self):
+        data = models.PathsLi5TynApiV1LogConversationPostRequestbodyContentApplicationJsonSchema(
+            conversation=Conversation(messages=[_message()])
+        )
+        self.assertSameBody(data)
+
+    def test_round_trip_fallbacks(self):
+        # Each of these is reinterpreted by deserializing into models, so direct encoding defers to it.
+        timestamp = "2024-01-02T03:04:05Z"
+        cases = [
+            {"conversation": {"messages": [{"role": "user", "message": "Hi", "event_timestamp": timestamp}]}},
+            {"conversation": {"Messages": [{"Role": "user", "Message": "Hi"}]}},
+            {"conversation": {"messages": [{"role": "user", "message": 12}]}},
+            {"conversation": {"messages": [{"role": "user", "message": "Hi", "rating": "1"}]}},
+        ]
+        for data in cases:
+            with self.subTest(data=data):
+                with self.assertLogs(_LOGGER_NAME, "DEBUG"):
+                    Serializer(CLIENT_MODELS).body(data, CONVERSATION_BODY)
+                self.assertSameBody(data)
+
+    def test_invalid_body_raises_like_generic_path(self):
+        data = {"conversation": {"messages": "not a list"}}
+        with self.assertRaises(Exception) as direct:
+            Serializer(CLIENT_MODELS).body(data, CONVERSATION_BODY)
+        with self.assertRaises(Exception) as generic:
+            _generic_body(data, CONVERSATION_BODY)
+        self.assertIs(type(direct.exception), type(generic.exception))
+        self.assertEqual(str(direct.exception), str(generic.exception))
+
+
+_TIMESTAMP = datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+
+_SAMPLE_VALUES = {
+    "str": "text",
+    "int": 3,
+    "float": 2.5,
+    "bool": True,
+    "iso-8601": _TIMESTAMP,
+    "object": {"nested": [1, 2.5, None, {"deep": True}]},
+}
+
+
+def _sample(data_type, classes, depth=0):
+    """A value of data_type, with None mixed into lists and dicts."""
+    if data_type in _SAMPLE_VALUES:
+        return _SAMPLE_VALUES[data_type]
+    if data_type.startswith("["):
+        return [_sample(data_type[1:-1], classes, depth), None]
+    if data_type.startswith("{"):
+        return {"first": _sample(data_type[1:-1], classes, depth), "second": None}
+    return _instance(classes[data_type], classes, depth + 1)
+
+
+def _instance(model_type, classes, depth=0):
+    """An instance of model_type with every attribute set, nesting models up to three levels deep."""
+    obj = model_type.__new__(model_type)
+    Model.__init__(obj)
+    for attr, attr_desc in model_type._attribute_map.items():  # pylint: disable=protected-access
+        nested = attr_desc["type"].strip("[]{}") in classes
+        setattr(obj, attr, None if nested and depth >= 3 else _sample(attr_desc["type"], classes, depth))
+    return obj
+
+
+class _Readonly(Model):
+    _validation = {"id": {"readonly": True}}
+    _attribute_map = {
+        "id": {"key": "id", "type": "str"},
+        "created": {"key": "createdAt", "type": "iso-8601"},
+        "tags": {"key": "tags", "type": "[str]"},
+    }
+
+    def __init__(self, *, created=None, tags=None, **kwargs):
+        super().__init__(**kwargs)
+        self.id = None
+        self.created = created
+        self.tags = tags
+
+
+class _Extensible(Model):
+    _attribute_map = {
+        "additional_properties": {"key": "", "type": "{object}"},
+        "name": {"key": "name", "type": "str"},
+    }
+
+    def __init__(self, *, additional_properties=None, name=None, **kwargs):
+        super().__init__(**kwargs)
+        self.additional_properties = additional_properties
+        self.name = name
+
+
+class _Parent(Model):
+    _attribute_map = {
+        "children": {"key": "children", "type": "{_Readonly}"},
+        "extensible": {"key": "extensible", "type": "[_Extensible]"},
+        "when": {"key": "when", "type": "iso-8601"},
+    }
+
+    def __init__(self, *, children=None, extensible=None, when=None, **kwargs):
+        super().__init__(**kwargs)
+        self.children = children
+        self.extensible = extensible
+        self.when = when
+
+
+TEST_MODELS = dict(CLIENT_MODELS, _Readonly=_Readonly, _Extensible=_Extensible, _Parent=_Parent)
+
+
+class CompiledEncoderTest(unittest.TestCase):
+    def assertSameSerialization(self, obj, classes=CLIENT_MODELS, **kwargs):
+        compiled = Serializer(classes)._serialize(obj, **kwargs)  # pylint: disable=protected-access
+        with _generic_serializer():
+            generic = Serializer(classes)._serialize(obj, **kwargs)  # pylint: disable=protected-access
+        self.assertEqual(compiled, generic)
+        return compiled
+
+    def test_every_generated_model(self):
+        for model_type in GENERATED_MODELS:
+            with self.subTest(model=model_type.__name__):
+                obj = _instance(model_type, CLIENT_MODELS)
+                self.assertSameSerialization(obj)
+                self.assertSameSerialization(obj, keep_readonly=True)
+                name = model_type.__name__
+                self.assertEqual(Serializer(CLIENT_MODELS).body(obj, name), _generic_body(obj, name))
+
+    def test_every_generated_model_without_values(self):
+        for model_type in GENERATED_MODELS:
+            with self.subTest(model=model_type.__name__):
+                obj = model_type.__new__(model_type)
+                Model.__init__(obj)
+                for attr in model_type._attribute_map:  # pylint: disable=protected-access
+                    setattr(obj, attr, None)
+                self.assertEqual(self.assertSameSerialization(obj), {})
+
+    def test_compiled_encoder_is_used(self):
+        obj = _instance(models.ConversationResponse, CLIENT_MODELS)
+        with mock.patch.object(Serializer, "serialize_data", side_effect=AssertionError("generic path")):
+            Serializer(CLIENT_MODELS)._serialize(obj)  # pylint: disable=protected-access
+
+    def test_naive_and_utc_datetimes(self):
+        naive = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        for timestamp in (naive, naive.replace(tzinfo=datetime.timezone.utc)):
+            with self.subTest(timestamp=timestamp):
+                self.assertSameSerialization(_message(event_timestamp=timestamp))
+
+    def test_readonly_attributes(self):
+        obj = _Readonly(created=_TIMESTAMP, tags=["a", None])
+        obj.id = "readonly"
+        self.assertNotIn("id", self.assertSameSerialization(obj, TEST_MODELS))
+        self.assertEqual(self.assertSameSerialization(obj, TEST_MODELS, keep_readonly=True)["id"], "readonly")
+
+    def test_additional_properties(self):
+        obj = _Extensible(additional_properties={"extra": [1, {"x": None}]}, name="name")
+        self.assertEqual(self.assertSameSerialization(obj, TEST_MODELS), {"extra": [1, {"x": None}], "name": "name"})
+
+    def test_nested_dicts_and_lists_of_models(self):
+        child = _Readonly(created=_TIMESTAMP, tags=[])
+        child.id = "child"
+        obj = _Parent(
+            children={"a": child, "b": None},
+            extensible=[_Extensible(additional_properties={"extra": 1}), None],
+            when=_TIMESTAMP,
+        )
+        self.assertSameSerialization(obj, TEST_MODELS)
+        self.assertSameSerialization(obj, TEST_MODELS, keep_readonly=True)
+
+    def test_invalid_values_raise_like_generic_path(self):
+        for obj in (_message(rating="not a number"), _message(metadata=["not", "a", "dict"])):
+            with self.subTest(obj=obj):
+                with self.assertLogs(_LOGGER_NAME, "DEBUG"):
+                    with self.assertRaises(Exception) as compiled:
+                        Serializer(CLIENT_MODELS)._serialize(obj)  # pylint: disable=protected-access
+                with _generic_serializer():
+                    with self.assertRaises(Exception) as generic:
+                        Serializer(CLIENT_MODELS)._serialize(obj)  # pylint: disable=protected-access
+                self.assertIs(type(compiled.exception), type(generic.exception))
+                self.assertEqual(str(compiled.exception), str(generic.exception))
+
+
+
+def _generic_deserializer():
+    """Disables compiled model decoders, leaving the generic path."""
+    return mock.patch.object(Deserializer, "_model_decoder", return_value=None)
+
+
+class CompiledDecoderTest(unittest.TestCase):
+    def assertSameDeserialization(self, data_type, data, classes=CLIENT_MODELS):
+        compiled = Deserializer(classes)(data_type, data)
+        with _generic_deserializer():
+            generic = Deserializer(classes)(data_type, data)
+        self.assertEqual(compiled, generic)
+        self.assertEqual(compiled.as_dict(), generic.as_dict())
+        return compiled
+
+    def test_every_generated_model(self):
+        for model_type in GENERATED_MODELS:
+            with self.subTest(model=model_type.__name__):
+                data = Serializer(CLIENT_MODELS)._serialize(  # pylint: disable=protected-access
+                    _instance(model_type, CLIENT_MODELS)
+                )
+                self.assertSameDeserialization(model_type.__name__, data)
+                self.assertSameDeserialization(model_type.__name__, dict(data, unknown={"extra": [1]}))
+                self.assertSameDeserialization(model_type.__name__, {key: None for key in data})
+
+    def test_compiled_decoder_is_used(self):
+        data = Serializer(CLIENT_MODELS)._serialize(  # pylint: disable=protected-access
+            _instance(models.ConversationResponse, CLIENT_MODELS)
+        )
+        with mock.patch.object(Deserializer, "deserialize_data", side_effect=AssertionError("generic path")):
+            Deserializer(CLIENT_MODELS)("ConversationResponse", data)
+
+    def test_datetimes(self):
+        for timestamp in ("2024-01-02T03:04:05Z", "2024-01-02T03:04:05.123456+05:30", "2024-01-02T03:04:05.1-08:00"):
+            with self.subTest(timestamp=timestamp):
+                message = self.assertSameDeserialization("Message", {"role": "user", "event_timestamp": timestamp})
+                self.assertIsNotNone(message.event_timestamp.tzinfo)
+
+    def test_readonly_and_additional_properties(self):
+        data = {"id": "readonly", "createdAt": "2024-01-02T03:04:05Z", "tags": ["a", None], "extra": True}
+        obj = self.assertSameDeserialization("_Readonly", data, TEST_MODELS)
+        self.assertEqual((obj.id, obj.additional_properties), ("readonly", {"extra": True}))
+        obj = self.assertSameDeserialization(
+            "_Parent", {"children": {"a": data, "b": None}, "extensible": [{"name": "x", "y": 1}, None]}, TEST_MODELS
+        )
+        self.assertEqual(obj.extensible[0].additional_properties, {"y": 1})
+
+    def test_invalid_values_raise_like_generic_path(self):
+        cases = [
+            ("Conversation", {"messages": "not a list"}),
+            ("Conversation", {"messages": [{"role": "user", "rating": "not a number"}]}),
+            ("Message", {"event_timestamp": "not a date"}),
+            ("Message", {"metadata": ["not", "a", "dict"]}),
+            ("ConversationResponse", {"topics": [["not", "a", "topic"]]}),
+        ]
+        for data_type, data in cases:
+            with self.subTest(data=data):
+                with self.assertRaises(Exception) as compiled:
+                    Deserializer(CLIENT_MODELS)(data_type, data)
+                with _generic_deserializer():
+                    with self.assertRaises(Exception) as generic:
+                        Deserializer(CLIENT_MODELS)(data_type, data)
+                self.assertIs(type(compiled.exception), type(generic.exception))
+                self.assertEqual(str(compiled.exception), str(generic.exception))
+
+
+
+def _lazy_deserializer():
+    deserializer = Deserializer(CLIENT_MODELS)
+    deserializer.lazy_models = True
+    return deserializer
+
+
+class LazyModelTest(unittest.TestCase):
+    def setUp(self):
+        self.data = conversation_json(1, metadata={"key": "value"})
+        self.eager = Deserializer(CLIENT_MODELS)("ConversationResponse", self.data)
+        self.lazy = _lazy_deserializer()("ConversationResponse", self.data)
+
+    def assertSameModel(self, lazy, eager):
+        # Nested models print with their default repr, which includes their address.
+        self.assertEqual(re.sub(" at 0x[0-9a-f]+", "", str(lazy)), re.sub(" at 0x[0-9a-f]+", "", str(eager)))
+        self.assertEqual(lazy, eager)
+        self.assertEqual(eager, lazy)
+        self.assertEqual(lazy.as_dict(), eager.as_dict())
+        self.assertEqual(lazy.serialize(keep_readonly=True), eager.serialize(keep_readonly=True))
+
+    def test_attributes_are_deferred(self):
+        pending = vars(self.lazy)["_lazy_attributes"].pending
+        self.assertEqual(set(pending), {"metadata", "topics", "suggested_topics", "messages"})
+        self.assertEqual(self.lazy.messages, self.eager.messages)
+        self.assertNotIn("messages", pending)
+
+    def test_lazy_and_eager_models_match(self):
+        self.assertSameModel(self.lazy, self.eager)
+        self.assertNotIn("_lazy_attributes", vars(self.lazy))
+        self.assertEqual(list(vars(self.lazy)), list(vars(self.eager)))
+
+    def test_partially_accessed_models_match(self):
+        self.assertEqual(self.lazy.topics[0].name, "greeting")
+        self.assertSameModel(self.lazy, self.eager)
+
+    def test_assignment_replaces_pending_values(self):
+        for obj in (self.lazy, self.eager):
+            obj.messages = []
+            obj.topics[0].name = "changed"
+        self.assertEqual(self.lazy.messages, [])
+        self.assertSameModel(self.lazy, self.eager)
+
+    def test_assigning_every_pending_attribute(self):
+        for attr in ("metadata", "topics", "suggested_topics", "messages"):
+            setattr(self.lazy, attr, None)
+        self.assertNotIn("_lazy_attributes", vars(self.lazy))
+        self.assertEqual(self.lazy.as_dict(), {"id": self.lazy.id, "sentiment_trend": self.lazy.sentiment_trend})
+
+    def test_deletion_discards_pending_values(self):
+        del self.lazy.messages
+        del self.eager.messages
+        with self.assertRaises(AttributeError):
+            self.lazy.messages  # pylint: disable=pointless-statement
+        with self.assertRaises(AttributeError):
+            del self.lazy.messages
+        self.assertEqual(self.lazy, self.eager)
+        self.lazy.messages = []
+        self.assertEqual(self.lazy.messages, [])
+
+    def test_pickling(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.lazy)), self.eager)
+
+    def test_wrong_json_types_fail_deserialization(self):
+        for field, value in (("messages", "not a list"), ("metadata", ["not a dict"]), ("topics", {"not": "a list"})):
+            with self.subTest(field=field):
+                data = dict(self.data, **{field: value})
+                with self.assertRaises(DeserializationError) as lazy:
+                    _lazy_deserializer()("ConversationResponse", data)
+                with self.assertRaises(DeserializationError) as eager:
+                    Deserializer(CLIENT_MODELS)("ConversationResponse", data)
+                self.assertEqual(str(lazy.exception), str(eager.exception))
+
+    def test_nested_invalid_values_fail_on_access(self):
+        for field, value in (
+            ("messages", [dict(self.data["messages"][0], event_timestamp="not a date")]),
+            ("topics", [["not a topic"]]),
+        ):
+            with self.subTest(field=field):
+                lazy = _lazy_deserializer()("ConversationResponse", dict(self.data, **{field: value}))
+                with self.assertRaises(DeserializationError):
+                    getattr(lazy, field)
+
+    def test_client_pages_match(self):
+        page = page_json([conversation_json(i) for i in range(3)], page=1, pages=1)
+        results = []
+        for lazy_models in (False, True):
+            with client(StubTransport(lambda request: reply(200, page)), lazy_models=lazy_models) as c:
+                results.append(c.conversations())
+        self.assertEqual(results[1].conversations, results[0].conversations)
+        self.assertEqual(results[1].pagination, results[0].pagination)
+
+    def test_generated_classes_are_untouched(self):
+        self.assertIsInstance(self.lazy, ConversationResponse)
+        self.assertIsNot(type(self.lazy), ConversationResponse)
+        self.assertIs(type(_lazy_deserializer()("ConversationResponse", self.data)), type(self.lazy))
+        page = page_json([conversation_json(0)], page=1, pages=1)
+        with client(StubTransport(lambda request: reply(200, page)), lazy_models=True) as c:
+            c.conversations().conversations[0].messages  # pylint: disable=pointless-statement
+        with client(StubTransport(lambda request: reply(200, page))) as c:
+            conversation = c.conversations().conversations[0]
+        for obj in (conversation, conversation.messages[0], conversation.topics[0]):
+            self.assertFalse(any(isinstance(value, _LazyAttribute) for value in vars(type(obj)).values()))
+        self.assertIs(type(conversation), ConversationResponse)
+
+    def test_copies_are_of_the_generated_class(self):
+        for obj in (copy.copy(self.lazy), copy.deepcopy(self.lazy), pickle.loads(pickle.dumps(self.lazy))):
+            self.assertIs(type(obj), ConversationResponse)
+            self.assertEqual(obj, self.eager)
+
+
+def _tz(hours, minutes=0):
+    return datetime.timezone(datetime.timedelta(hours=hours, minutes=minutes))
+
+
+class DatetimeTest(unittest.TestCase):
+    def test_parse(self):
+        cases = {
+            "2024-01-02T03:04:05Z": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=_tz(0)),
+            "2024-01-02T03:04:05+05:30": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=_tz(5, 30)),
+            "2024-01-02T03:04:05-08:00": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=_tz(-8)),
+            "2024-01-02T03:04:05.1Z": datetime.datetime(2024, 1, 2, 3, 4, 5, 100000, tzinfo=_tz(0)),
+            "2024-01-02T03:04:05.123-08:00": datetime.datetime(2024, 1, 2, 3, 4, 5, 123000, tzinfo=_tz(-8)),
+            "2024-01-02T03:04:05.123456Z": datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=_tz(0)),
+            "2024-01-02T03:04:05.1234567891Z": datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=_tz(0)),
+            "2024-01-02t03:04:05.5z": datetime.datetime(2024, 1, 2, 3, 4, 5, 500000, tzinfo=_tz(0)),
+        }
+        for string, expected in cases.items():
+            with self.subTest(string=string):
+                parsed = Deserializer.deserialize_iso(string)
+                self.assertEqual(parsed, expected)
+                self.assertEqual(parsed.utcoffset(), expected.utcoffset())
+                self.assertEqual(parsed, isodate.parse_datetime(string.upper().replace("7891", "")))
+
+    def test_offsets_are_datetime_timezones(self):
+        for string in ("2024-01-02T03:04:05Z", "2024-01-02T03:04:05.123+05:30"):
+            with self.subTest(string=string):
+                self.assertIsInstance(Deserializer.deserialize_iso(string).tzinfo, datetime.timezone)
+
+    def test_format_converts_to_utc(self):
+        cases = {
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=_tz(0)): "2024-01-02T03:04:05.000Z",
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 120000, tzinfo=_tz(5, 30)): "2024-01-01T21:34:05.120Z",
+            datetime.datetime(2024, 1, 2, 23, 4, 5, 123456, tzinfo=_tz(-8)): "2024-01-03T07:04:05.123456Z",
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(Serializer.serialize_iso(value), expected)
+        self.assertEqual(Serializer.serialize_iso("2024-01-02T03:04:05+01:00"), "2024-01-02T02:04:05.000Z")
+
+    def test_round_trip(self):
+        for value in (
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=_tz(0)),
+            datetime.datetime(2024, 2, 29, 23, 59, 59, 999999, tzinfo=_tz(0)),
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=_tz(-3, -30)),
+            datetime.datetime(1, 1, 2, 0, 0, 0, 1, tzinfo=_tz(0)),
+        ):
+            with self.subTest(value=value):
+                string = Serializer.serialize_iso(value)
+                self.assertEqual(Deserializer.deserialize_iso(string), value)
+                self.assertEqual(Serializer.serialize_iso(Deserializer.deserialize_iso(string)), string)
+
+    def test_repeated_strings_share_one_datetime(self):
+        string = "2024-01-02T03:04:05.123Z"
+        self.assertIs(Deserializer.deserialize_iso(string), Deserializer.deserialize_iso(string))
+
+    def test_invalid_values(self):
+        for string in ("not a date", "2024-13-02T03:04:05Z", "2024-02-30T03:04:05Z", "2024-01-02", ""):
+            with self.subTest(string=string):
+                with self.assertRaises(DeserializationError):
+                    Deserializer.deserialize_iso(string)
+        with self.assertRaises(SerializationError):
+            Serializer.serialize_iso(datetime.datetime.max.replace(tzinfo=_tz(-1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+import datetime
+import threading
+import types
+import unittest
+import urllib.parse
+
+from azure.core.exceptions import ResourceNotFoundError, ServiceRequestError
+
+from getcontext.generated._serialization import Deserializer
+from getcontext.sharding import AsyncShardedConversationExport, ShardedConversationExport, TimeShard
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client, conversation_json, page_json, reply
+
+_START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+_END = _START + datetime.timedelta(hours=8)
+
+
+def _timestamps(count, spacing=datetime.timedelta(minutes=30)):
+    return [_START + spacing * i for i in range(count)]
+
+
+class _Archive:
+    """Answers shard page fetches from conversations at fixed times, bounds included like the API."""
+
+    def __init__(self, timestamps, per_page=2):
+        self.timestamps = timestamps
+        self.per_page = per_page
+        self.fetched = []
+        self._lock = threading.Lock()
+
+    def _ids(self, shard):
+        return [
+            "conversation-{}".format(i)
+            for i, timestamp in enumerate(self.timestamps)
+            if shard.start <= timestamp <= shard.end
+        ]
+
+    def page(self, shard, number):
+        with self._lock:
+            self.fetched.append((shard, number))
+        ids = self._ids(shard)
+        pages = max(1, -(-len(ids) // self.per_page))
+        conversations = ids[(number - 1) * self.per_page : number * self.per_page]
+        pagination = types.SimpleNamespace(
+            total_records=len(ids), current_page=number, next_page=min(number + 1, pages), page_count=pages
+        )
+        return types.SimpleNamespace(
+            conversations=[types.SimpleNamespace(id=id) for id in conversations], pagination=pagination
+        )
+
+    __call__ = page
+
+    async def async_page(self, shard, number):
+        return self.page(shard, number)
+
+
+def _ids(count):
+    return ["conversation-{}".format(i) for i in range(count)]
+
+
+class TimeShardTest(unittest.TestCase):
+    def test_split(self):
+        shard = TimeShard(_START, _END)
+        parts = shard.split(3)
+        self.assertEqual([part.duration for part in parts], [datetime.timedelta(hours=8) / 3] * 3)
+        self.assertEqual((parts[0].start, parts[-1].end), (_START, _END))
+        self.assertTrue(all(a.end == b.start for a, b in zip(parts, parts[1:])))
+        self.assertEqual(shard.split(1), [shard])
+        with self.assertRaises(ValueError):
+            shard.split(0)
+
+    def test_iso_strings(self):
+        shard = TimeShard(_START, _END)
+        self.assertEqual(Deserializer.deserialize_iso(shard.start_time), _START)
+        self.assertEqual(Deserializer.deserialize_iso(shard.end_time), _END)
+        self.assertEqual(str(shard), "{}/{}".format(shard.start_time, shard.end_time))
+
+
+class ShardedConversationExportTest(unittest.TestCase):
+    def test_shards_are_yielded_in_time_order(self):
+        archive = _Archive(_timestamps(16))
+        export = ShardedConversationExport(archive, _START, _END, shards=4, concurrency=3)
+        self.assertEqual([conversation.id for conversation in export], _ids(16))
+        self.assertEqual(export.shards, TimeShard(_START, _END).split(4))
+        self.assertEqual((export.count, export.splits), (16, 0))
+        self.assertEqual(export.pages, len(archive.fetched))
+        self.assertTrue(any(number > 1 for _, number in archive.fetched))
+
+    def test_conversations_on_shard_boundaries_are_yielded_once(self):
+        # Conversations every 30 minutes fall on the hour boundaries between the 8 shards.
+        archive = _Archive(_timestamps(17), per_page=10)
+        export = ShardedConversationExport(archive, _START, _END, shards=8)
+        self.assertEqual([conversation.id for conversation in export], _ids(17))
+        self.assertEqual(export.duplicates, 7)
+        # Only the ids first yielded by the last two shards are still kept.
+        self.assertEqual(export._seen | export._seen_before, set(_ids(17)[13:]))  # pylint: disable=protected-access
+
+    def test_dense_shards_are_split(self):
+        # Later shards complete while the earliest is being split, filling the window.
+        archive = _Archive(_timestamps(32, datetime.timedelta(minutes=15)))
+        export = ShardedConversationExport(archive, _START, _END, shards=2, concurrency=2, max_shard_records=5)
+        self.assertEqual([conversation.id for conversation in export], _ids(32))
+        self.assertEqual(export.splits, 6)
+        self.assertEqual(len(export.shards), 8)
+        self.assertEqual((export.shards[0].start, export.shards[-1].end), (_START, _END))
+        self.assertTrue(all(a.end == b.start for a, b in zip(export.shards, export.shards[1:])))
+
+    def test_shards_are_not_split_below_the_minimum_duration(self):
+        archive = _Archive(_timestamps(16))
+        export = ShardedConversationExport(
+            archive, _START, _END, shards=2, max_shard_records=1, min_shard_duration=datetime.timedelta(hours=2)
+        )
+        self.assertEqual(len(list(export)), 16)
+        self.assertEqual(export.splits, 2)
+        self.assertEqual([shard.duration for shard in export.shards], [datetime.timedelta(hours=2)] * 4)
+
+    def test_string_and_naive_bounds(self):
+        archive = _Archive(_timestamps(4))
+        export = ShardedConversationExport(archive, "2024-01-01T00:00:00Z", _END.replace(tzinfo=None), shards=1)
+        self.assertEqual(len(list(export)), 4)
+        self.assertEqual(export.shards, [TimeShard(_START, _END)])
+
+    def test_failed_pages_are_retried(self):
+        archive = _Archive(_timestamps(8))
+        failures = [ServiceRequestError("offline")]
+
+        def fetch(shard, number):
+            if number == 2 and failures:
+                raise failures.pop()
+            return archive(shard, number)
+
+        export = ShardedConversationExport(fetch, _START, _END, shards=2, retry_backoff=0)
+        with self.assertLogs("getcontext.paging", "WARNING"):
+            self.assertEqual(len(list(export)), 8)
+        self.assertEqual(export.retried, 1)
+
+    def test_errors_are_raised(self):
+        def fetch(shard, number):
+            raise ResourceNotFoundError("gone")
+
+        with self.assertRaises(ResourceNotFoundError):
+            list(ShardedConversationExport(fetch, _START, _END, page_retries=0))
+
+    def test_leaving_early_stops_the_export(self):
+        archive = _Archive(_timestamps(16))
+        with ShardedConversationExport(archive, _START, _END, shards=8, concurrency=1) as export:
+            for _ in export:
+                break
+        self.assertLess(len({shard for shard, _ in archive.fetched}), 8)
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"shards": 0}, {"max_shard_records": 0}, {"concurrency": 0}, {"end_time": _START}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    ShardedConversationExport(_Archive([]), _START, **dict({"end_time": _END}, **kwargs))
+
+    def test_client_export_conversations(self):
+        def handler(request):
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+            start = Deserializer.deserialize_iso(query["start_time"][0])
+            index = int((start - _START) / datetime.timedelta(hours=1))
+            return reply(200, page_json([conversation_json(index)], page=1, pages=1))
+
+        transport = StubTransport(handler)
+        with client(transport) as c:
+            export = c.export_conversations(start_time=_START, end_time=_END, shards=4, tenant_id=3)
+            ids = [conversation.id for conversation in export]
+        self.assertEqual(ids, ["conversation-{}".format(i) for i in (0, 2, 4, 6)])
+        self.assertEqual(len(transport.requests), 4)
+        self.assertTrue(all("tenant_id=3" in request.url for request in transport.requests))
+
+
+class AsyncShardedConversationExportTest(unittest.IsolatedAsyncioTestCase):
+    async def test_export(self):
+        archive = _Archive(_timestamps(32, datetime.timedelta(minutes=15)))
+        export = AsyncShardedConversationExport(archive.async_page, _START, _END, shards=2, max_shard_records=5)
+        self.assertEqual([conversation.id async for conversation in export], _ids(32))
+        self.assertEqual((export.splits, export.duplicates), (6, 7))
+
+    async def test_closed_export_stops_paginating(self):
+        archive = _Archive(_timestamps(16))
+        export = AsyncShardedConversationExport(archive.async_page, _START, _END, shards=1)
+        await export.close()
+        pages = await export._export_shard(TimeShard(_START, _END))  # pylint: disable=protected-access
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(archive.fetched, [(TimeShard(_START, _END), 1)])
+
+    async def test_client_export_conversations(self):
+        def handler(request):
+            # A conversation on the boundary between the first two shards.
+            start_time = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)["start_time"][0]
+            found = Deserializer.deserialize_iso(start_time) < _START + datetime.timedelta(hours=4)
+            return reply(200, page_json([conversation_json(0)] if found else [], page=1, pages=1))
+
+        transport = AsyncStubTransport(handler)
+        async with async_client(transport) as c:
+            export = c.export_conversations(start_time=_START, end_time=_END, shards=4)
+            ids = [conversation.id async for conversation in export]
+        self.assertEqual(ids, ["conversation-0"])
+        self.assertEqual((export.duplicates, len(transport.requests)), (1, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import socket
+import stat
+import tempfile
+import time
+import unittest
+import zlib
+
+from getcontext.generated.models import Conversation, Message
+from getcontext.json_backends import StdlibJSONBackend
+from getcontext.sidecar import SidecarClient, SidecarServer
+from getcontext.spool import _RECORD_HEADER, encode_record
+
+from tests.stubs import StubTransport, client
+
+
+def _body(text):
+    return {"conversation": Conversation(messages=[Message(role="user", message=text)])}
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the sidecar.")
+        time.sleep(0.01)
+
+
+class _CountingBackend(StdlibJSONBackend):
+    def __init__(self):
+        self.calls = 0
+
+    def dumps(self, obj):
+        self.calls += 1
+        return super().dumps(obj)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix domain sockets")
+class SidecarTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "sidecar.sock")
+        self.transport = StubTransport()
+        self.client = client(self.transport)
+        self.addCleanup(self.client.close)
+        self.server = SidecarServer(self.client, self.path)
+        self.addCleanup(self.server.close)
+        self.server.start()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5)
+        sock.connect(self.path)
+        self.addCleanup(sock.close)
+        return sock
+
+    def test_calls_are_forwarded(self):
+        backend = _CountingBackend()
+        with SidecarClient(self.path, json_backend=backend) as sidecar:
+            self.assertTrue(sidecar.conversation(_body("hello"), tenant_id="tenant"))
+            self.assertTrue(sidecar.conversation_upsert(b'{"conversation": {"messages": []}}'))
+            _wait_for(lambda: self.server.received == 2)
+        self.server.close()
+
+        self.assertEqual((sidecar.sent, backend.calls), (2, 1))
+        with client() as direct:
+            expected = direct.log._encode_body("conversation", _body("hello"))  # pylint: disable=protected-access
+        self.assertEqual(self.transport.requests[0].content, expected)
+        self.assertIn("tenant_id=tenant", self.transport.requests[0].url)
+        self.assertTrue(self.transport.requests[1].url.endswith("/log/conversation/upsert"))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_socket_is_created_private(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_stale_socket_is_replaced(self):
+        path = os.path.join(self._tmp.name, "stale.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+        server = SidecarServer(self.client, path)
+        self.addCleanup(server.close)
+        server.start()
+        with SidecarClient(path) as sidecar:
+            sidecar.conversation(_body("Hello"))
+        _wait_for(lambda: server.received == 1)
+
+    def test_live_socket_is_not_replaced(self):
+        with self.assertRaises(OSError):
+            SidecarServer(self.client, self.path)
+        self.assertTrue(stat.S_ISSOCK(os.stat(self.path).st_mode))
+        self._connect()
+
+    def test_other_files_are_not_replaced(self):
+        path = os.path.join(self._tmp.name, "file")
+        with open(path, "w") as file:
+            file.write("data")
+        with self.assertRaises(FileExistsError):
+            SidecarServer(self.client, path)
+        with open(path) as file:
+            self.assertEqual(file.read(), "data")
+
+    def test_unknown_operations_are_skipped(self):
+        sock = self._connect()
+        sock.sendall(encode_record("delete_everything", b"{}"))
+        sock.sendall(encode_record("conversation", b'{"conversation": {"messages": []}}'))
+        _wait_for(lambda: self.server.received == 1)
+        self.assertEqual(self.server.rejected, 1)
+
+    def test_undecodable_record_closes_the_connection(self):
+        payload = b"not json\n{}"
+        sock = self._connect()
+        with self.assertLogs("getcontext.sidecar", "WARNING"):
+            sock.sendall(_RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+            self.assertEqual(sock.recv(1), b"")
+        self.assertEqual((self.server.received, self.server.rejected), (0, 1))
+
+    def test_oversized_record_closes_the_connection(self):
+        self.server.max_record_size = 10
+        sock = self._connect()
+        with self.assertLogs("getcontext.sidecar", "WARNING"):
+            sock.sendall(encode_record("conversation", b"x" * 100))
+            self.assertEqual(sock.recv(1), b"")
+        self.assertEqual(self.server.received, 0)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix domain sockets")
+class SidecarClientTest(unittest.TestCase):
+    def test_unavailable_sidecar_drops_calls(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with SidecarClient(os.path.join(directory, "missing.sock")) as sidecar:
+                with self.assertLogs("getcontext.sidecar", "WARNING"):
+                    self.assertFalse(sidecar.conversation(_body("hello")))
+        self.assertEqual((sidecar.sent, sidecar.dropped), (0, 1))
+
+    def test_unknown_operation(self):
+        with SidecarClient("unused.sock") as sidecar:
+            with self.assertRaises(ValueError):
+                sidecar.submit("delete_everything", b"{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
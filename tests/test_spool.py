@@ -0,0 +1,159 @@
+import os
+import tempfile
+import unittest
+
+from azure.core.exceptions import HttpResponseError, ServiceRequestError
+
+from getcontext.generated.models import Conversation, Message
+from getcontext.spool import Spool, encode_record
+
+from tests.stubs import StubTransport, async_client, client, reply
+
+
+def _bodies(records):
+    return [record.body for record in records]
+
+
+class SpoolTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        self.addCleanup(self._tmp.cleanup)
+
+    def _spool(self, **kwargs):
+        spool = Spool(self.directory, **kwargs)
+        self.addCleanup(spool.close)
+        return spool
+
+    def _segment(self):
+        (name,) = [name for name in os.listdir(self.directory) if name.endswith(".seg")]
+        return os.path.join(self.directory, name)
+
+    def test_replays_in_order(self):
+        spool = self._spool()
+        for i in range(3):
+            spool.append("conversation", b"body-%d" % i, tenant_id=str(i))
+        self.assertEqual(len(spool), 3)
+
+        records = []
+        self.assertEqual(spool.replay(records.append), 3)
+        self.assertEqual(_bodies(records), [b"body-0", b"body-1", b"body-2"])
+        self.assertEqual([record.params["tenant_id"] for record in records], ["0", "1", "2"])
+        self.assertEqual(len(spool), 0)
+
+    def test_replay_stops_at_retryable_failure(self):
+        spool = self._spool()
+        for i in range(3):
+            spool.append("conversation", b"body-%d" % i)
+        sent = []
+
+        def send(record):
+            if record.body == b"body-1":
+                raise ServiceRequestError("offline")
+            sent.append(record)
+
+        self.assertEqual(spool.replay(send), 1)
+        self.assertEqual(len(spool), 2)
+        spool.replay(sent.append)
+        self.assertEqual(_bodies(sent), [b"body-0", b"body-1", b"body-2"])
+
+    def test_replay_drops_rejected_records(self):
+        spool = self._spool()
+        spool.append("conversation", b"rejected")
+        spool.append("conversation", b"accepted")
+        sent = []
+
+        def send(record):
+            if record.body == b"rejected":
+                error = HttpResponseError("bad request")
+                error.status_code = 400
+                raise error
+            sent.append(record)
+
+        with self.assertLogs("getcontext.spool", "WARNING"):
+            self.assertEqual(spool.replay(send), 2)
+        self.assertEqual(_bodies(sent), [b"accepted"])
+        self.assertEqual((len(spool), spool.replayed), (0, 1))
+
+    def test_recovers_after_restart(self):
+        spool = self._spool()
+        for i in range(4):
+            spool.append("conversation", b"body-%d" % i)
+        spool.replay(lambda record: None, limit=1)
+        spool.close()
+
+        reopened = self._spool()
+        self.assertEqual(len(reopened), 3)
+        records = []
+        reopened.replay(records.append)
+        self.assertEqual(_bodies(records), [b"body-1", b"body-2", b"body-3"])
+
+    def test_truncated_tail_is_dropped_on_open(self):
+        spool = self._spool()
+        spool.append("conversation", b"complete")
+        spool.append("conversation", b"torn by a crash")
+        spool.close()
+        path = self._segment()
+        os.truncate(path, os.path.getsize(path) - 3)
+
+        with self.assertLogs("getcontext.spool", "WARNING"):
+            reopened = self._spool()
+        self.assertEqual(len(reopened), 1)
+        reopened.append("conversation", b"after restart")
+        self.assertEqual(len(reopened), 2)
+
+        records = []
+        reopened.replay(records.append)
+        self.assertEqual(_bodies(records), [b"complete", b"after restart"])
+
+    def test_budget_drops_oldest_segment(self):
+        record_size = len(encode_record("conversation", b"body-0"))
+        spool = self._spool(segment_size=2 * record_size, max_bytes=4 * record_size)
+        with self.assertLogs("getcontext.spool", "WARNING"):
+            for i in range(6):
+                spool.append("conversation", b"body-%d" % i)
+        self.assertEqual(spool.dropped_bytes, 2 * record_size)
+        self.assertEqual(len(spool), 4)
+        records = []
+        spool.replay(records.append)
+        self.assertEqual(_bodies(records), [b"body-2", b"body-3", b"body-4", b"body-5"])
+
+    def test_compact_removes_replayed_segments(self):
+        spool = self._spool(segment_size=64)
+        for i in range(4):
+            spool.append("conversation", b"body-%d" % i)
+        spool.replay(lambda record: None)
+        spool.append("conversation", b"new")
+        spool.compact()
+        self.assertEqual(len(spool), 1)
+        self.assertLessEqual(spool.size, 64)
+
+
+class ClientSpoolTest(unittest.TestCase):
+    def test_failed_calls_are_spooled_and_replayed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            online = [False]
+            transport = StubTransport(lambda request: reply(201) if online[0] else ServiceRequestError("offline"))
+            spool = Spool(directory)
+            with client(transport, spool=spool, spool_replay_interval=3600) as c:
+                body = {"conversation": Conversation(messages=[Message(role="user", message="hi")])}
+                with self.assertLogs("getcontext.generated.operations._patch", "WARNING"):
+                    self.assertIsNone(c.log.conversation(body, tenant_id="tenant"))
+                self.assertEqual(len(spool), 1)
+
+                online[0] = True
+                self.assertEqual(c.spool_replayer.replay(), 1)
+                self.assertEqual(len(spool), 0)
+                self.assertEqual(transport.bodies()[0], transport.bodies()[1])
+                self.assertIn("tenant_id=tenant", transport.requests[1].url)
+
+    def test_aio_client_rejects_spool(self):
+        with tempfile.TemporaryDirectory() as directory:
+            spool = Spool(directory)
+            with self.assertRaises(TypeError):
+                async_client(spool=spool)
+            spool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import datetime
+import os
+import tempfile
+import unittest
+import urllib.parse
+from unittest import mock
+
+from azure.core.exceptions import ServiceRequestError
+
+from getcontext.generated._serialization import Deserializer
+from getcontext.store import ConversationStore, SyncResult
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client, conversation_json, page_json, reply
+
+_NOW = datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc)
+
+
+def _query(request):
+    return {key: values[0] for key, values in urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query).items()}
+
+
+def _handler(count, per_page=2, **fields):
+    """Serves ``count`` conversations, ``per_page`` to a page."""
+
+    def handler(request):
+        number = int(_query(request)["page"])
+        pages = max(1, -(-count // per_page))
+        indexes = range((number - 1) * per_page, min(number * per_page, count))
+        return reply(200, page_json([conversation_json(i, **fields) for i in indexes], page=number, pages=pages))
+
+    return handler
+
+
+class ConversationStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = ConversationStore(":memory:")
+        self.addCleanup(self.store.close)
+        patcher = mock.patch("getcontext.store._now", return_value=_NOW)
+        self.now = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _sync(self, transport, **kwargs):
+        with client(transport) as c:
+            return self.store.sync(c, per_page=2, **kwargs)
+
+    def test_first_sync_fetches_the_full_history(self):
+        transport = StubTransport(_handler(5))
+        result = self._sync(transport)
+        end_time = "2024-01-02T00:00:00.000Z"
+        self.assertEqual(result, SyncResult(None, None, end_time, 3, 5))
+        self.assertEqual(self.store.watermark(), _NOW)
+        queries = [_query(request) for request in transport.requests]
+        self.assertEqual([query["page"] for query in queries], ["1", "2", "3"])
+        self.assertTrue(all(query["end_time"] == end_time and "start_time" not in query for query in queries))
+
+        self.assertEqual(self.store.count(), 5)
+        self.assertEqual(list(self.store.iter_json(batch_size=2)), [conversation_json(i) for i in range(5)])
+        self.assertEqual([c.id for c in self.store.conversations()], ["conversation-{}".format(i) for i in range(5)])
+        stored = self.store.get("conversation-3")
+        self.assertEqual(stored.messages[0].message, "Hello 3")
+        self.assertIsNone(self.store.get("conversation-9"))
+
+    def test_later_syncs_start_at_the_watermark(self):
+        self._sync(StubTransport(_handler(3)))
+        self.now.return_value = _NOW + datetime.timedelta(hours=1)
+        transport = StubTransport(_handler(2, sentiment_trend="up"))
+        result = self._sync(transport)
+        start = Deserializer.deserialize_iso(_query(transport.requests[0])["start_time"])
+        self.assertEqual(start, _NOW - self.store.overlap)
+        self.assertEqual((result.pages, result.conversations), (1, 2))
+        self.assertEqual(self.store.watermark(), _NOW + datetime.timedelta(hours=1))
+        self.assertEqual(self.store.count(), 3)
+        self.assertEqual([c.sentiment_trend for c in self.store.conversations()], ["up", "up", "flat"])
+
+    def test_full_sync_ignores_the_watermark(self):
+        self._sync(StubTransport(_handler(1)))
+        start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+        transport = StubTransport(_handler(1))
+        result = self._sync(transport, start_time=start, full=True)
+        self.assertEqual(Deserializer.deserialize_iso(result.start_time), start)
+        self.assertEqual(_query(transport.requests[0])["start_time"], result.start_time)
+
+    def test_tenants_are_kept_apart(self):
+        transport = StubTransport(_handler(2))
+        self._sync(transport, tenant_id=7, start_time="2023-06-01T00:00:00Z")
+        self.assertEqual(_query(transport.requests[0])["tenant_id"], "7")
+        self.assertEqual(_query(transport.requests[0])["start_time"], "2023-06-01T00:00:00Z")
+        self.assertEqual((self.store.count(7), self.store.count()), (2, 0))
+        self.assertEqual((self.store.watermark(7), self.store.watermark()), (_NOW, None))
+        self.assertIsNone(self.store.get("conversation-0"))
+        self.assertIsNotNone(self.store.get("conversation-0", tenant_id=7))
+
+    def test_failed_syncs_keep_the_watermark(self):
+        transport = StubTransport(_handler(5))
+        transport.replies.append(reply(200, page_json([conversation_json(0)], page=1, pages=3)))
+        transport.replies.append(ServiceRequestError("offline"))
+        with self.assertRaises(ServiceRequestError):
+            self._sync(transport)
+        self.assertIsNone(self.store.watermark())
+        self.assertEqual(self.store.count(), 1)
+
+    def test_empty_pages_end_the_sync(self):
+        transport = StubTransport(lambda request: reply(200, page_json([], page=1, pages=4)))
+        self.assertEqual(self._sync(transport).pages, 1)
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_store_file_is_reopened(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "conversations.db")
+            with ConversationStore(path) as store:
+                with client(StubTransport(_handler(3))) as c:
+                    store.sync(c)
+            with ConversationStore(path, json_backend="auto") as store:
+                self.assertEqual((store.count(), store.watermark()), (3, _NOW))
+                self.assertIn("conversations.db", repr(store))
+
+
+class AsyncConversationStoreTest(unittest.IsolatedAsyncioTestCase):
+    async def test_sync(self):
+        with ConversationStore(":memory:") as store, mock.patch("getcontext.store._now", return_value=_NOW):
+            async with async_client(AsyncStubTransport(_handler(3))) as c:
+                result = await store.sync_async(c, per_page=2, tenant_id=1)
+            self.assertEqual((result.pages, result.conversations), (2, 3))
+            self.assertEqual((store.count(1), store.watermark(1)), (3, _NOW))
+
+
+if __name__ == "__main__":
+    unittest.main()
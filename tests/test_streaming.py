@@ -0,0 +1,139 @@
+import codecs
+import json
+import unittest
+
+from azure.core.exceptions import DeserializationError, ResourceNotFoundError
+
+from getcontext.streaming import JSONArraySplitter
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client, conversation_json, page_json, reply
+
+
+def _split(document, chunk_size=1, array_key="conversations"):
+    splitter = JSONArraySplitter(array_key)
+    items = []
+    for i in range(0, len(document), chunk_size):
+        items += splitter.feed(document[i : i + chunk_size])
+    splitter.close()
+    return [json.loads(item) for item in items], {key: json.loads(raw) for key, raw in splitter.fields.items()}
+
+
+class JSONArraySplitterTest(unittest.TestCase):
+    def test_items_and_fields(self):
+        data = page_json([conversation_json(i) for i in range(3)], page=1, pages=2)
+        document = json.dumps(data, indent=2).encode("utf-8")
+        for chunk_size in (1, 7, len(document)):
+            with self.subTest(chunk_size=chunk_size):
+                items, fields = _split(document, chunk_size)
+                self.assertEqual(items, data["conversations"])
+                self.assertEqual(fields, {"pagination": data["pagination"]})
+
+    def test_items_are_returned_as_soon_as_complete(self):
+        splitter = JSONArraySplitter("conversations")
+        self.assertEqual(splitter.feed(b'{"conversations": [{"id": 1}, {"id"'), [b'{"id": 1}'])
+        self.assertEqual(splitter.feed(b": 2}]}"), [b'{"id": 2}'])
+        splitter.close()
+
+    def test_tricky_values(self):
+        data = {
+            "first": 'braces "{[" and \\" escapes \\\\',
+            "conversations": [
+                {"text": 'quote " bracket ] brace } backslash \\'},
+                [[1, [2]], {"a": []}],
+                "a string",
+                -1.5e3,
+                True,
+                None,
+                "☃ \U0001f600",
+            ],
+            "last": 12,
+        }
+        for separators in ((",", ":"), (", ", ": ")):
+            document = codecs.BOM_UTF8 + json.dumps(data, separators=separators).encode("utf-8")
+            with self.subTest(separators=separators):
+                items, fields = _split(document)
+                self.assertEqual(items, data["conversations"])
+                self.assertEqual(fields, {"first": data["first"], "last": 12})
+
+    def test_empty_documents(self):
+        self.assertEqual(_split(b"{}"), ([], {}))
+        self.assertEqual(_split(b' { "conversations" : [ ] } '), ([], {}))
+
+    def test_other_arrays_are_kept_whole(self):
+        items, fields = _split(b'{"topics": [1, 2], "conversations": [3]}')
+        self.assertEqual((items, fields), ([3], {"topics": [1, 2]}))
+
+    def test_truncated_documents(self):
+        for document in (b"", b'{"conversations": [{"id": 1}', b'{"conversations": [], "pagination": {"a"', b'{"a": 1'):
+            with self.subTest(document=document):
+                with self.assertRaises(DeserializationError):
+                    _split(document)
+
+    def test_invalid_documents(self):
+        for document in (b"[]", b'{"conversations": [1 2]}', b'{"a" 1}', b'{"a": 1}}'):
+            with self.subTest(document=document):
+                with self.assertRaises(DeserializationError):
+                    _split(document)
+
+
+def _pages_handler(request):
+    return reply(200, page_json([conversation_json(i) for i in range(5)], page=1, pages=3))
+
+
+class ConversationStreamTest(unittest.TestCase):
+    def test_stream_matches_conversations(self):
+        transport = StubTransport(_pages_handler, block_size=16)
+        with client(transport) as c:
+            expected = c.conversations(per_page=5)
+            stream = c.stream_conversations(per_page=5)
+            self.assertIsNone(stream.pagination)
+            conversations = list(stream)
+
+        self.assertEqual(conversations, expected.conversations)
+        self.assertEqual(stream.pagination, expected.pagination)
+        self.assertEqual(stream.count, 5)
+        self.assertIn("per_page=5", transport.requests[1].url)
+
+    def test_iter_json_and_read_json(self):
+        with client(StubTransport(_pages_handler, block_size=16)) as c:
+            expected = [conversation_json(i) for i in range(5)]
+            self.assertEqual(list(c.stream_conversations().iter_json()), expected)
+            stream = c.stream_conversations()
+            self.assertEqual(stream.read_json(), expected)
+            self.assertEqual((stream.count, stream.pagination.page_count), (5, 3))
+
+    def test_response_is_closed_when_iteration_stops_early(self):
+        transport = StubTransport(_pages_handler, block_size=16)
+        with client(transport) as c:
+            with c.stream_conversations() as stream:
+                next(iter(stream))
+            self.assertTrue(stream._response.is_closed)  # pylint: disable=protected-access
+
+    def test_truncated_body_raises(self):
+        body = json.dumps(page_json([conversation_json(0)], page=1, pages=1)).encode("utf-8")[:-20]
+        with client(StubTransport(lambda request: reply(200, body))) as c:
+            with self.assertRaises(DeserializationError):
+                list(c.stream_conversations())
+
+    def test_error_status(self):
+        with client(StubTransport(lambda request: reply(404))) as c:
+            with self.assertRaises(ResourceNotFoundError):
+                c.stream_conversations()
+
+
+class AsyncConversationStreamTest(unittest.IsolatedAsyncioTestCase):
+    async def test_stream_matches_conversations(self):
+        async with async_client(AsyncStubTransport(_pages_handler, block_size=16)) as c:
+            expected = await c.conversations()
+            stream = await c.stream_conversations()
+            conversations = [conversation async for conversation in stream]
+            self.assertEqual(conversations, expected.conversations)
+            self.assertEqual(stream.pagination, expected.pagination)
+
+            data = [item async for item in (await c.stream_conversations()).iter_json()]
+            self.assertEqual(data, [conversation_json(i) for i in range(5)])
+            self.assertEqual(await (await c.stream_conversations()).read_json(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
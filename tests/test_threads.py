@@ -0,0 +1,111 @@
+import json
+import unittest
+from unittest import mock
+
+from getcontext.generated.models import Message, Rating, Thread
+from getcontext.threads import AsyncThreadTracker, ThreadTracker
+
+from tests.stubs import AsyncStubTransport, StubTransport, async_client, client, reply
+
+
+def _handler(request):
+    if request.method == "PATCH":
+        return reply(404 if request.url.endswith("/unknown") else 200)
+    return reply(201, {"status": "created", "data": {"id": "thread-1"}})
+
+
+def _thread(*ratings, thread_id="thread-1"):
+    messages = [Message(role="user", message="Question")]
+    messages += [Message(role="assistant", message="Answer {}".format(i), rating=r) for i, r in enumerate(ratings)]
+    return Thread(id=thread_id, messages=messages)
+
+
+class ThreadTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.transport = StubTransport(_handler)
+        self.client = client(self.transport)
+        self.addCleanup(self.client.close)
+        self.tracker = ThreadTracker(self.client.log)
+
+    def test_unchanged_thread_is_not_resent(self):
+        first = self.tracker.log(_thread(None))
+        second = self.tracker.log(_thread(None))
+
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertIs(second, first)
+        self.assertEqual(first.data.id, "thread-1")
+        self.assertEqual((self.tracker.sent, self.tracker.skipped), (1, 1))
+
+    def test_new_messages_resend_the_whole_thread(self):
+        self.tracker.log(_thread(None))
+        self.tracker.log(_thread(None, None))
+
+        self.assertEqual([request.method for request in self.transport.requests], ["POST", "POST"])
+        self.assertEqual(len(self.transport.bodies()[1]["conversation"]["messages"]), 3)
+        self.assertEqual(self.tracker.sent, 2)
+
+    def test_rating_change_is_patched(self):
+        self.tracker.log(_thread(None, None))
+        self.tracker.log(_thread(Rating.POSITIVE, None))
+
+        patch = self.transport.requests[1]
+        self.assertEqual(patch.method, "PATCH")
+        self.assertTrue(patch.url.endswith("/api/v1/log/conversation/thread/thread-1"))
+        self.assertEqual(json.loads(patch.content), [{}, {"rating": 1}, {}])
+        self.assertEqual(self.tracker.patched, 1)
+
+        self.tracker.log(_thread(Rating.POSITIVE, None))
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_log_call_keywords_are_not_patched(self):
+        kwargs = {"tenant_id": "tenant", "sample_key": "key", "spool": False, "headers": {"X-Test": "1"}}
+        self.tracker.log(_thread(None), **kwargs)
+        with mock.patch.object(
+            self.client.log, "update_conversation_thread", wraps=self.client.log.update_conversation_thread
+        ) as update:
+            self.tracker.log(_thread(Rating.POSITIVE), **kwargs)
+        self.assertEqual(set(update.call_args.kwargs), {"id", "body", "headers"})
+        self.assertIn("tenant_id=tenant", self.transport.requests[0].url)
+        self.assertEqual(self.transport.requests[1].headers["X-Test"], "1")
+
+    def test_unknown_thread_is_resent_after_patch_not_found(self):
+        self.tracker.log(_thread(None, thread_id="unknown"))
+        self.tracker.log(_thread(Rating.NEGATIVE, thread_id="unknown"))
+
+        self.assertEqual([request.method for request in self.transport.requests], ["POST", "PATCH", "POST"])
+
+    def test_eviction_and_forget(self):
+        tracker = ThreadTracker(self.client.log, max_threads=1)
+        tracker.log(_thread(None, thread_id="a"))
+        tracker.log(_thread(None, thread_id="b"))
+        tracker.log(_thread(None, thread_id="a"))
+        self.assertEqual((len(tracker), tracker.sent), (1, 3))
+
+        tracker.forget("a")
+        tracker.log(_thread(None, thread_id="a"))
+        self.assertEqual(tracker.sent, 4)
+
+    def test_client_tracker(self):
+        tracker = self.client.thread_tracker(max_threads=10)
+        self.assertIsInstance(tracker, ThreadTracker)
+        self.assertIs(self.client.thread_tracker(), tracker)
+        with self.assertRaises(ValueError):
+            self.client.thread_tracker(max_threads=20)
+
+
+class AsyncThreadTrackerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_rating_change_is_patched(self):
+        transport = AsyncStubTransport(_handler)
+        async with async_client(transport) as c:
+            tracker = c.thread_tracker()
+            self.assertIsInstance(tracker, AsyncThreadTracker)
+            await tracker.log(_thread(None))
+            await tracker.log(_thread(None))
+            await tracker.log(_thread(Rating.POSITIVE))
+
+        self.assertEqual([request.method for request in transport.requests], ["POST", "PATCH"])
+        self.assertEqual((tracker.sent, tracker.skipped, tracker.patched), (1, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()